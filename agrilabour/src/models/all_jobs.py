@@ -1,8 +1,11 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, BigInteger, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, BigInteger, Text, Index
 from src.models.base import Base
 
 class AllJobs(Base):
     __tablename__ = "all_jobs"
+    __table_args__ = (
+        Index("ix_all_jobs_publication_date_url", "publication_date", "url"),
+    )
 
     id = Column(Integer, primary_key=True)
     publication_date = Column(DateTime, nullable=False)
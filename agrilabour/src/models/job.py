@@ -16,6 +16,7 @@ class Job(Base):
     url = Column(String(255), unique=True, nullable=False)
     created_at = Column(DateTime, nullable=False)
     filtered = Column(String(255))
+    filtered_at = Column(DateTime, index=True)
 
     def __repr__(self):
         return (
@@ -1,43 +1,62 @@
-import os, sys, logging, re
-from bs4 import BeautifulSoup
+import logging
 from src.models.job import Job
+from src.parser.html_tree import parse_html, xpath, has_class, first, get_text, scan_metadata
 from datetime import date
 
 
+# Sélecteurs compilés une fois pour le site
+HEADING = xpath(f"(//div[{has_class('job-detail-top')}])[1]//h2")
+DESCRIPTION = xpath(f"//div[{has_class('job-detail-bottom')}]")
+LIST_ITEMS = xpath("//li")
+# Marqueurs cherchés dans le texte des <li>
+SALARY_MARKER = "per hour"
+DURATION_MARKER = "Duration:"
+START_MARKER = "Start:"
+ITEM_MARKERS = (SALARY_MARKER, DURATION_MARKER, START_MARKER)
 
 
 def html_job_parser(html_content, url):
-    logger = logging.getLogger("HtmlParserUrl")    
-    soup = BeautifulSoup(str(html_content), 'html.parser')
+    logger = logging.getLogger("HtmlParserUrl")
+    tree = parse_html(html_content)
     # title description state suburb job_type salary duration start_date
-
-    title = find_title(soup, logger)
-    description = find_description(soup, logger)
-    state = find_state(soup, logger)
-    suburb = find_suburb(soup, logger)
-    job_type = find_job_type(soup, logger)
-    salary = find_salary(soup, logger)
-    duration = find_duration(soup, logger)
-    start_date = find_start_date(soup, logger)
     job = Job(
-        title=title,
-        description=description,
-        state=state,
-        suburb=suburb,
-        job_type=job_type,
-        salary=salary,
-        duration=duration,
-        start_date=start_date,
+        **extract_fields(tree, logger),
         created_at=date.today().isoformat(),
         url=url
     )
     return job
 
 
+def extract_fields(tree, logger):
+    """ Every job field from one parsed document; the heading and <li> list are read once """
+    heading = find_heading(tree, logger)
+    items = scan_metadata(LIST_ITEMS(tree), markers=ITEM_MARKERS)
+    return {
+        "title": find_title(heading, logger),
+        "description": find_description(tree, logger),
+        "state": find_state(heading, logger),
+        "suburb": find_suburb(heading, logger),
+        "job_type": find_job_type(tree, logger),
+        "salary": find_salary(items, logger),
+        "duration": find_duration(items, logger),
+        "start_date": find_start_date(items, logger),
+    }
+
+
+def find_heading(tree, logger):
+    """ "Title - Suburb, STATE" heading of the job """
+    try:
+        heading = get_text(first(HEADING(tree))).strip()
+    except Exception as e:
+        logger.warning(f"Error finding heading: {str(e)}")
+        heading = None
+    finally:
+        return heading
+
 
-def find_title(soup, logger):
+def find_title(heading, logger):
     try:
-        title = soup.find("div", class_="job-detail-top").find("h2").get_text().strip().split(" - ")[0].strip()
+        title = heading.split(" - ")[0].strip()
     except Exception as e:
         logger.warning(f"Error finding title: {str(e)}")
         title = None
@@ -45,34 +64,34 @@ def find_title(soup, logger):
         return title
 
 
-def find_description(soup, logger):
+def find_description(tree, logger):
     try:
-        description = soup.find("div", class_="job-detail-bottom").get_text().strip()
+        description = get_text(first(DESCRIPTION(tree))).strip()
     except Exception as e:
         logger.warning(f"Error finding description: {str(e)}")
         description = None
     finally:
         return description
 
-def find_state(soup, logger):
+def find_state(heading, logger):
     try:
-        state = soup.find("div", class_="job-detail-top").find("h2").get_text().strip().split(",")[-1].strip()
+        state = heading.split(",")[-1].strip()
     except Exception as e:
         logger.warning(f"Error finding state: {str(e)}")
         state = None
     finally:
         return state
 
-def find_suburb(soup, logger):
+def find_suburb(heading, logger):
     try:
-        suburb = soup.find("div", class_="job-detail-top").find("h2").get_text().strip().split(" - ")[1].split(",")[0].strip()
+        suburb = heading.split(" - ")[1].split(",")[0].strip()
     except Exception as e:
         logger.warning(f"Error finding suburb: {str(e)}")
         suburb = None
     finally:
-        return suburb         
+        return suburb
 
-def find_job_type(soup, logger):
+def find_job_type(tree, logger):
     try:
         job_type = "casual"
     except Exception as e:
@@ -81,29 +100,29 @@ def find_job_type(soup, logger):
     finally:
         return job_type
 
-def find_salary(soup, logger):
+def find_salary(items, logger):
     try:
-        salary = soup.find("li", string=lambda text: text and "per hour" in text).get_text().strip()
+        salary = items[SALARY_MARKER].strip()
     except Exception as e:
         logger.warning(f"Error finding salary: {str(e)}")
         salary = None
     finally:
         return salary
 
-def find_duration(soup, logger):
+def find_duration(items, logger):
     try:
-        duration = soup.find("li", string=lambda text: text and "Duration:" in text).get_text().strip().split(":")[-1].strip()
+        duration = items[DURATION_MARKER].strip().split(":")[-1].strip()
     except Exception as e:
         logger.warning(f"Error finding duration: {str(e)}")
         duration = None
     finally:
         return duration
 
-def find_start_date(soup, logger):
+def find_start_date(items, logger):
     try:
-        title = soup.find("li", string=lambda text: text and "Start:" in text).get_text().strip().split(":")[-1].strip()
+        title = items[START_MARKER].strip().split(":")[-1].strip()
     except Exception as e:
         logger.warning(f"Error finding title: {str(e)}")
         title = None
     finally:
-        return title
\ No newline at end of file
+        return title
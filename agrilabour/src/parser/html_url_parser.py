@@ -1,33 +1,47 @@
-import os, sys, logging, re
-from bs4 import BeautifulSoup
+import logging
+from src.parser.html_tree import parse_html, xpath, has_class
+from src.parser.urls import normalize_url, unique_urls
+
+# Version du résultat de parse_listing, mémoïsé dans le cache HTTP :
+# à incrémenter à chaque changement de ce qu'il renvoie
+PARSE_VERSION = 1
+
+# Liens des offres sur une page de listing, compilé une fois
+JOB_LINKS = xpath(f"//a[{has_class('name')}]/@href")
+BASE_URL = "https://www.agrilabour.com.au"
+
+# Pagination : lien "suivant" (rel=next, WordPress .next, PagedList) et bloc de pagination
+NEXT_PAGE = xpath(
+    f"//a[@rel='next'] | //link[@rel='next'] | //a[{has_class('next')}]"
+    f" | //li[{has_class('PagedList-skipToNext')}]//a"
+)
+PAGINATION = xpath(
+    f"//*[{has_class('pagination')} or {has_class('page-numbers')}"
+    f" or {has_class('pagination-container')}]"
+)
+
 
 def html_url_parser(html_content):
+    return parse_listing(html_content)[0]
+
 
+def parse_listing(html_content):
+    """
+    Job URLs of a listing page and whether another page follows:
+    True/False when the page has pagination markup, None when it cannot tell.
+    """
     logger = logging.getLogger("HtmlParserUrl")
     try:
-        soup = BeautifulSoup(str(html_content), 'html.parser')
-        list_a = soup.find_all("a", class_="name")
-        urls = list()
-        for a in list_a:
-            url = a.get('href')
-            if is_valid_url(url):
-                urls.append({"url": url})
-
+        tree = parse_html(html_content)
+        hrefs = JOB_LINKS(tree)
+        urls = unique_urls(normalize_url(href, base=BASE_URL) for href in hrefs)
+        if NEXT_PAGE(tree):
+            has_next = True
+        elif PAGINATION(tree):
+            has_next = False
+        else:
+            has_next = None
     except Exception as e:
         logger.warning(str(e))
-        urls = []
-    return urls
-
-def is_valid_url(url):
-    """ regex check to valid if url is a real url """
-    # Expression régulière pour vérifier les URL
-    try:
-        regex = re.compile(
-            r'^(https?://)?'  # supporte http et https
-            r'([a-zA-Z0-9-]+(\.[a-zA-Z0-9-]+)+)'  # domaine
-            r'(:\d+)?'  # port (optionnel)
-            r'(/.*)?$'  # chemin (optionnel)
-        )
-        return re.match(regex, url) is not None
-    except Exception as e:
-        return False
+        urls, has_next = [], None
+    return urls, has_next
@@ -1,15 +1,19 @@
 from src.webdriver.fetch_cloudscraper import Driver
+from src.webdriver.fetch_pool import FetchPool
 from src.models.base import SessionLocal
-from src.parser.html_url_parser import html_url_parser
+from src.parser.html_url_parser import parse_listing
 from src.parser.html_job_parser import html_job_parser
 from src.models.job import Job
 from src.services.google_sheets_service import GoogleSheetsService
-from src.services.job_to_all_jobs import job_to_all_jobs
+from src.services.all_jobs_sync import sync_all_jobs
 from src.services.openai_service import OpenAIService
+from src.services.job_classifier import JobClassifier, job_chunks
+from src.services.verdict_cache import VerdictCache
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session
-from src.models.all_jobs import AllJobs
 
+from datetime import datetime
 import os, dotenv
 
 dotenv.load_dotenv()
@@ -41,52 +45,106 @@ class Scraper:
 
         self.save_in_sheets_all()
 
+        Driver.report()
+        Driver.close_all()
+
     def find_urls(self):
         main_page_url = (
             lambda i: f"https://www.agrilabour.com.au/candidates/current-positions{'/page/' + str(i) if i != 1 else ''}/?status=casual&search=1"
         )
+        # Pagination pilotée par la page : lien "suivant", page vide ou déjà connue
+        max_pages = int(os.getenv("LISTING_MAX_PAGES", "20"))
         list_product_urls = []
-        for i in range(1, 4):
+        seen_urls = set()
+        db = SessionLocal()
+        driver = Driver()
+        for i in range(1, max_pages + 1):
             print(f"Scraping page {i} of the main page")
             print(f"URL: {main_page_url(i)}")
             try:
-                driver = Driver()
-                str_data = driver.page(main_page_url(i))
-                list_product_urls_page = html_url_parser(str_data)
+                # Page inchangée depuis le dernier run : ni téléchargée ni reparsée
+                parsed = driver.page_parsed(main_page_url(i), parse_listing)
+                if parsed is None:
+                    print(f"Error scraping page {i}: no response")
+                    continue
+                list_product_urls_page, has_next = parsed
+                # Certains sites renvoient la dernière page au-delà de la fin
+                repeated = all(data_url["url"] in seen_urls for data_url in list_product_urls_page)
+                seen_urls.update(data_url["url"] for data_url in list_product_urls_page)
                 list_product_urls.extend(list_product_urls_page)
                 print(f"Found {len(list_product_urls_page)} job URLs on page {i}")
             except Exception as e:
                 print(f"Error scraping page {i}: {e}")
                 continue
+            if not list_product_urls_page:
+                print(f"Page {i} has no jobs, stopping")
+                break
+            if repeated:
+                print(f"Page {i} repeats jobs from earlier pages, stopping")
+                break
+            if not self.filter_new_urls(db, list_product_urls_page):
+                print(f"Page {i} only has jobs already in the database, stopping")
+                break
+            if has_next is False:
+                print(f"Page {i} is the last page")
+                break
+        else:
+            print(f"Stopped after LISTING_MAX_PAGES={max_pages} pages")
+        db.close()
         print(f"Total job URLs found: {len(list_product_urls)}")
         return list_product_urls
 
-    def scrap_jobs_and_save_in_db(self, list_product_urls):
-        db = SessionLocal()
+    def filter_new_urls(self, db: Session, list_product_urls, chunk_size=500):
+        """
+        Drop duplicate URLs and URLs already stored in the database.
+        Existing URLs are looked up with one `url IN (...)` query per chunk.
+        """
+        unique_urls = {}
         for data_url in list_product_urls:
-            try:
-                print(f"Scraping job URL: {data_url['url']}")
-                driver = Driver()
-                exists = db.query(Job).filter_by(url=data_url["url"]).first()
-
-                if exists:
-                    print(
-                        f"Job {data_url['url']} already exists in the database, skipping."
-                    )
-                    continue
+            unique_urls.setdefault(data_url["url"], data_url)
+
+        urls = list(unique_urls)
+        known_urls = set()
+        for i in range(0, len(urls), chunk_size):
+            chunk = urls[i : i + chunk_size]
+            known_urls.update(
+                url for (url,) in db.query(Job.url).filter(Job.url.in_(chunk))
+            )
+
+        print(
+            f"{len(known_urls)} of {len(urls)} job URLs already exist in the database, skipping."
+        )
+        return [data_url for url, data_url in unique_urls.items() if url not in known_urls]
 
-                str_data = driver.page(data_url["url"])
-                job = html_job_parser(str_data, data_url["url"])
-                print(job)
-                if job:
+    def scrap_jobs_and_save_in_db(self, list_product_urls):
+        db = SessionLocal()
+        candidates = self.filter_new_urls(db, list_product_urls)
 
-                    exists = db.query(Job).filter_by(url=job.url).first()
+        # Pages are fetched and parsed by the pool; only this thread touches the session
+        pool = FetchPool()
+        for data_url, job, error in pool.imap(self.fetch_job, candidates):
+            if error:
+                print(f"Error scraping job URL {data_url['url']}: {error}")
+                continue
+            print(job)
+            if job:
+                try:
                     db.add(job)
                     db.commit()
-
                     print(f"Job {job.url} added to the database.")
-            except Exception as e:
-                print(f"Error scraping job URL {data_url['url']}: {e}")
+                except Exception as e:
+                    db.rollback()
+                    print(f"Error saving job URL {data_url['url']}: {e}")
+        db.close()
+
+    def fetch_job(self, data_url):
+        print(f"Scraping job URL: {data_url['url']}")
+        driver = Driver()
+        str_data = driver.page(data_url["url"])
+        if str_data is None:
+            # Pas de ligne vide en base : l'URL sera retentée au prochain run
+            raise ValueError(f"No data for job URL {data_url['url']}")
+        return html_job_parser(str_data, data_url["url"])
 
     def save_in_sheets(self):
         db = SessionLocal()
@@ -96,18 +154,17 @@ class Scraper:
         service = GoogleSheetsService(spreadsheet_id, credentials_path, "agrilabour")
         service.upload_jobs(db)
 
-    def save_in_db_all(self):
+    def save_in_db_all(self, full=None):
+        """
+        Sync new and newly filtered jobs into the AllJobs table.
+        Set ALL_JOBS_FULL_SYNC=1 (or pass full=True) to resync every job.
+        """
+        if full is None:
+            full = os.getenv("ALL_JOBS_FULL_SYNC", "0") == "1"
         db: Session = SessionLocal()
-        jobs = db.query(Job).all()
-        for job in jobs:
-            all_job_data = job_to_all_jobs(job)
-            existing = db.query(AllJobs).filter_by(url=all_job_data.url).first()
-            if existing:
-                db.delete(existing)
-                db.commit()
-            db.add(all_job_data)
-        db.commit()
-        print("All jobs saved or updated in AllJobs table.")
+        written = sync_all_jobs(db, full=full)
+        db.close()
+        print(f"All jobs saved or updated in AllJobs table ({written} rows written).")
 
     def save_in_sheets_all(self):
         db = SessionLocal()
@@ -119,14 +176,30 @@ class Scraper:
 
     def filter_jobs(self):
         db = SessionLocal()
-        jobs = db.query(Job).all()
+        query = db.query(Job).filter(
+            or_(Job.filtered.is_(None), Job.filtered.notin_(["yes", "no", "maybe"]))
+        )
+        print(f"{query.count()} jobs to filter.")
         api_key = os.getenv("OPENAI_API_KEY")
         service = OpenAIService(api_key)
-        for job in jobs:
-            if job.filtered in ["yes", "no", "maybe"]:
-                print(f"Job {job.url} already filtered, skipping.")
-                continue
-            filtered = service.test_job(job)
-            job.filtered = filtered
-            db.add(job)
-            db.commit()
+        cache = VerdictCache(db, service)
+        cache.evict()
+        classifier = JobClassifier(service)
+        verdicts = []
+        # Les offres sont chargées par tranches plutôt que toutes en mémoire
+        for job_id, filtered in classifier.classify_chunks(job_chunks(query), cache=cache):
+            verdicts.append(
+                {"id": job_id, "filtered": filtered, "filtered_at": datetime.utcnow()}
+            )
+            if len(verdicts) >= 50:
+                self.save_verdicts(db, verdicts)
+                verdicts = []
+        self.save_verdicts(db, verdicts)
+        db.close()
+
+    def save_verdicts(self, db: Session, verdicts):
+        """ Write a batch of classifications back with one bulk UPDATE by primary key """
+        if not verdicts:
+            return
+        db.execute(update(Job), verdicts)
+        db.commit()
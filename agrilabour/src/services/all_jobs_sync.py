@@ -0,0 +1,101 @@
+from datetime import datetime
+from sqlalchemy import or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, defer
+from src.models.all_jobs import AllJobs
+from src.models.job import Job
+from src.models.sync_state import AllJobsSyncState
+from src.services.job_to_all_jobs import job_to_all_jobs_values
+
+# Columns refreshed when a row with the same url already exists
+UPDATABLE_COLUMNS = [
+    "publication_date",
+    "job_title",
+    "state",
+    "city",
+    "income",
+    "duration",
+    "filtered",
+]
+
+
+def upsert_all_jobs(db: Session, rows: list, chunk_size: int = 500) -> int:
+    """
+    Insert or update AllJobs rows keyed on `url`.
+
+    Each chunk is sent as one `INSERT ... ON CONFLICT (url) DO UPDATE` statement
+    whose update only fires when at least one column actually changed.
+    The caller owns the transaction and commits.
+
+    Args:
+        db (Session): The database session.
+        rows (list): AllJobs column values, as built by `job_to_all_jobs_values`.
+        chunk_size (int): Number of rows per statement.
+
+    Returns:
+        int: The number of rows inserted or updated.
+    """
+    # A statement cannot touch the same url twice: keep the last values per url
+    rows = list({row["url"]: row for row in rows}.values())
+
+    written = 0
+    for i in range(0, len(rows), chunk_size):
+        stmt = insert(AllJobs).values(rows[i : i + chunk_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AllJobs.url],
+            set_={column: stmt.excluded[column] for column in UPDATABLE_COLUMNS},
+            where=or_(
+                *[
+                    getattr(AllJobs, column).is_distinct_from(stmt.excluded[column])
+                    for column in UPDATABLE_COLUMNS
+                ]
+            ),
+        )
+        written += db.execute(stmt).rowcount
+    return written
+
+
+def sync_all_jobs(db: Session, full: bool = False) -> int:
+    """
+    Copy new and newly filtered Job rows into AllJobs.
+
+    Only rows past the stored watermark (`id` above the last synced id, or
+    `filtered_at` after the last synced classification) are read, so the cost
+    follows the amount of new work. The upsert and the new watermark are
+    committed together.
+
+    Args:
+        db (Session): The database session.
+        full (bool): Ignore the watermark and resync the whole Job table.
+
+    Returns:
+        int: The number of AllJobs rows inserted or updated.
+    """
+    source = Job.__tablename__
+    state = db.get(AllJobsSyncState, source)
+    if state is None:
+        state = AllJobsSyncState(source=source, last_job_id=0)
+        db.add(state)
+
+    query = db.query(Job).options(defer(Job.description))
+    if not full:
+        conditions = [Job.id > state.last_job_id]
+        if state.last_filtered_at is not None:
+            conditions.append(Job.filtered_at > state.last_filtered_at)
+        else:
+            # No classification synced yet: any verdict is new
+            conditions.append(Job.filtered_at.isnot(None))
+        query = query.filter(or_(*conditions))
+    jobs = query.order_by(Job.id).all()
+
+    written = upsert_all_jobs(db, [job_to_all_jobs_values(job) for job in jobs])
+
+    for job in jobs:
+        state.last_job_id = max(state.last_job_id or 0, job.id)
+        if job.filtered_at and (
+            state.last_filtered_at is None or job.filtered_at > state.last_filtered_at
+        ):
+            state.last_filtered_at = job.filtered_at
+    state.synced_at = datetime.utcnow()
+    db.commit()
+    return written
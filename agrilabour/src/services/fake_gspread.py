@@ -0,0 +1,118 @@
+import json
+import gspread
+from gspread.utils import a1_to_rowcol
+
+
+class FakeWorksheet:
+    """
+    In-memory stand-in for gspread.Worksheet.
+
+    Implements the calls used by GoogleSheetsService and records every request
+    (name and JSON payload size) in `calls`, so sheet syncs can be exercised
+    offline and their API usage inspected.
+    """
+
+    def __init__(self, spreadsheet, title, sheet_id, rows=1000, cols=26):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self.row_count = int(rows)
+        self.col_count = int(cols)
+        self.values = []
+        self.calls = []
+
+    def _record(self, name, payload=None):
+        self.calls.append((name, len(json.dumps(payload, default=str)) if payload else 0))
+
+    def _write(self, range_name, values):
+        row, col = a1_to_rowcol(range_name.split(":")[0])
+        for offset, row_values in enumerate(values):
+            index = row - 1 + offset
+            while len(self.values) <= index:
+                self.values.append([])
+            current = self.values[index]
+            while len(current) < col - 1 + len(row_values):
+                current.append("")
+            current[col - 1 : col - 1 + len(row_values)] = list(row_values)
+        self.row_count = max(self.row_count, len(self.values))
+
+    def get_all_values(self, **kwargs):
+        self._record("get_all_values")
+        width = max((len(row) for row in self.values), default=0)
+        return [list(row) + [""] * (width - len(row)) for row in self.values]
+
+    def clear(self):
+        self._record("clear")
+        self.values = []
+
+    def update(self, values=None, range_name=None, **kwargs):
+        self._record("update", values)
+        self._write(range_name or "A1", values)
+
+    def batch_update(self, data, **kwargs):
+        self._record("batch_update", data)
+        for value_range in data:
+            self._write(value_range["range"], value_range["values"])
+
+    def append_rows(self, values, **kwargs):
+        self._record("append_rows", values)
+        # Comme l'API : ajoute après la dernière ligne non vide
+        last = len(self.values)
+        while last and not any(cell not in ("", None) for cell in self.values[last - 1]):
+            last -= 1
+        self.values = self.values[:last]
+        self._write(f"A{last + 1}", values)
+
+
+class FakeSpreadsheet:
+    def __init__(self, spreadsheet_id):
+        self.id = spreadsheet_id
+        self.worksheets = {}
+
+    def worksheet(self, title):
+        if title not in self.worksheets:
+            raise gspread.WorksheetNotFound(title)
+        return self.worksheets[title]
+
+    def add_worksheet(self, title, rows=1000, cols=26):
+        sheet = FakeWorksheet(self, title, len(self.worksheets), rows, cols)
+        self.worksheets[title] = sheet
+        return sheet
+
+    def batch_update(self, body):
+        sheets = {sheet.id: sheet for sheet in self.worksheets.values()}
+        for request in body.get("requests", []):
+            if "deleteDimension" in request:
+                grid = request["deleteDimension"]["range"]
+                sheet = sheets[grid["sheetId"]]
+                sheet._record("delete_rows", request)
+                del sheet.values[grid["startIndex"] : grid["endIndex"]]
+            elif "insertDimension" in request:
+                grid = request["insertDimension"]["range"]
+                sheet = sheets[grid["sheetId"]]
+                sheet._record("insert_rows", request)
+                while len(sheet.values) < grid["startIndex"]:
+                    sheet.values.append([])
+                sheet.values[grid["startIndex"] : grid["startIndex"]] = [
+                    [] for _ in range(grid["endIndex"] - grid["startIndex"])
+                ]
+                sheet.row_count += grid["endIndex"] - grid["startIndex"]
+            else:
+                raise NotImplementedError(f"Unsupported request: {list(request)}")
+        return {"replies": []}
+
+
+class FakeClient:
+    """ Replacement for the authorized gspread client (GOOGLE_SHEETS_BACKEND=fake) """
+
+    def __init__(self):
+        self.spreadsheets = {}
+
+    def open_by_key(self, key):
+        if key not in self.spreadsheets:
+            self.spreadsheets[key] = FakeSpreadsheet(key)
+        return self.spreadsheets[key]
+
+
+# Shared by every GoogleSheetsService of the process, like the real spreadsheet
+default_client = FakeClient()
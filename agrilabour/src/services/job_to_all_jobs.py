@@ -11,13 +11,26 @@ def job_to_all_jobs(job: Job):
     Returns:
         AllJobs: The converted AllJobs instance.
     """
-    return AllJobs(
-        publication_date=job.created_at,
-        job_title=job.title,
-        state=job.state,
-        city=job.suburb,
-        income=job.salary,
-        duration=job.duration,
-        url=job.url,
-        filtered=job.filtered
-    )
\ No newline at end of file
+    return AllJobs(**job_to_all_jobs_values(job))
+
+
+def job_to_all_jobs_values(job: Job) -> dict:
+    """
+    Convert a Job instance to the column values of its AllJobs row.
+    
+    Args:
+        job (Job): The Job instance to convert.
+    
+    Returns:
+        dict: AllJobs column values keyed by column name.
+    """
+    return {
+        "publication_date": job.created_at,
+        "job_title": job.title,
+        "state": job.state,
+        "city": job.suburb,
+        "income": job.salary,
+        "duration": job.duration,
+        "url": job.url,
+        "filtered": job.filtered,
+    }
@@ -3,9 +3,12 @@ from sqlalchemy.orm import Session
 from sqlalchemy.inspection import inspect
 from src.models.job import Job
 from src.models.all_jobs import AllJobs
+from src.services.job_rules import classify_job
 import datetime
+import json
+import os
 
-prompt = """
+prompt_rules = """
 You are an expert in job screening for travelers. Your goal is to evaluate whether a job offer in Australia is suitable for a backpacker on a Working Holiday Visa, looking for temporary work.
 
 SALARY/HOURLY RATE RULES:
@@ -23,7 +26,9 @@ EVALUATION PROCESS:
 2. Check for exclusion keywords - if found, respond "no"
 3. Check for required keywords - if found, respond "yes"
 4. For remaining jobs, evaluate if suitable for backpacker profile (manual, low-skilled, temporary work in farming, hospitality, cleaning, warehouse, construction, etc.)
+"""
 
+prompt = prompt_rules + """
 Analyze the job offer below and reply with only one word, chosen from the following:
 
 yes – the job clearly fits a backpacker profile
@@ -36,10 +41,49 @@ Here is the job offer:
 
 """
 
+batch_instructions = """
+You will receive several job offers, each one introduced by its id. Evaluate each job offer independently with the rules above.
+
+Reply with a JSON object of the form {"verdicts": [{"id": <job offer id>, "verdict": "yes" | "no" | "maybe"}]} with exactly one entry per job offer, using the same meaning for yes, no and maybe:
+
+yes – the job clearly fits a backpacker profile
+no – the job is not suitable for a backpacker
+maybe – the job might be suitable, but some important information is missing or unclear
+
+Here are the job offers:
+
+"""
+
+
+# Version des règles et du prompt, partie de la clé du cache de verdicts :
+# à incrémenter quand leur sens change pour ne plus réutiliser les anciens verdicts
+PROMPT_VERSION = 1
+
+# Modèle historique du scraper ; le cache de verdicts, clé incluant le modèle,
+# n'est partagé entre scrapers que si OPENAI_MODEL est le même partout
+DEFAULT_MODEL = "gpt-4o"
+
 
 class OpenAIService:
-    def __init__(self, api_key: str):
-        self.client = OpenAI(api_key=api_key)
+    def __init__(self, api_key: str, base_url: str = None, model: str = None):
+        self.model = model or os.getenv("OPENAI_MODEL", DEFAULT_MODEL)
+        # OPENAI_BASE_URL permet de viser un serveur local (stub) pour les tests
+        self.client = OpenAI(api_key=api_key, base_url=base_url or os.getenv("OPENAI_BASE_URL"))
+
+    def job_salary(self, job: Job):
+        return job.salary
+
+    def job_content(self, job: Job) -> str:
+        return f"Title: {job.title}\n\nSalary: {self.job_salary(job) or 'N/A'}\n\nDescription: {job.description or ''}"
+
+    def estimate_tokens(self, jobs) -> int:
+        """ Rough token count of a request (about 4 characters per token) """
+        characters = len(prompt) + sum(len(self.job_content(job)) for job in jobs)
+        return characters // 4 + 16 * len(jobs)
+
+    def prefilter(self, job: Job):
+        """ Verdict from the local rules, or None when the model has to decide """
+        return classify_job(job.title, self.job_salary(job), job.description)
 
     def test_job(self, job: Job):
         # This method is a placeholder for testing job data with OpenAI
@@ -49,13 +93,17 @@ class OpenAIService:
             description = job.description or ""
             if not description:
                 return "no"
+            local = self.prefilter(job)
+            if local:
+                print(f"Job {job.url} result: {local} (local rules)")
+                return local
             response = self.client.chat.completions.create(
-                model="gpt-4o",
+                model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a helpful assistant."},
                     {
                         "role": "user",
-                        "content": f"{prompt}\n\n Title: {job.title}\n\n Salary: {job.salary if job.salary else 'N/A'}\n\nDescription: {description}",
+                        "content": f"{prompt}\n\n {self.job_content(job)}",
                     },
                 ],
             )
@@ -70,3 +118,39 @@ class OpenAIService:
         except Exception as e:
             print(f"Error processing job {job.url}: {e}")
             return "error"
+
+    def test_jobs(self, jobs) -> dict:
+        """
+        Classify several jobs with a single request.
+        Returns {job.id: verdict}; jobs missing from the answer are left out
+        so that the caller can classify them one by one.
+        """
+        offers = "\n\n".join(
+            f"### Job offer id={job.id}\n{self.job_content(job)}" for job in jobs
+        )
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                response_format={"type": "json_object"},
+                messages=[
+                    {"role": "system", "content": "You are a helpful assistant."},
+                    {
+                        "role": "user",
+                        "content": f"{prompt_rules}{batch_instructions}{offers}",
+                    },
+                ],
+            )
+            answer = json.loads(response.choices[0].message.content)
+            ids = {job.id for job in jobs}
+            verdicts = {}
+            for item in answer.get("verdicts", []):
+                job_id, verdict = item.get("id"), item.get("verdict")
+                if isinstance(job_id, str) and job_id.isdigit():
+                    job_id = int(job_id)
+                if job_id in ids and verdict in ["yes", "no", "maybe"]:
+                    verdicts[job_id] = verdict
+            print(f"Batch of {len(jobs)} jobs: {len(verdicts)} verdicts")
+            return verdicts
+        except Exception as e:
+            print(f"Error processing batch of {len(jobs)} jobs: {e}")
+            return {}
@@ -0,0 +1,62 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from src.services.rate_limiter import RateLimiter
+
+
+class FetchPool:
+    """
+    Bounded worker pool used to fetch and parse job detail pages concurrently.
+
+    Workers only run `fn(item)` (download + parse); results are handed back to
+    the calling thread, which stays the single owner of the SQLAlchemy session.
+    """
+
+    logger = logging.getLogger("webdriver")
+
+    def __init__(self, workers=None, max_per_host=None, rate=None):
+        self.workers = workers or int(os.getenv("SCRAPER_WORKERS", "4"))
+        self.max_per_host = max_per_host or int(os.getenv("SCRAPER_MAX_PER_HOST", "4"))
+        rate = rate if rate is not None else float(os.getenv("SCRAPER_RATE_LIMIT", "4"))
+        self.rate_limiter = RateLimiter(rate) if rate > 0 else None
+        self._host_semaphores = {}
+        self._lock = threading.Lock()
+
+    def _host_semaphore(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_semaphores[host]
+
+    def _call(self, fn, item, url):
+        with self._host_semaphore(url):
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            return fn(item)
+
+    def imap(self, fn, items, key=lambda item: item["url"]):
+        """
+        Run `fn` on every item and yield `(item, result, error)` tuples in
+        completion order. Exceptions raised by `fn` are returned, not raised.
+        """
+        items = list(items)
+        if not items:
+            return
+        self.logger.debug(
+            f"Fetching {len(items)} pages with {self.workers} workers "
+            f"(max {self.max_per_host} per host)"
+        )
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self._call, fn, item, key(item)): item for item in items
+            }
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
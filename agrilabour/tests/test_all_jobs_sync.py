@@ -0,0 +1,93 @@
+import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.models.job import Job
+from src.models.sync_state import AllJobsSyncState
+from src.services import all_jobs_sync
+from src.services.all_jobs_sync import sync_all_jobs, upsert_all_jobs
+
+
+class RecordingSession:
+    """ Collects the statements instead of running them (ON CONFLICT is PostgreSQL only) """
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(rowcount=1)
+
+
+def row(url, title="Picker"):
+    return {
+        "publication_date": None,
+        "job_title": title,
+        "state": "QLD",
+        "city": "Bowen",
+        "income": None,
+        "duration": None,
+        "url": url,
+        "filtered": None,
+    }
+
+
+def test_upsert_all_jobs_sends_one_statement_per_chunk():
+    db = RecordingSession()
+
+    written = upsert_all_jobs(db, [row("u1", "old"), row("u2"), row("u1", "new"), row("u3")], chunk_size=2)
+
+    compiled = [stmt.compile(dialect=postgresql.dialect()) for stmt in db.statements]
+    assert len(compiled) == 2
+    assert written == 2  # somme des rowcount
+    # Doublon u1 : seule la dernière valeur est gardée, à sa première position
+    urls = [[value for key, value in c.params.items() if key.startswith("url")] for c in compiled]
+    assert urls == [["u1", "u2"], ["u3"]]
+    assert "new" in compiled[0].params.values() and "old" not in compiled[0].params.values()
+
+    sql = str(compiled[0])
+    assert "ON CONFLICT (url) DO UPDATE SET" in sql
+    for column in all_jobs_sync.UPDATABLE_COLUMNS:
+        assert f"{column} = excluded.{column}" in sql
+        assert f"IS DISTINCT FROM excluded.{column}" in sql
+
+
+def test_upsert_all_jobs_without_rows_sends_nothing():
+    db = RecordingSession()
+    assert upsert_all_jobs(db, []) == 0
+    assert db.statements == []
+
+
+def test_sync_all_jobs_only_reads_rows_past_the_watermark(monkeypatch):
+    upserted = []
+    monkeypatch.setattr(
+        all_jobs_sync, "upsert_all_jobs", lambda db, rows: upserted.append([r["url"] for r in rows]) or len(rows)
+    )
+    engine = create_engine("sqlite://")
+    Job.__table__.create(engine)
+    AllJobsSyncState.__table__.create(engine)
+    now = datetime.datetime(2024, 5, 1, 8, 0)
+
+    with Session(engine) as db:
+        db.add_all(Job(id=i, url=f"u{i}", title="Picker", created_at=now) for i in (1, 2, 3))
+        db.commit()
+        assert sync_all_jobs(db) == 3
+
+        # Rien de nouveau : aucune ligne relue
+        assert sync_all_jobs(db) == 0
+
+        # Une nouvelle offre et un verdict posé sur une ancienne
+        db.add(Job(id=4, url="u4", title="Picker", created_at=now))
+        db.get(Job, 2).filtered = "yes"
+        db.get(Job, 2).filtered_at = now + datetime.timedelta(hours=1)
+        db.commit()
+        assert sync_all_jobs(db) == 2
+
+        assert sync_all_jobs(db, full=True) == 4
+        state = db.get(AllJobsSyncState, Job.__tablename__)
+        assert (state.last_job_id, state.last_filtered_at) == (4, now + datetime.timedelta(hours=1))
+
+    assert upserted == [["u1", "u2", "u3"], [], ["u2", "u4"], ["u1", "u2", "u3", "u4"]]
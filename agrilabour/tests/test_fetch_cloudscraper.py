@@ -0,0 +1,96 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.webdriver.fetch_cloudscraper import Driver
+
+URL = "https://www.agrilabour.com.au/jobs"
+
+
+class FakeScraper:
+    """ Records the thread of each request and flags requests overlapping a warm-up """
+
+    active = 0
+    warming = 0
+    overlapped = False
+    lock = threading.Lock()
+
+    def __init__(self, template=None, ok=True):
+        self.template = template
+        self.ok = ok
+        self.threads = set()
+        self.adapters = {}
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        # Requête de chauffe : premier appel d'un scraper non cloné
+        warming = self.template is None and not self.threads
+        with FakeScraper.lock:
+            FakeScraper.active += 1
+            FakeScraper.warming += warming
+            if FakeScraper.warming and FakeScraper.active > 1:
+                FakeScraper.overlapped = True
+        time.sleep(0.01)
+        self.threads.add(threading.get_ident())
+        with FakeScraper.lock:
+            FakeScraper.active -= 1
+            FakeScraper.warming -= warming
+        return SimpleNamespace(ok=self.ok, status_code=200 if self.ok else 503)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_scrapers(monkeypatch):
+    created = []
+    first_ok = [False]
+
+    def new_scraper(template=None):
+        scraper = FakeScraper(template, ok=template is not None or first_ok[0])
+        first_ok[0] = True
+        created.append(scraper)
+        return scraper
+
+    monkeypatch.setattr(Driver, "sessions", {})
+    monkeypatch.setattr(Driver, "new_scraper", staticmethod(new_scraper))
+    FakeScraper.overlapped = False
+    return created
+
+
+def test_each_thread_gets_its_own_scraper_cloned_from_the_warm_one(fake_scrapers):
+    threads = [threading.Thread(target=lambda: [Driver.get(URL) for _ in range(3)]) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    failed, warm, *clones = fake_scrapers
+    assert not FakeScraper.overlapped
+    # Premier essai en échec : pas de scraper chaud, le suivant repart de zéro
+    assert failed.template is None and warm.template is None
+    assert all(clone.template is warm for clone in clones)
+    assert len(warm.threads) == 1
+    assert all(len(clone.threads) == 1 for clone in clones)
+    assert len({ident for scraper in fake_scrapers[1:] for ident in scraper.threads}) == 6
+
+    Driver.close_all()
+    assert all(scraper.closed for scraper in fake_scrapers)
+    assert Driver.sessions == {}
+
+
+def test_new_scraper_mounts_sized_pools_and_clones_the_template(monkeypatch):
+    monkeypatch.setattr(Driver, "pool_size", 7)
+    warm = Driver.new_scraper()
+    warm.cookies.set("cf_clearance", "token", domain="www.agrilabour.com.au")
+
+    clone = Driver.new_scraper(warm)
+
+    assert clone.headers["User-Agent"] == warm.headers["User-Agent"]
+    assert clone.cipherSuite == warm.cipherSuite
+    assert clone.cookies.get("cf_clearance") == "token"
+    for prefix in ("https://", "http://"):
+        pool_kw = clone.get_adapter(prefix + "www.agrilabour.com.au").poolmanager.connection_pool_kw
+        assert pool_kw["maxsize"] == 7
@@ -0,0 +1,58 @@
+import threading
+import time
+
+from src.services.rate_limiter import RateLimiter
+from src.webdriver.fetch_pool import FetchPool
+
+
+class Tracker:
+    """ Records the highest number of concurrent calls per host """
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = {}
+        self.max_active = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, item):
+        host = item["url"].split("/")[2].lower()
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.max_active[host] = max(self.max_active.get(host, 0), self.active[host])
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[host] -= 1
+        if item["url"].endswith("/bad"):
+            raise ValueError(item["url"])
+        return item["url"].upper()
+
+
+def test_imap_limits_concurrency_per_host_and_returns_errors():
+    items = [{"url": f"https://a.example/{i}"} for i in range(6)]
+    items += [{"url": f"https://B.example/{i}"} for i in range(6)]
+    items.append({"url": "https://b.example/bad"})
+    tracker = Tracker()
+
+    results = {item["url"]: (result, error) for item, result, error in FetchPool(6, 2, 0).imap(tracker, items)}
+
+    assert len(results) == 13
+    assert results["https://a.example/0"] == ("HTTPS://A.EXAMPLE/0", None)
+    result, error = results["https://b.example/bad"]
+    assert result is None and isinstance(error, ValueError)
+    # Un sémaphore par hôte, sans distinction de casse
+    assert tracker.max_active == {"a.example": 2, "b.example": 2}
+
+
+def test_imap_waits_on_the_rate_limiter():
+    pool = FetchPool(5, 5, 0)
+    pool.rate_limiter = RateLimiter(20, capacity=1)
+    items = [{"url": f"https://a.example/{i}"} for i in range(5)]
+
+    start = time.monotonic()
+    assert len(list(pool.imap(lambda item: item, items))) == 5
+    # 1 jeton d'avance puis 20 par seconde : 4 attentes de 50 ms
+    assert time.monotonic() - start >= 0.19
+
+
+def test_imap_without_items_starts_no_worker():
+    assert list(FetchPool(2, 2, 0).imap(lambda item: item, [])) == []
@@ -0,0 +1,86 @@
+from src.services.fake_gspread import FakeClient
+from src.services.google_sheets_service import GoogleSheetsService
+
+
+HEADER = ["url", "title"]
+
+
+def make_service():
+    return GoogleSheetsService("spreadsheet", None, "all", client=FakeClient())
+
+
+def rows(*keys, title="job"):
+    return [HEADER] + [[key, f"{title} {key}"] for key in keys]
+
+
+def sync(service, new_rows):
+    service.sheet.calls.clear()
+    service.sync_rows(new_rows)
+    return [name for name, _ in service.sheet.calls]
+
+
+def test_first_sync_writes_every_row():
+    service = make_service()
+    calls = sync(service, rows("a", "b"))
+    assert service.sheet.values == rows("a", "b")
+    assert "clear" in calls
+
+
+def test_unchanged_rows_are_not_written():
+    service = make_service()
+    sync(service, rows("a", "b"))
+    calls = sync(service, rows("a", "b"))
+    assert calls == ["get_all_values"]
+
+
+def test_new_row_on_top_keeps_descending_order():
+    service = make_service()
+    sync(service, rows("c", "b", "a"))
+    calls = sync(service, rows("d", "c", "b"))
+    assert service.sheet.values == rows("d", "c", "b")
+    assert "clear" not in calls
+    assert "insert_rows" in calls
+    assert "delete_rows" in calls
+
+
+def test_new_rows_at_the_bottom_are_appended():
+    service = make_service()
+    sync(service, rows("a", "b"))
+    calls = sync(service, rows("a", "b", "c", "d"))
+    assert service.sheet.values == rows("a", "b", "c", "d")
+    assert "append_rows" in calls
+    assert "insert_rows" not in calls
+
+
+def test_rows_inserted_between_existing_rows():
+    service = make_service()
+    sync(service, rows("b", "d", "f"))
+    calls = sync(service, rows("a", "b", "c", "d", "e", "f", "g"))
+    assert service.sheet.values == rows("a", "b", "c", "d", "e", "f", "g")
+    assert "clear" not in calls
+
+
+def test_changed_and_removed_rows():
+    service = make_service()
+    sync(service, rows("a", "b", "c"))
+    new_rows = [HEADER, ["a", "job a"], ["c", "renamed"], ["e", "job e"]]
+    calls = sync(service, new_rows)
+    assert service.sheet.values == new_rows
+    assert "clear" not in calls
+
+
+def test_reordered_rows_fall_back_to_rewrite():
+    service = make_service()
+    sync(service, rows("a", "b", "c"))
+    calls = sync(service, rows("c", "a", "b"))
+    assert service.sheet.values == rows("c", "a", "b")
+    assert "clear" in calls
+
+
+def test_header_change_rewrites_the_sheet():
+    service = make_service()
+    sync(service, rows("a"))
+    new_rows = [["url", "title", "salary"], ["a", "job a", "30"]]
+    calls = sync(service, new_rows)
+    assert service.sheet.values == new_rows
+    assert "clear" in calls
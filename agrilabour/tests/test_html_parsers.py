@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.parser.html_job_parser import html_job_parser
+from src.parser.html_url_parser import html_url_parser, parse_listing
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# Résultats de l'ancien parser BeautifulSoup (benchmarks/legacy_*) sur les mêmes pages
+EXPECTED = json.loads((FIXTURES / "expected.json").read_text(encoding="utf-8"))
+JOB_PAGES = sorted(name for name in EXPECTED if name.startswith("job_page_"))
+
+
+@pytest.mark.parametrize("name", JOB_PAGES)
+def test_job_page_matches_beautifulsoup(name):
+    job = html_job_parser((FIXTURES / name).read_text(encoding="utf-8"), "https://example.com/job")
+    assert {field: getattr(job, field) for field in EXPECTED[name]} == EXPECTED[name]
+
+
+def test_listing_page_matches_beautifulsoup():
+    urls = html_url_parser((FIXTURES / "listing_page.html").read_text(encoding="utf-8"))
+    assert [item["url"] for item in urls] == EXPECTED["listing_page.html"]
+
+
+def listing(links, pagination=""):
+    anchors = "".join(f'<a class="name" href="/jobs/{link}">{link}</a>' for link in links)
+    return f"<html><body>{anchors}{pagination}</body></html>"
+
+
+@pytest.mark.parametrize(
+    "pagination, has_next",
+    [
+        ('<div class="pagination"><a class="next page-numbers" href="/page/3/">Next</a></div>', True),
+        ('<a rel="next" href="/page/3/">Next</a>', True),
+        ('<div class="pagination"><span class="current">2</span></div>', False),
+        ("", None),
+    ],
+)
+def test_parse_listing_reads_the_next_page_link(pagination, has_next):
+    urls, found_next = parse_listing(listing(["a", "b", "a"], pagination))
+    assert urls == [
+        {"url": "https://www.agrilabour.com.au/jobs/a"},
+        {"url": "https://www.agrilabour.com.au/jobs/b"},
+    ]
+    assert found_next is has_next
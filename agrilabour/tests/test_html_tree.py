@@ -0,0 +1,71 @@
+import pytest
+
+from src.parser.html_tree import parse_html, xpath, first, get_text, has_class, string_of, scan_metadata
+
+DIV = xpath("//div")
+
+
+def div(html):
+    return first(DIV(parse_html(f"<html><body>{html}</body></html>")))
+
+
+# Sorties de BeautifulSoup(html, "html.parser").div.get_text(...)
+@pytest.mark.parametrize(
+    "html, kwargs, expected",
+    [
+        ("<div>\n  <p>A</p>\n  <p>B</p>\n</div>", {}, "\nA\nB\n"),
+        ("<div>\t<p>A</p> <p>B</p></div>", {}, " A B"),
+        ("<div><p>A</p>\n  <p>\n    B\n  </p></div>", {}, "A\n\n    B\n  "),
+        ("<div>\n  <pre>  x\n    y\n</pre>\n</div>", {}, "\n  x\n    y\n\n"),
+        ("<div><textarea>  </textarea></div>", {}, "  "),
+        ("<div>A<script>var s = 1;</script><style>p {}</style>B</div>", {}, "AB"),
+        ("<div>A<!-- comment -->B</div>", {}, "AB"),
+        ("<div>\n  <p>A</p>\n  <p>B</p>\n</div>", {"separator": "\n", "strip": True}, "A\nB"),
+        ("<div><p>A</p><button>Apply</button><a href='#'>link</a></div>", {"skip": ("button", "a")}, "A"),
+    ],
+)
+def test_get_text_matches_beautifulsoup(html, kwargs, expected):
+    assert get_text(div(html), **kwargs) == expected
+
+
+def test_has_class_matches_whole_class_tokens():
+    tree = parse_html(
+        '<div class="name"></div><div class=" big  name "></div>'
+        '<div class="names"></div><div class="first-name"></div><div></div>'
+    )
+    assert len(xpath(f"//div[{has_class('name')}]")(tree)) == 2
+
+
+@pytest.mark.parametrize(
+    "html, expected",
+    [
+        ("<li>$30 per hour</li>", "$30 per hour"),
+        ("<li><strong><em>$30 per hour</em></strong></li>", "$30 per hour"),
+        ("<li>Pay: <b>$30 per hour</b></li>", None),
+        ("<li><b>$30</b> per hour</li>", None),
+        ("<li><b>A</b><b>B</b></li>", None),
+        ("<li><!-- note -->$30 per hour</li>", None),
+    ],
+)
+def test_string_of_follows_bs4_string(html, expected):
+    assert string_of(first(xpath("//li")(parse_html(html)))) == expected
+
+
+def test_scan_metadata_markers_keep_the_first_match():
+    items = xpath("//li")(parse_html(
+        "<ul><li>Pay: <b>$1 per hour</b></li><li><b>$30 per hour</b></li>"
+        "<li>Duration: 3 months</li><li>$40 per hour</li><li>Duration: ignored</li></ul>"
+    ))
+    assert scan_metadata(items, markers=("per hour", "Duration:", "Start:")) == {
+        "per hour": "$30 per hour",
+        "Duration:": "Duration: 3 months",
+    }
+
+
+def test_scan_metadata_keys_keep_the_first_element():
+    items = xpath("//li[@data-id]")(parse_html(
+        '<ul><li data-id="1">\n  <span>Yatala</span>\n</li><li data-id="1">ignored</li>'
+        '<li data-id="2">Full Time</li><li data-id="">empty</li></ul>'
+    ))
+    found = scan_metadata(items, key=lambda li: li.get("data-id") or None)
+    assert found == {"1": "\nYatala\n", "2": "Full Time"}
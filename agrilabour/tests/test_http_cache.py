@@ -0,0 +1,94 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.webdriver.fetch_cloudscraper import Driver
+from src.webdriver.http_cache import HttpCache
+from src.webdriver.retry_policy import RetryPolicy
+
+URL = "https://www.agrilabour.com.au/jobs"
+
+
+def response(status=200, text="", headers=None):
+    return SimpleNamespace(status_code=status, text=text, headers=headers or {}, ok=status < 400)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpCache(directory=str(tmp_path), max_bytes=1024 * 1024, default_ttl=0, ttls={})
+
+
+@pytest.fixture
+def driver(cache, monkeypatch):
+    """ Driver with a temporary cache and a scripted Driver.get """
+    sent = []
+    replies = []
+
+    def get(url, **kwargs):
+        sent.append(kwargs.get("headers", {}))
+        return replies.pop(0)
+
+    monkeypatch.setattr(Driver, "cache", cache)
+    monkeypatch.setattr(Driver, "retry_policy", RetryPolicy(max_attempts=1, budget=0))
+    monkeypatch.setattr(Driver, "get", staticmethod(get))
+    driver = Driver()
+    driver.sent, driver.replies = sent, replies
+    return driver
+
+
+def test_store_replaces_the_body_atomically(cache, tmp_path):
+    cache.store(URL, response(text="old", headers={"ETag": '"1"'}))
+    entry = cache.store(URL, response(text="new", headers={"ETag": '"2"'}))
+    assert cache.body(entry) == "new"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_uncacheable_response_is_not_stored(cache):
+    assert cache.store(URL, response(text="page")) is None
+    assert cache.store(URL, response(text="page", headers={"ETag": '"1"', "Cache-Control": "no-store"})) is None
+    assert cache.lookup(URL) is None
+
+
+def test_not_modified_serves_the_cached_body(driver):
+    driver.replies += [response(text="page", headers={"ETag": '"1"'}), response(304)]
+    assert driver.fetch(URL) == ("page", driver.cache.lookup(URL), False)
+    text, _, unchanged = driver.fetch(URL)
+    assert (text, unchanged) == ("page", True)
+    assert driver.sent[1] == {"If-None-Match": '"1"'}
+
+
+def test_not_modified_without_body_refetches_unconditionally(driver, cache):
+    driver.replies += [response(text="page", headers={"ETag": '"1"'})]
+    driver.fetch(URL)
+
+    entry = cache.lookup(URL)
+    os.remove(cache.paths(URL)[1])
+    driver.replies += [response(304), response(text="fresh page", headers={"ETag": '"2"'})]
+    # Corps évincé entre lookup et réponse 304
+    cache.lookup = lambda url: entry
+    text, _, unchanged = driver.fetch(URL)
+
+    assert (text, unchanged) == ("fresh page", False)
+    assert driver.sent[1] == {"If-None-Match": '"1"'}
+    assert driver.sent[2] == {}
+    del cache.lookup
+    assert cache.body(cache.lookup(URL)) == "fresh page"
+
+
+def test_parse_result_is_reused_only_for_the_same_parse_version(driver, monkeypatch):
+    calls = []
+
+    def parse(text):
+        calls.append(text)
+        return len(text)
+
+    parse.__module__ = __name__
+    driver.replies += [response(text="page", headers={"ETag": '"1"'}), response(304), response(304)]
+    assert driver.page_parsed(URL, parse) == 4
+    assert driver.page_parsed(URL, parse) == 4
+    assert len(calls) == 1
+
+    monkeypatch.setitem(globals(), "PARSE_VERSION", 2)
+    assert driver.page_parsed(URL, parse) == 4
+    assert len(calls) == 2
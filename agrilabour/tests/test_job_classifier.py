@@ -0,0 +1,144 @@
+import datetime
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from src.models.job import Job
+from src.services.job_classifier import JobClassifier, job_chunks
+from src.services.openai_service import OpenAIService
+
+
+class StubCompletions:
+    """
+    Local stand-in for client.chat.completions: batch requests (JSON mode) get
+    a verdict for every job except `skipped` ids, single requests get "maybe".
+    """
+
+    def __init__(self, skipped=(), delay=0.02):
+        self.skipped = set(skipped)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def create(self, model, messages, response_format=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        content = messages[-1]["content"]
+        ids = [int(part.split("\n")[0]) for part in content.split("### Job offer id=")[1:]]
+        with self.lock:
+            self.active -= 1
+            self.calls.append(ids or "single")
+        if response_format is None:
+            answer = "maybe"
+        else:
+            verdicts = [{"id": str(job_id), "verdict": "yes"} for job_id in ids if job_id not in self.skipped]
+            # Entrées à ignorer : id inconnu, verdict invalide
+            verdicts += [{"id": 999, "verdict": "no"}, {"id": ids[0], "verdict": "perhaps"}]
+            answer = json.dumps({"verdicts": verdicts})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=answer))])
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.amounts = []
+        self.lock = threading.Lock()
+
+    def acquire(self, amount=1.0):
+        with self.lock:
+            self.amounts.append(amount)
+
+
+def make_classifier(completions, concurrency=3, batch_size=4):
+    service = OpenAIService("test-key", model="stub-model")
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    classifier = JobClassifier(service, concurrency=concurrency, batch_size=batch_size)
+    classifier.requests_limiter = CountingLimiter()
+    classifier.tokens_limiter = CountingLimiter()
+    return classifier
+
+
+def make_job(job_id, **columns):
+    fields = {"title": "Widget operator", "description": f"Assemble widgets {job_id}", "url": f"u{job_id}"}
+    fields.update(columns)
+    return Job(id=job_id, **fields)
+
+
+def test_batches_run_concurrently_through_the_rate_limiters():
+    completions = StubCompletions(skipped={3, 10})
+    classifier = make_classifier(completions)
+    jobs = [make_job(job_id) for job_id in range(1, 21)]
+
+    verdicts = dict(classifier.classify(jobs))
+
+    # Ids 3 et 10 absents de la réponse JSON : reclassés un par un
+    assert verdicts == {job_id: "maybe" if job_id in (3, 10) else "yes" for job_id in range(1, 21)}
+    assert sorted(call for call in completions.calls if call != "single") == [
+        [1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16], [17, 18, 19, 20]
+    ]
+    assert completions.calls.count("single") == 2
+    assert 1 < completions.max_active <= 3
+    assert len(classifier.requests_limiter.amounts) == len(completions.calls)
+    assert len(classifier.tokens_limiter.amounts) == len(completions.calls)
+    assert all(amount > 0 for amount in classifier.tokens_limiter.amounts)
+
+
+def test_local_rules_and_empty_descriptions_skip_the_model():
+    completions = StubCompletions()
+    classifier = make_classifier(completions)
+    jobs = [
+        make_job(1, title="Warehouse Manager"),
+        make_job(2, title="Farm Hand", description="Pruning vines"),
+        make_job(3, description=""),
+        make_job(4),
+    ]
+
+    verdicts = dict(classifier.classify(jobs))
+
+    assert verdicts == {1: "no", 2: "yes", 3: "no", 4: "maybe"}
+    assert completions.calls == ["single"]
+    assert classifier.counts == {"local": 2, "cached": 0, "model": 2}
+
+
+def test_unparsable_batch_answer_falls_back_to_single_requests():
+    completions = StubCompletions()
+    original = completions.create
+
+    def create(model, messages, response_format=None):
+        response = original(model, messages, response_format)
+        if response_format is not None:
+            response.choices[0].message.content = "not json"
+        return response
+
+    completions.create = create
+    classifier = make_classifier(completions, batch_size=3)
+
+    verdicts = dict(classifier.classify([make_job(job_id) for job_id in (1, 2, 3)]))
+
+    assert verdicts == {1: "maybe", 2: "maybe", 3: "maybe"}
+    assert completions.calls.count("single") == 3
+
+
+def test_job_chunks_pages_on_the_primary_key_while_verdicts_are_committed():
+    engine = create_engine("sqlite://")
+    Job.__table__.create(engine)
+    now = datetime.datetime.now()
+    with Session(engine) as db:
+        db.add_all(make_job(job_id, created_at=now) for job_id in range(1, 8))
+        db.commit()
+
+        query = db.query(Job).filter(Job.filtered.is_(None))
+        seen = []
+        for chunk in job_chunks(query, chunk_size=3):
+            seen.append([job.id for job in chunk])
+            db.execute(update(Job), [{"id": job.id, "filtered": "yes"} for job in chunk[:2]])
+            db.commit()
+
+    assert seen == [[1, 2, 3], [4, 5, 6], [7]]
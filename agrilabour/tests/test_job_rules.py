@@ -0,0 +1,67 @@
+import pytest
+
+from src.services.job_rules import parse_salary, classify_job
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("$30 - $32 per hour", ("hourly", [30.0, 32.0])),
+        ("$30/hr paid weekly", ("hourly", [30.0])),
+        ("$30 per hour, 38 hours per week", ("hourly", [30.0])),
+        ("$28.50", ("hourly", [28.5])),
+        ("$70,000 - $80k p.a.", ("annual", [70000.0, 80000.0])),
+        ("$90,000", ("annual", [90000.0])),
+        ("Award rates", (None, [])),
+        ("", (None, [])),
+        (None, (None, [])),
+    ],
+)
+def test_parse_salary(text, expected):
+    assert parse_salary(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "$150 per day",
+        "$30 per day",
+        "$150-200 per day",
+        "$150 - $200 a day",
+        "$150 daily",
+        "$1,200 per week",
+        "$1200/wk",
+        "$800 p.w.",
+        "$2,400 per fortnight",
+        "$5,000 per month",
+        "$45 per shift",
+        "$2.50 per bin",
+        "$30 a bin",
+        "$150",
+    ],
+)
+def test_other_rates_are_left_to_the_model(text):
+    assert parse_salary(text) == (None, [])
+    assert classify_job("Widget operator", text, "") is None
+
+
+@pytest.mark.parametrize(
+    "title, salary, description, expected",
+    [
+        ("Widget operator", "$75 per hour", "", "no"),
+        ("Widget operator", "$120,000 p.a.", "", "no"),
+        ("Widget operator", "$30 per hour", "", "yes"),
+        ("Senior Warehouse Manager", None, "", "no"),
+        ("Warehouse Storeperson", None, "", "yes"),
+        ("Operator", None, "Packing fruit in the shed", None),
+        ("Operator", None, "Experienced packing supervisor", None),
+        ("Operator", "$40 per hour", "Drive the forklift", None),
+        ("Warehouse Storeperson", None, "Senior role reporting to the Manager. Experienced only.", None),
+        ("Warehouse Storeperson", "$30 per hour", "Reporting to the Warehouse Manager", None),
+        ("Driver", None, "We will pick you up from the station.", None),
+        ("Cleaner", None, "Supervisor position, leading a team of cleaners", None),
+        ("Warehouse Manager", "$30 per hour", "", "no"),
+    ],
+)
+def test_classify_job(title, salary, description, expected):
+    assert classify_job(title, salary, description) == expected
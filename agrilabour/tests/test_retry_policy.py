@@ -0,0 +1,167 @@
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+import requests
+from cloudscraper.exceptions import CloudflareCaptchaError, CloudflareChallengeError
+
+from src.webdriver import fetch_cloudscraper
+from src.webdriver.fetch_cloudscraper import Driver
+from src.webdriver.retry_policy import FATAL, OK, RETRY, CircuitBreaker, RetryBudget, RetryPolicy
+
+URL = "https://www.agrilabour.com.au/jobs"
+
+
+def response(status=200, headers=None, text="<html></html>"):
+    return SimpleNamespace(status_code=status, headers=headers or {}, text=text, ok=status < 400)
+
+
+@pytest.mark.parametrize(
+    "reply, error, verdict",
+    [
+        (response(200), None, OK),
+        (response(304), None, OK),
+        (response(404), None, FATAL),
+        (response(403), None, FATAL),
+        (response(403, {"Server": "cloudflare"}), None, RETRY),
+        (response(403, {"cf-mitigated": "challenge"}), None, RETRY),
+        (response(429), None, RETRY),
+        (response(522), None, RETRY),
+        (None, requests.exceptions.ConnectionError(), RETRY),
+        (None, requests.exceptions.ReadTimeout(), RETRY),
+        (None, CloudflareChallengeError(), RETRY),
+        (None, CloudflareCaptchaError(), FATAL),
+        (None, ValueError(), FATAL),
+    ],
+)
+def test_classify(reply, error, verdict):
+    assert RetryPolicy().classify(reply, error) == verdict
+
+
+def test_retry_after_accepts_seconds_and_http_dates():
+    policy = RetryPolicy(retry_after_max=120)
+    in_30s = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+    assert policy.retry_after(response(429, {"Retry-After": "12"})) == 12
+    assert 28 <= policy.retry_after(response(503, {"Retry-After": in_30s})) <= 30
+    assert policy.retry_after(response(503, {"Retry-After": "3600"})) == 120
+    assert policy.retry_after(response(503, {"Retry-After": "-5"})) == 0
+    assert policy.retry_after(response(503, {"Retry-After": "soon"})) is None
+    assert policy.retry_after(response(503)) is None
+    assert policy.retry_after(None) is None
+
+
+def test_backoff_is_jittered_below_the_capped_exponential(monkeypatch):
+    policy = RetryPolicy(base=1, cap=10)
+    monkeypatch.setattr("random.uniform", lambda low, high: (low, high))
+    assert [policy.backoff(attempt)[1] for attempt in range(1, 7)] == [1, 2, 4, 8, 10, 10]
+    assert all(policy.backoff(attempt)[0] == 0 for attempt in range(1, 7))
+
+
+def test_budget_is_shared_by_the_run():
+    budget = RetryBudget(2)
+    assert [budget.take() for _ in range(3)] == [True, True, False]
+    assert (budget.used, budget.remaining) == (2, 0)
+
+
+def test_breaker_opens_after_consecutive_failures_and_closes_after_cooldown():
+    breaker = CircuitBreaker(threshold=2, cooldown=0.05)
+    breaker.failure("a")
+    breaker.success("a")
+    breaker.failure("a")
+    assert breaker.state("a") == (0.0, None)
+
+    breaker.failure("a")
+    wait, reason = breaker.state("a")
+    assert 0 < wait <= 0.05 and reason == "failing"
+    assert breaker.state("b") == (0.0, None)
+
+    time.sleep(0.06)
+    assert breaker.state("a") == (0.0, None)
+    # Essai après la pause : un échec de plus rouvre le circuit
+    breaker.failure("a")
+    assert breaker.state("a")[1] == "failing"
+    assert breaker.opened == 2
+
+
+def test_retry_after_throttles_the_host_without_counting_a_failure():
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    breaker.block("a", 0.05)
+    assert breaker.state("a")[1] == "throttled"
+    assert "a" not in breaker.failures
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    """ Driver without cache, a scripted Driver.get and recorded sleeps """
+    replies, sleeps = [], []
+
+    def get(url, **kwargs):
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    monkeypatch.setattr(Driver, "cache", None)
+    monkeypatch.setattr(Driver, "get", staticmethod(get))
+    monkeypatch.setattr(fetch_cloudscraper.time, "sleep", sleeps.append)
+    monkeypatch.setattr("random.uniform", lambda low, high: high)
+    driver = Driver()
+    driver.replies, driver.sleeps = replies, sleeps
+    return driver
+
+
+def use_policy(monkeypatch, **kwargs):
+    settings = dict(max_attempts=5, base=1, cap=60, budget=10, threshold=5, cooldown=60)
+    settings.update(kwargs)
+    policy = RetryPolicy(**settings)
+    monkeypatch.setattr(Driver, "retry_policy", policy)
+    return policy
+
+
+def test_transient_errors_are_retried_with_backoff(driver, monkeypatch):
+    policy = use_policy(monkeypatch)
+    driver.replies[:] = [requests.exceptions.ConnectionError(), response(502), response(200, text="ok")]
+
+    assert driver.fetch(URL)[0] == "ok"
+    assert driver.sleeps == [1, 2]
+    assert policy.budget.used == 2
+
+
+def test_retry_after_replaces_the_backoff(driver, monkeypatch):
+    use_policy(monkeypatch)
+    driver.replies[:] = [response(429, {"Retry-After": "7"}), response(200, text="ok")]
+
+    assert driver.fetch(URL)[0] == "ok"
+    # L'attente passe par le disjoncteur ("throttled"), pas par le backoff
+    assert len(driver.sleeps) == 1 and 6 < driver.sleeps[0] <= 7
+
+
+def test_fatal_status_is_not_retried(driver, monkeypatch):
+    policy = use_policy(monkeypatch)
+    driver.replies[:] = [response(404)]
+
+    assert driver.fetch(URL) == (None, None, False)
+    assert driver.sleeps == [] and policy.budget.used == 0
+
+
+def test_attempts_budget_and_breaker_stop_the_retries(driver, monkeypatch):
+    use_policy(monkeypatch, max_attempts=3)
+    driver.replies[:] = [response(503)] * 3
+    assert driver.fetch(URL) == (None, None, False)
+    assert driver.replies == []
+
+    use_policy(monkeypatch, budget=1)
+    driver.replies[:] = [response(503)] * 3
+    assert driver.fetch(URL) == (None, None, False)
+    assert len(driver.replies) == 1
+
+    policy = use_policy(monkeypatch, threshold=2)
+    driver.replies[:] = [response(503)] * 3
+    assert driver.fetch(URL) == (None, None, False)
+    assert len(driver.replies) == 1
+    # Circuit ouvert : plus aucune requête vers l'hôte
+    assert driver.fetch(URL + "/other") == (None, None, False)
+    assert len(driver.replies) == 1 and policy.breaker.opened == 1
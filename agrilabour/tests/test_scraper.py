@@ -0,0 +1,92 @@
+import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from src import scraper
+from src.models.job import Job
+from src.scraper import Scraper
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Job.__table__.create(engine)
+    return engine
+
+
+def count_statements(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_filter_new_urls_checks_stored_urls_in_bulk(engine):
+    with Session(engine) as db:
+        now = datetime.datetime.now()
+        db.add_all([Job(url="u1", created_at=now), Job(url="u3", created_at=now)])
+        db.commit()
+        statements = count_statements(engine)
+
+        urls = [{"url": url} for url in ("u1", "u2", "u2", "u3", "u4", "u5")]
+        new_urls = Scraper().filter_new_urls(db, urls, chunk_size=2)
+
+    assert [data_url["url"] for data_url in new_urls] == ["u2", "u4", "u5"]
+    # 5 URLs distinctes, une requête url IN (...) par tranche de 2
+    assert len(statements) == 3
+
+
+def page(*ids, has_next=True):
+    return [{"url": f"u{i}"} for i in ids], has_next
+
+
+class FakeDriver:
+    """ Serves scripted parse_listing results, one per listing page """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def page_parsed(self, url, parse):
+        self.requested.append(url)
+        result = self.pages[len(self.requested) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def find_urls(monkeypatch, pages, known=(), max_pages=None):
+    driver = FakeDriver(pages)
+    monkeypatch.setattr(scraper, "Driver", lambda: driver)
+    monkeypatch.setattr(scraper, "SessionLocal", lambda: Session(create_engine("sqlite://")))
+    monkeypatch.setattr(
+        Scraper, "filter_new_urls", lambda self, db, urls: [u for u in urls if u["url"] not in known]
+    )
+    if max_pages:
+        monkeypatch.setenv("LISTING_MAX_PAGES", str(max_pages))
+    urls = Scraper().find_urls()
+    return [data_url["url"] for data_url in urls], len(driver.requested)
+
+
+@pytest.mark.parametrize(
+    "pages, known, expected",
+    [
+        # Lien "suivant" absent du bloc de pagination
+        ([page(1, 2), page(3, has_next=False), page(4)], (), (["u1", "u2", "u3"], 2)),
+        # Page vide au-delà de la fin
+        ([page(1), page(2, has_next=None), page()], (), (["u1", "u2"], 3)),
+        # Dernière page renvoyée à nouveau
+        ([page(1, has_next=None), page(2, has_next=None), page(2, has_next=None)], (), (["u1", "u2", "u2"], 3)),
+        # Offres déjà en base : le reste du listing est plus ancien
+        ([page(1), page(2, 3), page(4)], ("u2", "u3"), (["u1", "u2", "u3"], 2)),
+        # Erreurs et réponses vides : page suivante
+        ([ValueError("boom"), None, page(1, has_next=False)], (), (["u1"], 3)),
+    ],
+)
+def test_find_urls_stops_where_the_listing_ends(monkeypatch, pages, known, expected):
+    assert find_urls(monkeypatch, pages, known) == expected
+
+
+def test_find_urls_stops_at_listing_max_pages(monkeypatch):
+    assert find_urls(monkeypatch, [page(i) for i in range(1, 10)], max_pages=3) == (["u1", "u2", "u3"], 3)
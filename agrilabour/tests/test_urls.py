@@ -0,0 +1,47 @@
+import pytest
+
+from src.parser.urls import is_valid_url, normalize_url, unique_urls
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://agrilabour.com.au/jobs/picker", True),
+        ("http://AgriLabour.com.au:8080/jobs?id=1", True),
+        ("agrilabour.com.au/jobs", True),
+        ("/jobs/picker", False),
+        ("mailto:jobs@agrilabour.com.au", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_is_valid_url(url, expected):
+    assert is_valid_url(url) is expected
+
+
+@pytest.mark.parametrize(
+    "url, base, expected",
+    [
+        (
+            " HTTPS://Agrilabour.com.au:443/jobs/picker?b=2&utm_source=x&a=1&GCLID=y#apply ",
+            None,
+            "https://agrilabour.com.au/jobs/picker?a=1&b=2",
+        ),
+        ("http://agrilabour.com.au:80", None, "http://agrilabour.com.au/"),
+        ("http://agrilabour.com.au:8080/jobs", None, "http://agrilabour.com.au:8080/jobs"),
+        ("agrilabour.com.au/jobs", None, "https://agrilabour.com.au/jobs"),
+        ("/jobs/picker?ref=", "https://agrilabour.com.au/jobs/", "https://agrilabour.com.au/jobs/picker?ref="),
+        ("picker", "https://agrilabour.com.au/jobs/", "https://agrilabour.com.au/jobs/picker"),
+        ("ftp://agrilabour.com.au/jobs", None, None),
+        ("https://agrilabour.com.au:99999/jobs", None, None),
+        ("javascript:void(0)", None, None),
+        ("", "https://agrilabour.com.au/", None),
+        (None, None, None),
+    ],
+)
+def test_normalize_url(url, base, expected):
+    assert normalize_url(url, base=base) == expected
+
+
+def test_unique_urls_keeps_first_seen_order_and_drops_empty():
+    assert unique_urls(["u2", None, "u1", "u2", "", "u3"]) == [{"url": "u2"}, {"url": "u1"}, {"url": "u3"}]
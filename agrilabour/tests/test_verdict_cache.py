@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+from src.services.openai_service import OpenAIService
+from src.services.verdict_cache import VerdictCache
+
+
+def make_job(title="Farm Hand", salary="$30 per hour", description="Picking fruit in Mildura"):
+    return SimpleNamespace(id=1, title=title, salary=salary, description=description)
+
+
+def make_cache(model="gpt-4o"):
+    return VerdictCache(None, OpenAIService("test", model=model))
+
+
+def test_key_ignores_case_and_whitespace():
+    cache = make_cache()
+    assert cache.key(make_job()) == cache.key(
+        make_job(title=" farm  hand", description="Picking fruit\nin  Mildura ")
+    )
+
+
+def test_missing_salary_and_na_share_a_key():
+    cache = make_cache()
+    assert cache.key(make_job(salary=None)) == cache.key(make_job(salary="N/A"))
+
+
+def test_key_depends_on_salary_and_model():
+    cache = make_cache()
+    assert cache.key(make_job()) != cache.key(make_job(salary="$45 per hour"))
+    assert cache.key(make_job()) != make_cache(model="other-model").key(make_job())
@@ -0,0 +1,72 @@
+"""
+Parse time and Python allocations of html_job_parser on a 1,000-page corpus built
+from the fixture job pages, against the former BeautifulSoup parser when
+beautifulsoup4 is installed.
+
+Run from the apgworkforce directory:
+    python -m benchmarks.bench_metadata [pages]
+"""
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.parser.html_job_parser import html_job_parser, extract_fields
+from src.parser.html_tree import parse_html
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def corpus(size):
+    """ `size` distinct pages cycling through the fixture job pages """
+    templates = [path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("job_page_*.html"))]
+    return [
+        templates[i % len(templates)].replace("<html", f"<!-- page {i} --><html", 1)
+        for i in range(size)
+    ]
+
+
+def measure(run, items):
+    """ (ms per item, mean and max kB allocated at peak while running one item) """
+    start = time.perf_counter()
+    for item in items:
+        run(item)
+    elapsed = time.perf_counter() - start
+
+    peaks = []
+    tracemalloc.start()
+    for item in items:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        run(item)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    return elapsed / len(items) * 1000, sum(peaks) / len(peaks) / 1024, max(peaks) / 1024
+
+
+def main(size=1000):
+    logging.disable(logging.CRITICAL)
+    pages = corpus(size)
+    logger = logging.getLogger("HtmlParserUrl")
+    trees = [parse_html(page) for page in pages]
+
+    cases = [
+        ("html_job_parser", lambda page: html_job_parser(page, "u"), pages),
+        ("extract_fields (parsed)", lambda tree: extract_fields(tree, logger), trees),
+    ]
+    try:
+        from benchmarks.legacy_html_job_parser import html_job_parser as legacy_parser
+    except ImportError:
+        print("beautifulsoup4 not installed: legacy parser skipped")
+    else:
+        cases.append(("bs4 html_job_parser (legacy)", lambda page: legacy_parser(page, "u"), pages))
+
+    print(f"{size} pages, Python {sys.version.split()[0]}")
+    for name, run, items in cases:
+        ms, mean_peak, max_peak = measure(run, items)
+        print(f"  {name:<30} {ms:.3f} ms/page  allocations {mean_peak:.1f} kB/page (max {max_peak:.1f} kB)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
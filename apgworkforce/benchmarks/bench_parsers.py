@@ -0,0 +1,56 @@
+"""
+Per-page parse time of the job and listing parsers on the recorded fixture pages,
+against the former BeautifulSoup parsers when beautifulsoup4 is installed.
+
+Run from the apgworkforce directory:
+    python -m benchmarks.bench_parsers [runs]
+"""
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+from src.parser.html_job_parser import html_job_parser
+from src.parser.html_url_parser import html_url_parser
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+FIELDS = ["title", "description", "state", "suburb", "job_type", "salary", "duration", "start_date"]
+
+
+def load_legacy():
+    try:
+        from benchmarks import legacy_html_job_parser, legacy_html_url_parser
+    except ImportError:
+        return None
+    return legacy_html_job_parser.html_job_parser, legacy_html_url_parser.html_url_parser
+
+
+def main(runs=200):
+    logging.disable(logging.CRITICAL)
+    job_pages = [path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("job_page_*.html"))]
+    listing = (FIXTURES / "listing_page.html").read_text(encoding="utf-8")
+
+    parsers = [("lxml", html_job_parser, html_url_parser)]
+    legacy = load_legacy()
+    if legacy is None:
+        print("beautifulsoup4 not installed: legacy parsers skipped")
+    else:
+        parsers.append(("bs4 (legacy)", *legacy))
+        for page in job_pages:
+            old, new = legacy[0](page, "u"), html_job_parser(page, "u")
+            diffs = [field for field in FIELDS if getattr(old, field) != getattr(new, field)]
+            if diffs:
+                print(f"  fields differing from the legacy parser: {diffs}")
+
+    print(f"{len(job_pages)} job pages, 1 listing page, {runs} runs, Python {sys.version.split()[0]}")
+    for name, job_parser, url_parser in parsers:
+        job = min(timeit.repeat(lambda: [job_parser(page, "u") for page in job_pages], number=runs, repeat=3))
+        url = min(timeit.repeat(lambda: url_parser(listing), number=runs, repeat=3))
+        print(
+            f"  {name:<14} job page {job / runs / len(job_pages) * 1000:.3f} ms"
+            f"  listing page {url / runs * 1000:.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,24 @@
+from sqlalchemy import text
+from src.models.base import Base, engine
+from src.models.job import Job
+from src.models.all_jobs import AllJobs
+from src.models.sync_state import AllJobsSyncState
+from src.models.verdict_cache import LlmVerdictCache
+
+# Modèles à enregistrer dans Base.metadata avant create_all
+MODELS = (Job, AllJobs, AllJobsSyncState, LlmVerdictCache)
+
+# create_all ne modifie pas les tables existantes : colonnes et index ajoutés après coup
+MIGRATIONS = [
+    f"ALTER TABLE {Job.__tablename__} ADD COLUMN IF NOT EXISTS filtered_at TIMESTAMP",
+    f"CREATE INDEX IF NOT EXISTS ix_{Job.__tablename__}_filtered_at ON {Job.__tablename__} (filtered_at)",
+    "CREATE INDEX IF NOT EXISTS ix_all_jobs_publication_date_url ON all_jobs (publication_date, url)",
+]
+
+
+def ensure_schema():
+    """ Create missing tables, then apply the idempotent migrations above """
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        for statement in MIGRATIONS:
+            connection.execute(text(statement))
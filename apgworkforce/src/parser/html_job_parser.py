@@ -1,43 +1,51 @@
-import os, sys, logging, re
+import logging
 from datetime import date
-from bs4 import BeautifulSoup
 from src.models.job import Job
+from src.parser.html_tree import parse_html, xpath, has_class, first, get_text, scan_metadata
 
 
+# Sélecteurs compilés une fois pour le site
+TITLE = xpath(f"(//*[{has_class('ja-job-details')}])[1]//h2")
+DESCRIPTION = xpath(f"//div[{has_class('description')}]")
+# Champs personnalisés JobAdder : <li data-id="...">, lus en une passe
+FIELDS = xpath("//li[@data-id]")
+SUBURB_FIELD_ID = "22203"
+JOB_TYPE_FIELD_ID = "22204"
+BULLET_POINTS = xpath(f"(//*[{has_class('bullet-points')}])[1]//li")
+# Boutons et liens retirés du texte de la description
+DESCRIPTION_SKIP = ("button", "a", "iframe")
 
 
 def html_job_parser(html_content, url):
-    logger = logging.getLogger("HtmlParserUrl")    
-    soup = BeautifulSoup(str(html_content), 'html.parser')
+    logger = logging.getLogger("HtmlParserUrl")
+    tree = parse_html(html_content)
     # title description state suburb job_type salary duration start_date
-
-    title = find_title(soup, logger)
-    description = find_description(soup, logger)
-    state = find_state(soup, logger)
-    suburb = find_suburb(soup, logger)
-    job_type = find_job_type(soup, logger)
-    salary = find_salary(soup, logger)
-    duration = find_duration(soup, logger)
-    start_date = find_start_date(soup, logger)
     job = Job(
-        title=title,
-        description=description,
-        state=state,
-        suburb=suburb,
-        job_type=job_type,
-        salary=salary,
-        duration=duration,
-        start_date=start_date,
+        **extract_fields(tree, logger),
         created_at=date.today().isoformat(),
         url=url
     )
     return job
 
 
+def extract_fields(tree, logger):
+    """ Every job field from one parsed document """
+    fields = scan_metadata(FIELDS(tree), key=lambda li: li.get("data-id"))
+    return {
+        "title": find_title(tree, logger),
+        "description": find_description(tree, logger),
+        "state": find_state(tree, logger),
+        "suburb": find_suburb(fields, logger),
+        "job_type": find_job_type(fields, logger),
+        "salary": find_salary(tree, logger),
+        "duration": find_duration(tree, logger),
+        "start_date": find_start_date(tree, logger),
+    }
+
 
-def find_title(soup, logger):
+def find_title(tree, logger):
     try:
-        title = soup.find(class_="ja-job-details").find("h2").get_text().strip().split("-")[0].strip()
+        title = get_text(first(TITLE(tree))).strip().split("-")[0].strip()
     except Exception as e:
         logger.warning(f"Error finding title: {str(e)}")
         title = None
@@ -45,21 +53,18 @@ def find_title(soup, logger):
         return title
 
 
-def find_description(soup, logger):
+def find_description(tree, logger):
     try:
-        description_with_buttons = soup.find("div", class_="description")
-        # Remove buttons and other non-description text
-        for tag in description_with_buttons.find_all(["button", "a", "iframe"]):
-            tag.decompose()
-
-        description = description_with_buttons.get_text(separator="\n", strip=True)
+        description = get_text(
+            first(DESCRIPTION(tree)), separator="\n", strip=True, skip=DESCRIPTION_SKIP
+        )
     except Exception as e:
         logger.warning(f"Error finding description: {str(e)}")
         description = None
     finally:
         return description
 
-def find_state(soup, logger):
+def find_state(tree, logger):
     try:
         state = None
     except Exception as e:
@@ -68,34 +73,34 @@ def find_state(soup, logger):
     finally:
         return state
 
-def find_suburb(soup, logger):
+def find_suburb(fields, logger):
     try:
-        suburb = soup.find("li", attrs={"data-id":"22203"}).get_text().strip()
+        suburb = fields[SUBURB_FIELD_ID].strip()
     except Exception as e:
         logger.warning(f"Error finding suburb: {str(e)}")
         suburb = None
     finally:
-        return suburb         
+        return suburb
 
-def find_job_type(soup, logger):
+def find_job_type(fields, logger):
     try:
-        job_type = soup.find("li", attrs={"data-id":"22204"}).get_text().strip()
+        job_type = fields[JOB_TYPE_FIELD_ID].strip()
     except Exception as e:
         logger.warning(f"Error finding job_type: {str(e)}")
         job_type = None
     finally:
         return job_type
 
-def find_salary(soup, logger):
+def find_salary(tree, logger):
     try:
-        salary = soup.find(class_='bullet-points').find_all("li")[2].get_text().strip()
+        salary = get_text(BULLET_POINTS(tree)[2]).strip()
     except Exception as e:
         logger.warning(f"Error finding salary: {str(e)}")
         salary = None
     finally:
         return salary
 
-def find_duration(soup, logger):
+def find_duration(tree, logger):
     try:
         duration = None
     except Exception as e:
@@ -104,7 +109,7 @@ def find_duration(soup, logger):
     finally:
         return duration
 
-def find_start_date(soup, logger):
+def find_start_date(tree, logger):
     try:
         title = None
     except Exception as e:
@@ -112,4 +117,3 @@ def find_start_date(soup, logger):
         title = None
     finally:
         return title
-    
\ No newline at end of file
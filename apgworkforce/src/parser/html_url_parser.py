@@ -1,36 +1,20 @@
-import os, sys, logging, re
-from bs4 import BeautifulSoup
+import logging
+from src.parser.html_tree import parse_html, xpath, has_class
+from src.parser.urls import unique_urls
+
+# Identifiants des offres sur une page de listing, compilé une fois
+JOB_IDS = xpath(f"//a[{has_class('view-details')}]/@data-job-id")
+# URL construite par nous : pas besoin de la revalider, seul l'id est vérifié
+JOB_URL = "https://www.apgworkforce.com.au/job-search?ja-job={id}"
+
 
 def html_url_parser(html_content):
 
     logger = logging.getLogger("HtmlParserUrl")
     try:
-        soup = BeautifulSoup(str(html_content), 'html.parser')
-        list_a = soup.find_all("a", class_="view-details")
-        urls = list()
-        for a in list_a:
-            id = a.get('data-job-id')
-            url = f"https://www.apgworkforce.com.au/job-search?ja-job={id}"
-
-            if is_valid_url(url):
-                urls.append({"url": url})
-
+        ids = JOB_IDS(parse_html(html_content))
+        urls = unique_urls(JOB_URL.format(id=id.strip()) for id in ids if id.strip())
     except Exception as e:
         logger.warning("error parsing HTML content: " + str(e))
         urls = []
     return urls
-
-def is_valid_url(url):
-    """ regex check to valid if url is a real url """
-    # Expression régulière pour vérifier les URL
-    try:
-        regex = re.compile(
-            r'^(https?://)?'  # supporte http et https
-            r'([a-zA-Z0-9-]+(\.[a-zA-Z0-9-]+)+)'  # domaine
-            r'(:\d+)?'  # port (optionnel)
-            r'(/.*)?$'  # chemin (optionnel)
-        )
-        return re.match(regex, url) is not None
-    except Exception as e:
-        logging.getLogger("HtmlParserUrl").warning(f"Error validating URL: {str(e)}")
-        return False
@@ -0,0 +1,69 @@
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, urljoin
+
+
+# Compilée une seule fois (avant : à chaque appel de is_valid_url)
+URL_REGEX = re.compile(
+    r'^(https?://)?'  # supporte http et https
+    r'([a-zA-Z0-9-]+(\.[a-zA-Z0-9-]+)+)'  # domaine
+    r'(:\d+)?'  # port (optionnel)
+    r'(/.*)?$',  # chemin (optionnel)
+    re.IGNORECASE,
+)
+
+# Paramètres de suivi retirés des URLs d'offres
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "_ga", "_gl", "yclid"}
+TRACKING_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def is_valid_url(url):
+    """ regex check to valid if url is a real url """
+    return isinstance(url, str) and URL_REGEX.match(url) is not None
+
+
+def is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def normalize_url(url, base=None):
+    """
+    Canonical form of a job URL, or None if it is not a valid http(s) URL.
+    Relative hrefs are resolved against `base`; the scheme and host are lowercased,
+    default ports, fragments and tracking parameters dropped, the query sorted.
+    """
+    if not url:
+        return None
+    url = url.strip()
+    if base:
+        url = urljoin(base, url)
+    if not is_valid_url(url):
+        return None
+    parts = urlsplit(url if "://" in url else "https://" + url)
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS:
+        return None
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        return None
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(name)
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
+
+
+def unique_urls(urls):
+    """ [{"url": ...}] for each distinct URL, in first-seen order """
+    seen = set()
+    result = []
+    for url in urls:
+        if url and url not in seen:
+            seen.add(url)
+            result.append({"url": url})
+    return result
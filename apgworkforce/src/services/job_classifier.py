@@ -0,0 +1,123 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
+from sqlalchemy.inspection import inspect
+from src.models.job import Job
+from src.services.openai_service import OpenAIService
+from src.services.rate_limiter import RateLimiter
+from src.services.verdict_cache import VerdictCache
+
+
+def job_chunks(query, chunk_size=500):
+    """
+    Jobs of `query` in chunks of `chunk_size`, paged on the primary key: only one
+    chunk is loaded at a time, and verdicts committed between chunks do not
+    shift the following pages.
+    """
+    last_id = None
+    while True:
+        page = query if last_id is None else query.filter(Job.id > last_id)
+        chunk = page.order_by(Job.id).limit(chunk_size).all()
+        if not chunk:
+            return
+        # Lu avant le yield : l'appelant commit, ce qui expire les instances
+        last_id = chunk[-1].id
+        yield chunk
+
+
+class JobClassifier:
+    """
+    Classify jobs with OpenAIService from a bounded thread pool.
+
+    Jobs settled by the local rules (see job_rules) or found in the verdict
+    cache never reach the model.
+    Requests go through two shared token buckets, one for requests per minute
+    and one for (estimated) tokens per minute. With a batch size above 1,
+    several jobs are scored per request and jobs missing from the answer are
+    classified one by one.
+    """
+
+    def __init__(self, service: OpenAIService, concurrency=None, rpm=None, tpm=None, batch_size=None):
+        self.service = service
+        self.concurrency = concurrency or int(os.getenv("OPENAI_CONCURRENCY", "4"))
+        self.batch_size = batch_size or int(os.getenv("OPENAI_BATCH_SIZE", "1"))
+        rpm = rpm or float(os.getenv("OPENAI_RPM", "500"))
+        tpm = tpm or float(os.getenv("OPENAI_TPM", "30000"))
+        self.requests_limiter = RateLimiter(rpm / 60, capacity=max(1.0, rpm / 10))
+        self.tokens_limiter = RateLimiter(tpm / 60, capacity=tpm / 10)
+        self.counts = {"local": 0, "cached": 0, "model": 0}
+
+    @staticmethod
+    def snapshot(job: Job) -> SimpleNamespace:
+        """ Plain copy of the job columns, safe to read from worker threads """
+        return SimpleNamespace(
+            **{column.key: getattr(job, column.key) for column in inspect(Job).columns}
+        )
+
+    def _acquire(self, jobs):
+        self.requests_limiter.acquire()
+        self.tokens_limiter.acquire(self.service.estimate_tokens(jobs))
+
+    def _classify_batch(self, jobs) -> dict:
+        # Pas d'appel pour les offres sans description (même règle que test_job)
+        verdicts = {job.id: "no" for job in jobs if not job.description}
+        jobs = [job for job in jobs if job.description]
+        if len(jobs) > 1:
+            self._acquire(jobs)
+            verdicts.update(self.service.test_jobs(jobs))
+        for job in jobs:
+            if job.id not in verdicts:
+                self._acquire([job])
+                verdicts[job.id] = self.service.test_job(job)
+        return verdicts
+
+    def classify(self, jobs, cache: VerdictCache = None):
+        """
+        Yield `(job_id, verdict)` pairs: jobs settled by the local rules first,
+        then cached verdicts, then the model's verdicts as the requests complete.
+        The generator body runs in the caller's thread, so `cache` (and its
+        session) is never used from the pool. Every job is read before the
+        first verdict is yielded: the caller commits while iterating, which
+        expires the ORM instances.
+        """
+        local, snapshots = [], []
+        for job in jobs:
+            verdict = self.service.prefilter(job) if job.description else None
+            if verdict:
+                local.append((job.id, verdict))
+            else:
+                snapshots.append(self.snapshot(job))
+        self.counts["local"] += len(local)
+        yield from local
+
+        keys = {}
+        if cache:
+            cached = cache.get_many(snapshots)
+            self.counts["cached"] += len(cached)
+            yield from cached.items()
+            snapshots = [job for job in snapshots if job.id not in cached]
+            keys = {job.id: cache.key(job) for job in snapshots}
+        self.counts["model"] += len(snapshots)
+        batches = [
+            snapshots[i : i + self.batch_size]
+            for i in range(0, len(snapshots), self.batch_size)
+        ]
+        if not batches:
+            return
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(self._classify_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                verdicts = future.result()
+                if cache:
+                    cache.put_many((keys[job_id], verdict) for job_id, verdict in verdicts.items())
+                yield from verdicts.items()
+
+    def classify_chunks(self, chunks, cache: VerdictCache = None):
+        """ classify() over successive chunks of jobs (see job_chunks), with one summary at the end """
+        for jobs in chunks:
+            yield from self.classify(jobs, cache=cache)
+        print(
+            f"{self.counts['local']} jobs classified by local rules, "
+            f"{self.counts['cached']} from the verdict cache, "
+            f"{self.counts['model']} sent to the model."
+        )
@@ -0,0 +1,72 @@
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+from src.webdriver.fetch_selenium import Driver
+
+
+class DriverPool:
+    """
+    Fixed set of Chrome drivers shared by worker threads.
+
+    A worker checks a driver out, loads its pages and checks it back in.
+    Unhealthy drivers are quit on checkin, and a driver is recycled after
+    `max_pages` page loads to keep Chrome memory growth bounded.
+    Browsers are started lazily, on the first page load of each driver.
+    """
+
+    logger = logging.getLogger("webdriver")
+
+    def __init__(self, size=None, max_pages=None, driver_factory=Driver):
+        self.size = size or int(os.getenv("SELENIUM_POOL_SIZE", "2"))
+        self.max_pages = max_pages or int(os.getenv("SELENIUM_RECYCLE_AFTER", "50"))
+        self.driver_factory = driver_factory
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+        for _ in range(self.size):
+            driver = self.driver_factory()
+            self._drivers.append(driver)
+            self._idle.put(driver)
+
+    def checkout(self, timeout=None):
+        """ Wait for an idle driver; raises queue.Empty after `timeout` seconds """
+        driver = self._idle.get(timeout=timeout)
+        if driver.pages_loaded >= self.max_pages:
+            self.logger.debug(f"Recycling driver after {driver.pages_loaded} pages")
+            driver.quit()
+        return driver
+
+    def checkin(self, driver):
+        if driver.driver is not None and not driver.is_healthy():
+            self.logger.warning("Driver failed its health check, quitting it")
+            driver.quit()
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def report(self):
+        """ Log the average page load time and size measured by the pool drivers """
+        pages = sum(driver.stats["pages"] for driver in self._drivers)
+        if not pages:
+            return
+        load_ms = sum(driver.stats["load_ms"] for driver in self._drivers)
+        size = sum(driver.stats["bytes"] for driver in self._drivers)
+        self.logger.info(
+            f"{pages} pages loaded, avg {load_ms / pages:.0f} ms and "
+            f"{size / pages / 1024:.1f} kB per page"
+        )
+
+    def close(self):
+        with self._lock:
+            self.report()
+            for driver in self._drivers:
+                driver.quit()
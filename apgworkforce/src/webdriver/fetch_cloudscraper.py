@@ -1,8 +1,13 @@
 import cloudscraper
-import requests
+from requests.adapters import HTTPAdapter
 import logging
+import os
+import threading
+import time
+from urllib.parse import urlsplit
 from dotenv import load_dotenv  # Utilisé si vous utilisez un fichier .env
 from src.webdriver.proxy import get_proxy
+from src.webdriver.retry_policy import RetryPolicy, OK, FATAL
 
 # Charger les variables d'environnement depuis un fichier .env (optionnel)
 load_dotenv()
@@ -11,6 +16,15 @@ class Driver:
 
     logger = logging.getLogger("webdriver")
 
+    # Par hôte pendant tout le run : un scraper par thread (requests.Session et l'état
+    # des challenges de cloudscraper ne sont pas thread-safe), clonés du premier
+    # scraper qui a passé Cloudflare (keep-alive + cookies)
+    sessions = {}
+    sessions_lock = threading.Lock()
+    pool_size = int(os.getenv("HTTP_POOL_SIZE", "10"))
+    # Backoff, disjoncteur par hôte et budget de retries communs à tout le run
+    retry_policy = RetryPolicy()
+
     def __init__(self):
         self.setup()
 
@@ -30,30 +44,159 @@ class Driver:
 
         self.proxies = proxies
 
+    @classmethod
+    def new_scraper(cls, template=None):
+        """ CloudScraper keeping pool_size connections per host, cloned from `template` if given """
+        scraper = cloudscraper.create_scraper(cipherSuite=template.cipherSuite if template else None)
+        if template is not None:
+            # Même User-Agent et mêmes cookies (cf_clearance est lié au User-Agent)
+            scraper.headers.update(template.headers)
+            scraper.cookies.update(template.cookies)
+        scraper.mount("https://", cloudscraper.CipherSuiteAdapter(
+            cipherSuite=scraper.cipherSuite,
+            ecdhCurve=scraper.ecdhCurve,
+            server_hostname=scraper.server_hostname,
+            source_address=scraper.source_address,
+            pool_connections=cls.pool_size,
+            pool_maxsize=cls.pool_size,
+        ))
+        scraper.mount("http://", HTTPAdapter(pool_connections=cls.pool_size, pool_maxsize=cls.pool_size))
+        return scraper
+
+    @classmethod
+    def session(cls, url):
+        """ Host entry: warm scraper, every scraper opened and the per-thread scrapers """
+        host = urlsplit(url).netloc.lower()
+        with cls.sessions_lock:
+            entry = cls.sessions.get(host)
+            if entry is None:
+                entry = {"lock": threading.Lock(), "warm": None, "scrapers": [], "local": threading.local()}
+                cls.sessions[host] = entry
+                cls.logger.debug(f"New pooled session for {host}")
+            return entry
+
+    @classmethod
+    def get(cls, url, **kwargs):
+        entry = cls.session(url)
+        scraper = getattr(entry["local"], "scraper", None)
+        if scraper is not None:
+            return scraper.get(url, **kwargs)
+        with entry["lock"]:
+            if entry["warm"] is None:
+                # The first request may solve a Cloudflare challenge: let it finish alone
+                # so that the other threads start from the resulting cookies.
+                scraper = cls.new_scraper()
+                entry["scrapers"].append(scraper)
+                response = scraper.get(url, **kwargs)
+                if response.ok:
+                    entry["warm"] = scraper
+                    entry["local"].scraper = scraper
+                return response
+            scraper = cls.new_scraper(entry["warm"])
+            entry["scrapers"].append(scraper)
+        entry["local"].scraper = scraper
+        return scraper.get(url, **kwargs)
+
     def page(self, url):
         """ Charger la page en utilisant le proxy avec 3 tentatives """
-        max_retries = 5
-        for attempt in range(1, max_retries + 1):
+        policy = self.retry_policy
+        host = urlsplit(url).netloc.lower()
+        for attempt in range(1, policy.max_attempts + 1):
+            wait, reason = policy.breaker.state(host)
+            if reason == "failing":
+                self.logger.error(f"Circuit ouvert pour {host} ({wait:.0f}s), abandon de {url}")
+                return None
+            if wait > 0:
+                time.sleep(wait)
+
             # self.configure_proxy(url)
-            scraper = cloudscraper.create_scraper()
+            response, error = None, None
             try:
                 self.logger.debug(f"Tentative {attempt} - URL: {url} ")
                 # self.logger.debug(f"Tentative {attempt} - URL: {url} via proxies: {self.proxies}")
-                response = scraper.get(
+                response = self.get(
                     url,
                     # proxies=self.proxies,
                     timeout=60
                 )
-                response.raise_for_status()
+            except Exception as e:
+                error = e
+
+            verdict = policy.classify(response, error)
+            if verdict == OK:
+                policy.breaker.success(host)
                 return response.text
-            except (requests.exceptions.RequestException) as e:
-                self.logger.warning(f"Tentative {attempt} échouée : {e}")
-                if attempt == max_retries:
-                    self.logger.error(f"Échec après {max_retries} tentatives.")
-                    return None
-            finally:
-                scraper.close()  # 🧹 Nettoyage mémoire
 
+            failure = error or f"HTTP {response.status_code}"
+            if verdict == FATAL:
+                self.logger.error(f"Tentative {attempt} échouée, erreur définitive : {failure}")
+                return None
+
+            retry_after = policy.retry_after(response)
+            if retry_after is not None:
+                # Limitation de débit : l'hôte est en pause, pas en panne
+                policy.breaker.block(host, retry_after)
+            else:
+                policy.breaker.failure(host)
+            if policy.breaker.state(host)[1] == "failing":
+                self.logger.error(f"Circuit ouvert pour {host} après : {failure}, abandon de {url}")
+                return None
+            if attempt == policy.max_attempts:
+                self.logger.error(f"Échec après {policy.max_attempts} tentatives : {failure}")
+                return None
+            if not policy.budget.take():
+                self.logger.error(f"Budget de retries du run épuisé, abandon de {url} : {failure}")
+                return None
+            delay = retry_after if retry_after is not None else policy.backoff(attempt)
+            self.logger.warning(
+                f"Tentative {attempt} échouée : {failure}, nouvel essai dans {delay:.1f}s"
+            )
+            if retry_after is None:
+                time.sleep(delay)
+
+    @classmethod
+    def connection_stats(cls):
+        """ Requests sent and connections opened per host since the start of the run """
+        stats = {}
+        with cls.sessions_lock:
+            entries = list(cls.sessions.items())
+        for host, entry in entries:
+            requests_count, connections = 0, 0
+            with entry["lock"]:
+                adapters = [adapter for scraper in entry["scrapers"] for adapter in scraper.adapters.values()]
+            for adapter in adapters:
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    requests_count += pool.num_requests
+                    connections += pool.num_connections
+            stats[host] = {
+                "requests": requests_count,
+                "connections": connections,
+                "reused": max(0, requests_count - connections),
+            }
+        return stats
+
+    @classmethod
+    def report(cls):
+        """ Log connection reuse and retries for the run """
+        cls.retry_policy.report()
+        for host, stats in cls.connection_stats().items():
+            cls.logger.info(
+                f"{host}: {stats['requests']} requests, {stats['connections']} connections opened, "
+                f"{stats['reused']} reused"
+            )
+
+    @classmethod
+    def close_all(cls):
+        """ Fermer toutes les sessions partagées en fin de run """
+        with cls.sessions_lock:
+            for entry in cls.sessions.values():
+                for scraper in entry["scrapers"]:
+                    scraper.close()
+            cls.sessions.clear()
 
     def isClosed(self):
         """ Cette fonction n'est pas nécessaire car nous n'ouvrons pas de navigateur """
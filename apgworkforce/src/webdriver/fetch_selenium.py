@@ -1,9 +1,9 @@
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-import os, sys, logging, time
+import os, sys, logging, time, itertools
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -11,31 +11,78 @@ load_dotenv()
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # from src.webdriver.proxy import get_proxy
 
+# DOM ready time and bytes received for the document and its sub-resources
+PAGE_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+const resources = performance.getEntriesByType('resource');
+let bytes = nav.transferSize || 0;
+for (const r of resources) { bytes += r.transferSize || 0; }
+return {
+    load_ms: (nav.loadEventEnd || nav.domContentLoadedEventEnd) - nav.startTime,
+    bytes: bytes,
+    resources: resources.length,
+};
+"""
+
+
 class Driver:
+    """
+    One Chrome instance. Drivers are no longer shared globally:
+    concurrent fetches check one out from a DriverPool (see driver_pool.py).
+    """
 
-    driver = None
     logger = logging.getLogger("webdriver")
     active_headless = True
     block_cookie = False
     n_swith_port = 10
-
-    @classmethod
-    def setup(cls, url):
+    # Délai max d'attente de la page suivante du listing (secondes)
+    page_timeout = float(os.getenv("SELENIUM_PAGE_TIMEOUT", "10"))
+    job_id_selector = "a.view-details[data-job-id]"
+    # Contenu rendu en JS par le widget JobAdder (détail d'une offre ou listing)
+    content_selector = ".ja-job-details, a.view-details[data-job-id]"
+    # Requêtes bloquées en mode léger : on ne lit que page_source
+    blocked_urls = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+        "*.css",
+        "*.mp4", "*.webm", "*.mp3", "*.m4a",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*clarity.ms*",
+        "*linkedin.com/px*", "*snap.licdn.com*", "*bing.com/bat*",
+    ]
+
+    # Cache disque Chrome conservé entre les runs, un sous-dossier par instance
+    cache_dir = os.getenv("SELENIUM_CACHE_DIR", ".chrome_cache")
+    cache_size_mb = int(os.getenv("SELENIUM_CACHE_MB", "200"))
+    slots = itertools.count()
+
+    def __init__(self, lightweight=False):
+        self.driver = None
+        # Deux Chrome ne partagent jamais le même dossier de cache
+        self.slot = next(self.slots)
+        # Pages loaded by the current Chrome process, used by the pool to recycle it
+        self.pages_loaded = 0
+        self.lightweight = lightweight
+        # Cumulated performance API metrics, kept across browser restarts
+        self.stats = {"pages": 0, "load_ms": 0.0, "bytes": 0}
+
+    def setup(self, url):
         """ Loading the browser """
-        if cls.driver != None:
+        if self.driver != None:
             return
         try:
-            cls.logger.debug("################################### SETUP ###################################")
+            self.logger.debug("################################### SETUP ###################################")
             chrome_options = webdriver.ChromeOptions()
             
             # proxy = get_proxy()
-            # cls.setting_proxy = proxy
+            # self.setting_proxy = proxy
             # if proxy:
-            #     cls.logger.debug("proxy found")
-            #     cls.logger.debug(proxy)
+            #     self.logger.debug("proxy found")
+            #     self.logger.debug(proxy)
             #     chrome_options.add_argument(f"--proxy-server={proxy}")
             # else:
-            #     cls.logger.debug("no proxy found")
+            #     self.logger.debug("no proxy found")
             
             chrome_options.add_argument("--proxy-bypass-list=<-loopback>")
             chrome_options.add_argument("--disable-features=NetworkService")  # Chrome < 114
@@ -43,9 +90,26 @@ class Driver:
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--no-sandbox")
 
-            if cls.block_cookie:
+            prefs = {}
+            if self.block_cookie:
                 chrome_options.browser_version = '125'
-                chrome_options.add_experimental_option("prefs", {"profile.default_content_setting_values.cookies": 2})
+                prefs["profile.default_content_setting_values.cookies"] = 2
+
+            if self.lightweight:
+                # N'attend pas les sous-ressources, DOM prêt suffit
+                chrome_options.page_load_strategy = "eager"
+                prefs["profile.managed_default_content_settings.images"] = 2
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+                chrome_options.add_argument("--mute-audio")
+
+            if prefs:
+                chrome_options.add_experimental_option("prefs", prefs)
+
+            if self.cache_dir:
+                cache_dir = os.path.abspath(os.path.join(self.cache_dir, str(self.slot)))
+                os.makedirs(cache_dir, exist_ok=True)
+                chrome_options.add_argument(f"--disk-cache-dir={cache_dir}")
+                chrome_options.add_argument(f"--disk-cache-size={self.cache_size_mb * 1024 * 1024}")
 
 
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
@@ -67,13 +131,13 @@ class Driver:
 
             
             # Use local Chrome WebDriver with fallback options for different environments
-            cls.logger.debug("Setting up Chrome WebDriver")
+            self.logger.debug("Setting up Chrome WebDriver")
             
             # Set Chrome binary path if available (for Nix/Replit environments)
             chrome_bin = os.getenv("CHROME_BIN")
             if chrome_bin:
                 chrome_options.binary_location = chrome_bin
-                cls.logger.debug(f"Using Chrome binary: {chrome_bin}")
+                self.logger.debug(f"Using Chrome binary: {chrome_bin}")
             
             try:
                 # Try using webdriver-manager first (works on most systems)
@@ -81,43 +145,46 @@ class Driver:
                 from webdriver_manager.chrome import ChromeDriverManager
                 
                 service = Service(ChromeDriverManager().install())
-                cls.driver = webdriver.Chrome(service=service, options=chrome_options)
-                cls.logger.debug("Chrome WebDriver setup successful with webdriver-manager")
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                self.logger.debug("Chrome WebDriver setup successful with webdriver-manager")
                 
             except Exception as e:
-                cls.logger.warning(f"webdriver-manager failed: {e}")
+                self.logger.warning(f"webdriver-manager failed: {e}")
                 
                 try:
                     # Fallback: try using system Chrome
-                    cls.driver = webdriver.Chrome(options=chrome_options)
-                    cls.logger.debug("Chrome WebDriver setup successful with system Chrome")
+                    self.driver = webdriver.Chrome(options=chrome_options)
+                    self.logger.debug("Chrome WebDriver setup successful with system Chrome")
                     
                 except Exception as e2:
-                    cls.logger.error(f"System Chrome failed: {e2}")
+                    self.logger.error(f"System Chrome failed: {e2}")
                     
                     # Try with chromedriver path from environment
                     chromedriver_path = os.getenv("CHROMEDRIVER_PATH")
                     if chromedriver_path:
                         try:
                             service = Service(chromedriver_path)
-                            cls.driver = webdriver.Chrome(service=service, options=chrome_options)
-                            cls.logger.debug("Chrome WebDriver setup successful with environment chromedriver")
+                            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                            self.logger.debug("Chrome WebDriver setup successful with environment chromedriver")
                         except Exception as e3:
-                            cls.logger.error(f"Environment chromedriver failed: {e3}")
+                            self.logger.error(f"Environment chromedriver failed: {e3}")
                     
                     # Final fallback: try with chromedriver in PATH
-                    if not cls.driver:
+                    if not self.driver:
                         try:
                             service = Service("chromedriver")
-                            cls.driver = webdriver.Chrome(service=service, options=chrome_options)
-                            cls.logger.debug("Chrome WebDriver setup successful with PATH chromedriver")
+                            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                            self.logger.debug("Chrome WebDriver setup successful with PATH chromedriver")
                         except Exception as e4:
-                            cls.logger.error(f"PATH chromedriver failed: {e4}")
+                            self.logger.error(f"PATH chromedriver failed: {e4}")
                     
-                    if not cls.driver:
+                    if not self.driver:
                         raise Exception("Could not initialize Chrome WebDriver. Please ensure Chrome and ChromeDriver are installed.")
             
 
+            if self.lightweight:
+                self.block_resources()
+
             logging.getLogger('selenium.webdriver.remote.remote_connection').setLevel(logging.WARNING)
             logging.getLogger('selenium.webdriver.common.driver_finder').setLevel(logging.WARNING)
             logging.getLogger('selenium.webdriver.common.service').setLevel(logging.WARNING)
@@ -125,88 +192,133 @@ class Driver:
             logging.getLogger('urllib3').setLevel(logging.WARNING)            
 
         except Exception as e:
-            cls.logger.error("Error while setting up the driver")
-            cls.logger.error(e)
+            self.logger.error("Error while setting up the driver")
+            self.logger.error(e)
 
-    @classmethod
-    def page_url(cls, url):
+    def page_url(self, url):
 
-        # signal.signal(signal.SIGTERM, cls.terminate_process)
-        cls.logger.debug("############################### START PAGE " + url + " ###################################")
+        # signal.signal(signal.SIGTERM, self.terminate_process)
+        self.logger.debug("############################### START PAGE " + url + " ###################################")
         
         code_html = ""
         retry = True
         n_retry = 0
-        cls.logger.debug("############################### START WHILE " + str(n_retry) + " ###################################")
+        self.logger.debug("############################### START WHILE " + str(n_retry) + " ###################################")
         while retry and 5 > n_retry:
-            cls.logger.debug("############################## RETRY " + str(n_retry) + " ###################################")
-            code_html = cls.__page(url)
-            blocked_bool = cls.check_if_page_is_blocked(code_html)
+            self.logger.debug("############################## RETRY " + str(n_retry) + " ###################################")
+            code_html = self.__page(url)
+            blocked_bool = self.check_if_page_is_blocked(code_html)
             if not blocked_bool:
                 retry = False
             else:
                 n_retry += 1
-                cls.logger.warning("driver quit in page function " + url)
-                cls._safe_quit()
-        cls.logger.debug("############################### END WHILE " + str(n_retry) + " ###################################")
+                self.logger.warning("driver quit in page function " + url)
+                self.quit()
+        self.logger.debug("############################### END WHILE " + str(n_retry) + " ###################################")
         if blocked_bool:
             raise ValueError("HTML PAGE IS EMPTY " + url)
         
-        cls.logger.debug("############################### END PAGE " + url + " ###################################")
+        self.logger.debug("############################### END PAGE " + url + " ###################################")
 
         codes_html = [code_html]
 
         #click button to go to next page
         try:
-            cls.logger.debug("Trying to find next page button")
-            wait = WebDriverWait(cls.driver, 10)  # Timeout de 10 secondes
+            self.logger.debug("Trying to find next page button")
+            wait = WebDriverWait(self.driver, 10)  # Timeout de 10 secondes
             next_button = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "next")))
     
             while next_button:
-                cls.logger.debug("Next page button found, clicking it")
+                self.logger.debug("Next page button found, clicking it")
+                old_first, old_id = self.first_job()
+                start = time.perf_counter()
                 next_button.click()
-                cls.logger.debug("Waiting for the next page to load")
-                time.sleep(5)  # Adjust wait time as needed
-                next_page_html = cls.driver.page_source
+                self.logger.debug("Waiting for the next page to load")
+                if not self.wait_for_next_results(old_first, old_id):
+                    self.logger.warning(
+                        f"Page {len(codes_html) + 1} did not change after {self.page_timeout}s, stopping"
+                    )
+                    break
+                self.logger.info(
+                    f"Listing page {len(codes_html) + 1} ready in {time.perf_counter() - start:.2f}s"
+                )
+                next_page_html = self.driver.page_source
                 codes_html.append(next_page_html)
-                next_button = cls.driver.find_element(By.CLASS_NAME, "next")
+                next_button = self.driver.find_element(By.CLASS_NAME, "next")
         except Exception as e:
-            cls.logger.warning(f"Could not find or click next page button: {e}")
+            self.logger.warning(f"Could not find or click next page button: {e}")
         
         
         return codes_html
     
-    @classmethod
-    def page(cls, url):
+    def first_job(self):
+        """ First job link of the current listing and its job id """
+        elements = self.driver.find_elements(By.CSS_SELECTOR, self.job_id_selector)
+        if not elements:
+            return None, None
+        return elements[0], elements[0].get_attribute("data-job-id")
+
+    def wait_for_next_results(self, old_first, old_id):
+        """
+        Wait until the listing has been replaced after a click on "next":
+        the old first job is detached from the DOM or the first job id changed.
+        Returns False after `page_timeout` seconds without change.
+        """
+
+        def results_changed(driver):
+            elements = driver.find_elements(By.CSS_SELECTOR, self.job_id_selector)
+            if not elements:
+                return False
+            if old_first is None:
+                return True
+            if elements[0].get_attribute("data-job-id") != old_id:
+                return True
+            try:
+                old_first.is_enabled()
+                return False
+            except StaleElementReferenceException:
+                return True
 
-        # signal.signal(signal.SIGTERM, cls.terminate_process)
-        cls.logger.debug("############################### START PAGE " + url + " ###################################")
+        try:
+            WebDriverWait(
+                self.driver,
+                self.page_timeout,
+                poll_frequency=0.1,
+                ignored_exceptions=(StaleElementReferenceException,),
+            ).until(results_changed)
+            return True
+        except TimeoutException:
+            return False
+
+    def page(self, url):
+
+        # signal.signal(signal.SIGTERM, self.terminate_process)
+        self.logger.debug("############################### START PAGE " + url + " ###################################")
         
         code_html = ""
         retry = True
         n_retry = 0
-        cls.logger.debug("############################### START WHILE " + str(n_retry) + " ###################################")
+        self.logger.debug("############################### START WHILE " + str(n_retry) + " ###################################")
         while retry and 5 > n_retry:
-            cls.logger.debug("############################## RETRY " + str(n_retry) + " ###################################")
-            code_html = cls.__page(url)
-            blocked_bool = cls.check_if_page_is_blocked(code_html)
+            self.logger.debug("############################## RETRY " + str(n_retry) + " ###################################")
+            code_html = self.__page(url)
+            blocked_bool = self.check_if_page_is_blocked(code_html)
             if not blocked_bool:
                 retry = False
             else:
                 n_retry += 1
-                cls.logger.warning("driver quit in page function " + url)
-                cls._safe_quit()
-        cls.logger.debug("############################### END WHILE " + str(n_retry) + " ###################################")
+                self.logger.warning("driver quit in page function " + url)
+                self.quit()
+        self.logger.debug("############################### END WHILE " + str(n_retry) + " ###################################")
         if blocked_bool:
             raise ValueError("HTML PAGE IS EMPTY " + url)
         
-        cls.logger.debug("############################### END PAGE " + url + " ###################################")
+        self.logger.debug("############################### END PAGE " + url + " ###################################")
 
         return code_html
 
 
-    @classmethod
-    def check_if_page_is_blocked(cls, html: str) -> bool:
+    def check_if_page_is_blocked(self, html: str) -> bool:
         """Detect if the HTML page indicates blocking or an error."""
 
         # Liste des motifs de blocage connus
@@ -221,15 +333,15 @@ class Driver:
         for pattern, explanation in known_blocking_signatures.items():
             index = html.find(pattern)
             if index != -1:
-                cls.logger.warning("Detected blocking pattern in HTML")
-                cls.logger.warning(f"Pattern: '{pattern}' — {explanation}")
+                self.logger.warning("Detected blocking pattern in HTML")
+                self.logger.warning(f"Pattern: '{pattern}' — {explanation}")
 
                 # Extrait un extrait du HTML autour du motif détecté
                 context_radius = 200
                 start = max(0, index - context_radius)
                 end = min(len(html), index + len(pattern) + context_radius)
                 snippet = html[start:end].replace('', ' ').replace('\r', ' ')
-                cls.logger.warning(f"Context snippet: [...] {snippet} [...]")
+                self.logger.warning(f"Context snippet: [...] {snippet} [...]")
 
                 return True
 
@@ -238,61 +350,103 @@ class Driver:
         actual_size = len(html)
 
         if actual_size < minimum_acceptable_size:
-            cls.logger.warning("HTML page appears too small — possible block or error")
-            cls.logger.warning(f"Page size: {actual_size} bytes (expected at least {minimum_acceptable_size})")
+            self.logger.warning("HTML page appears too small — possible block or error")
+            self.logger.warning(f"Page size: {actual_size} bytes (expected at least {minimum_acceptable_size})")
 
             # Log d’un extrait complet si possible (limité à 500 caractères max)
             preview = html[:500].replace('', ' ').replace('\r', ' ')
-            cls.logger.warning(f"HTML preview: {preview} [...]")
+            self.logger.warning(f"HTML preview: {preview} [...]")
             return True
 
         # Aucun blocage détecté
         return False
 
 
-    @classmethod
-    def __page(cls, url):
+    def __page(self, url):
         """ Loading the page and waiting until classname is present"""
         
-        if cls.driver == None or cls.isClosed():
-            cls.driver = None
-            cls.setup(url)
+        if not self.is_healthy():
+            self.quit()
+            self.setup(url)
         try:
-            cls.logger.debug("Loading page " + url)
-            cls.driver.get(url)
+            self.logger.debug("Loading page " + url)
+            self.driver.get(url)
+            self.pages_loaded += 1
+            if self.lightweight:
+                self.wait_for_content(url)
+            self.record_metrics(url)
         except Exception as e:
-            cls.logger.error(e)
-            cls.logger.warning("driver quit in __page")
-            cls._safe_quit()
+            self.logger.error(e)
+            self.logger.warning("driver quit in __page")
+            self.quit()
 
-        if cls.driver == None or cls.isClosed():
+        if not self.is_healthy():
             return ""
         else:            
-            return cls.driver.page_source
+            return self.driver.page_source
 
 
-    @classmethod
-    def isClosed(cls):
-        """ check if browser is still open"""
+    def wait_for_content(self, url):
+        """
+        In eager mode get() returns at DOMContentLoaded, before the JobAdder
+        widget has rendered: wait for the job details or the listing links.
+        """
         try:
-            cls.driver.current_url
+            WebDriverWait(self.driver, self.page_timeout, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self.content_selector))
+            )
+        except TimeoutException:
+            self.logger.warning(f"No job content rendered after {self.page_timeout}s on {url}")
+
+    def block_resources(self):
+        """ Block images, fonts, stylesheets, media and trackers through CDP """
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+            self.logger.debug(f"Blocking {len(self.blocked_urls)} URL patterns")
+        except Exception as e:
+            self.logger.warning(f"Could not block resources through CDP: {e}")
+
+    def record_metrics(self, url):
+        """ Log load time and transferred bytes of the current page from the performance API """
+        try:
+            metrics = self.driver.execute_script(PAGE_METRICS_SCRIPT)
+        except Exception as e:
+            self.logger.debug(f"No performance metrics for {url}: {e}")
+            return
+        if not metrics:
+            return
+        self.stats["pages"] += 1
+        self.stats["load_ms"] += metrics["load_ms"]
+        self.stats["bytes"] += metrics["bytes"]
+        self.logger.info(
+            f"Loaded {url} in {metrics['load_ms']:.0f} ms, "
+            f"{metrics['bytes'] / 1024:.1f} kB over {metrics['resources']} resources"
+            f"{' (lightweight)' if self.lightweight else ''}"
+        )
+
+    def is_healthy(self):
+        """ check if the browser is started and still answering """
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return len(self.driver.window_handles) > 0
+        except Exception:
             return False
-        except:
-            return True
 
-    @classmethod
-    def terminate_process(cls, signum=None, frame=None):
-        cls.logger.info("TERMINATE PROCESSUS SELENIUM")
-        if cls.driver:
-            cls.driver.quit()
+    def terminate_process(self, signum=None, frame=None):
+        self.logger.info("TERMINATE PROCESSUS SELENIUM")
+        self.quit()
         sys.exit(0)
 
-    @classmethod
-    def _safe_quit(cls):
-        if cls.driver:
+    def quit(self):
+        """ Close the browser if any; the next page load starts a fresh one """
+        if self.driver:
             try:
-                cls.logger.warning("driver quit in _safe_quit")
-                cls.driver.quit()
+                self.logger.debug("driver quit")
+                self.driver.quit()
             except Exception as e:
-                cls.logger.warning("Erreur lors de la fermeture du driver: " + str(e))
-
+                self.logger.warning("Erreur lors de la fermeture du driver: " + str(e))
+        self.driver = None
+        self.pages_loaded = 0
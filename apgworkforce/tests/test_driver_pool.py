@@ -0,0 +1,93 @@
+import queue
+import threading
+
+import pytest
+
+from src.webdriver.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """ Stand-in for fetch_selenium.Driver, without Chrome """
+
+    def __init__(self):
+        self.driver = None
+        self.pages_loaded = 0
+        self.healthy = True
+        self.quits = 0
+        self.stats = {"pages": 0, "load_ms": 0.0, "bytes": 0}
+
+    def load(self):
+        self.driver = object()
+        self.pages_loaded += 1
+        self.stats["pages"] += 1
+        self.stats["load_ms"] += 100
+        self.stats["bytes"] += 2048
+
+    def is_healthy(self):
+        return self.healthy
+
+    def quit(self):
+        self.quits += 1
+        self.driver = None
+        self.pages_loaded = 0
+
+
+def test_each_worker_gets_its_own_driver():
+    pool = DriverPool(size=2, max_pages=10, driver_factory=FakeDriver)
+    in_use = []
+    barrier = threading.Barrier(2)
+
+    def work():
+        with pool.driver(timeout=1) as driver:
+            in_use.append(driver)
+            barrier.wait(timeout=1)
+
+    threads = [threading.Thread(target=work) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(map(id, in_use))) == 2
+    # Pool vide : checkout attend puis abandonne
+    first, second = pool.checkout(), pool.checkout()
+    with pytest.raises(queue.Empty):
+        pool.checkout(timeout=0.01)
+    pool.checkin(first)
+    pool.checkin(second)
+
+
+def test_drivers_are_recycled_after_max_pages():
+    pool = DriverPool(size=1, max_pages=2, driver_factory=FakeDriver)
+    for _ in range(2):
+        with pool.driver() as driver:
+            driver.load()
+    assert driver.quits == 0
+
+    with pool.driver() as recycled:
+        assert recycled is driver and recycled.quits == 1 and recycled.pages_loaded == 0
+
+
+def test_unhealthy_driver_is_quit_on_checkin():
+    pool = DriverPool(size=1, max_pages=10, driver_factory=FakeDriver)
+    with pool.driver() as driver:
+        driver.load()
+        driver.healthy = False
+    assert driver.quits == 1 and driver.driver is None
+
+    # Navigateur jamais démarré : pas de health check
+    with pool.driver() as driver:
+        pass
+    assert driver.quits == 1
+
+
+def test_close_reports_and_quits_every_driver(caplog):
+    pool = DriverPool(size=2, max_pages=10, driver_factory=FakeDriver)
+    with pool.driver() as driver:
+        driver.load()
+
+    with caplog.at_level("INFO", logger="webdriver"):
+        pool.close()
+
+    assert "1 pages loaded, avg 100 ms and 2.0 kB per page" in caplog.text
+    assert [driver.quits for driver in pool._drivers] == [1, 1]
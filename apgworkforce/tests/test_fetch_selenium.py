@@ -0,0 +1,132 @@
+import pytest
+import webdriver_manager.chrome
+from selenium.common.exceptions import StaleElementReferenceException
+
+from src.webdriver import fetch_selenium
+from src.webdriver.fetch_selenium import Driver
+
+
+class FakeElement:
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.stale = False
+
+    def get_attribute(self, name):
+        if self.stale:
+            raise StaleElementReferenceException()
+        return self.job_id
+
+    def is_enabled(self):
+        if self.stale:
+            raise StaleElementReferenceException()
+        return True
+
+
+class FakeWebDriver:
+    """ Listing whose job links are swapped after `polls` lookups """
+
+    def __init__(self, before, after, polls=3):
+        self.before = before
+        self.after = after
+        self.polls = polls
+        self.lookups = 0
+
+    def find_elements(self, by, selector):
+        self.lookups += 1
+        return self.before if self.lookups <= self.polls else self.after
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    monkeypatch.setattr(Driver, "page_timeout", 0.5)
+    return Driver()
+
+
+def test_next_results_detected_when_the_first_job_id_changes(driver):
+    old = FakeElement("1")
+    driver.driver = FakeWebDriver([old], [FakeElement("2")])
+    assert driver.first_job() == (old, "1")
+
+    assert driver.wait_for_next_results(old, "1") is True
+    assert driver.driver.lookups > 3
+
+
+def test_next_results_detected_when_the_old_first_job_is_detached(driver):
+    old = FakeElement("1")
+    # Même id sur la nouvelle page : seul le détachement de l'ancien élément compte
+    driver.driver = FakeWebDriver([old], [FakeElement("1")], polls=1)
+    old.stale = True
+
+    assert driver.wait_for_next_results(old, "1") is True
+
+
+def test_unchanged_listing_times_out(driver):
+    old = FakeElement("1")
+    driver.driver = FakeWebDriver([old], [old], polls=0)
+
+    assert driver.wait_for_next_results(old, "1") is False
+
+
+def test_empty_listing_is_not_ready(driver):
+    driver.driver = FakeWebDriver([], [], polls=0)
+
+    assert driver.first_job() == (None, None)
+    assert driver.wait_for_next_results(None, None) is False
+
+
+class FakeChrome:
+    """ Records the options and CDP commands instead of starting Chrome """
+
+    def __init__(self, service=None, options=None):
+        self.options = options
+        self.cdp = []
+        self.metrics = {"load_ms": 120.0, "bytes": 4096, "resources": 3}
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+
+    def execute_script(self, script):
+        return self.metrics
+
+
+@pytest.fixture
+def chrome(monkeypatch, tmp_path):
+    monkeypatch.setattr(fetch_selenium.webdriver, "Chrome", FakeChrome)
+    monkeypatch.setattr(
+        webdriver_manager.chrome.ChromeDriverManager, "install", lambda self: "chromedriver"
+    )
+    monkeypatch.setattr(Driver, "cache_dir", str(tmp_path))
+
+
+def test_lightweight_profile_blocks_images_and_heavy_resources(chrome):
+    driver = Driver(lightweight=True)
+    driver.setup("https://example.com")
+
+    options = driver.driver.options
+    assert options.page_load_strategy == "eager"
+    assert options.experimental_options["prefs"]["profile.managed_default_content_settings.images"] == 2
+    assert "--blink-settings=imagesEnabled=false" in options.arguments
+    assert driver.driver.cdp == [
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": Driver.blocked_urls}),
+    ]
+    assert any(arg.startswith("--disk-cache-dir=") for arg in options.arguments)
+
+
+def test_default_profile_loads_every_resource(chrome):
+    driver = Driver()
+    driver.setup("https://example.com")
+
+    options = driver.driver.options
+    assert options.page_load_strategy == "normal"
+    assert "prefs" not in options.experimental_options
+    assert driver.driver.cdp == []
+
+
+def test_page_metrics_are_accumulated(chrome):
+    driver = Driver(lightweight=True)
+    driver.setup("https://example.com")
+    driver.record_metrics("https://example.com/a")
+    driver.record_metrics("https://example.com/b")
+
+    assert driver.stats == {"pages": 2, "load_ms": 240.0, "bytes": 8192}
@@ -0,0 +1,23 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.parser.html_job_parser import html_job_parser
+from src.parser.html_url_parser import html_url_parser
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# Résultats de l'ancien parser BeautifulSoup (benchmarks/legacy_*) sur les mêmes pages
+EXPECTED = json.loads((FIXTURES / "expected.json").read_text(encoding="utf-8"))
+JOB_PAGES = sorted(name for name in EXPECTED if name.startswith("job_page_"))
+
+
+@pytest.mark.parametrize("name", JOB_PAGES)
+def test_job_page_matches_beautifulsoup(name):
+    job = html_job_parser((FIXTURES / name).read_text(encoding="utf-8"), "https://example.com/job")
+    assert {field: getattr(job, field) for field in EXPECTED[name]} == EXPECTED[name]
+
+
+def test_listing_page_matches_beautifulsoup():
+    urls = html_url_parser((FIXTURES / "listing_page.html").read_text(encoding="utf-8"))
+    assert [item["url"] for item in urls] == EXPECTED["listing_page.html"]
@@ -1,42 +1,55 @@
-import os, sys, logging, re
-from bs4 import BeautifulSoup
+import logging
 from src.models.job import Job
+from src.parser.html_tree import parse_html, xpath, has_class, first, get_text, scan_metadata
 from datetime import date
 
 
+# Sélecteurs compilés une fois pour le site
+TITLE = xpath("//h1")
+DESCRIPTION = xpath(f"//div[{has_class('job-ad-body')}]")
+# Paragraphes de métadonnées <p class="job-...">, lus en une passe
+META_CLASSES = ("job-location", "job-type", "job-closing", "job-category")
+META = xpath("//p[" + " or ".join(has_class(name) for name in META_CLASSES) + "]")
+# Boutons et liens retirés du texte de la description
+DESCRIPTION_SKIP = ("button", "a", "iframe")
+
 
 def html_job_parser(html_content, url):
-    logger = logging.getLogger("HtmlParserUrl")    
-    soup = BeautifulSoup(str(html_content), 'html.parser')
+    logger = logging.getLogger("HtmlParserUrl")
+    tree = parse_html(html_content)
     # title description state suburb job_type salary duration start_date
-
-    title = find_title(soup, logger)
-    description = find_description(soup, logger)
-    state = find_state(soup, logger)
-    suburb = find_suburb(soup, logger)
-    job_type = find_job_type(soup, logger)
-    salary = find_salary(soup, logger)
-    duration = find_duration(soup, logger)
-    start_date = find_start_date(soup, logger)
     job = Job(
-        title=title,
-        description=description,
-        state=state,
-        suburb=suburb,
-        job_type=job_type,
-        salary=salary,
-        duration=duration,
-        start_date=start_date,
+        **extract_fields(tree, logger),
         created_at=date.today().isoformat(),
         url=url
     )
     return job
 
 
+def extract_fields(tree, logger):
+    """ Every job field from one parsed document """
+    meta = scan_metadata(META(tree), key=meta_class)
+    return {
+        "title": find_title(tree, logger),
+        "description": find_description(tree, logger),
+        "state": find_state(tree, logger),
+        "suburb": find_suburb(meta, logger),
+        "job_type": find_job_type(meta, logger),
+        "salary": find_salary(tree, logger),
+        "duration": find_duration(tree, logger),
+        "start_date": find_start_date(meta, logger),
+    }
+
+
+def meta_class(element):
+    """ The job-* class of a metadata paragraph """
+    classes = (element.get("class") or "").split()
+    return next((name for name in classes if name in META_CLASSES), None)
 
-def find_title(soup, logger):
+
+def find_title(tree, logger):
     try:
-        title = soup.find("h1").get_text().strip().split("-")[0].strip()
+        title = get_text(first(TITLE(tree))).strip().split("-")[0].strip()
     except Exception as e:
         logger.warning(f"Error finding title: {str(e)}")
         title = None
@@ -44,21 +57,18 @@ def find_title(soup, logger):
         return title
 
 
-def find_description(soup, logger):
+def find_description(tree, logger):
     try:
-        description_with_buttons = soup.find("div", class_="job-ad-body")
-        # Remove buttons and other non-description text
-        for tag in description_with_buttons.find_all(["button", "a", "iframe"]):
-            tag.decompose()
-
-        description = description_with_buttons.get_text(separator="\n", strip=True)
+        description = get_text(
+            first(DESCRIPTION(tree)), separator="\n", strip=True, skip=DESCRIPTION_SKIP
+        )
     except Exception as e:
         logger.warning(f"Error finding description: {str(e)}")
         description = None
     finally:
         return description
 
-def find_state(soup, logger):
+def find_state(tree, logger):
     try:
         state = None
     except Exception as e:
@@ -67,25 +77,25 @@ def find_state(soup, logger):
     finally:
         return state
 
-def find_suburb(soup, logger):
+def find_suburb(meta, logger):
     try:
-        suburb = soup.find("p", class_="job-location").get_text().strip().split(":")[1].strip()
+        suburb = meta["job-location"].strip().split(":")[1].strip()
     except Exception as e:
         logger.warning(f"Error finding suburb: {str(e)}")
         suburb = None
     finally:
-        return suburb         
+        return suburb
 
-def find_job_type(soup, logger):
+def find_job_type(meta, logger):
     try:
-        job_type = soup.find("p", class_="job-type").get_text().strip().strip()
+        job_type = meta["job-type"].strip()
     except Exception as e:
         logger.warning(f"Error finding job_type: {str(e)}")
         job_type = None
     finally:
         return job_type
 
-def find_salary(soup, logger):
+def find_salary(tree, logger):
     try:
         salary = None
     except Exception as e:
@@ -94,7 +104,7 @@ def find_salary(soup, logger):
     finally:
         return salary
 
-def find_duration(soup, logger):
+def find_duration(tree, logger):
     try:
         duration = None
     except Exception as e:
@@ -103,20 +113,20 @@ def find_duration(soup, logger):
     finally:
         return duration
 
-def find_start_date(soup, logger):
+def find_start_date(meta, logger):
     try:
-        title = soup.find("p", class_="job-closing").get_text().strip().split(":")[1].strip()
+        title = meta["job-closing"].strip().split(":")[1].strip()
     except Exception as e:
         logger.warning(f"Error finding title: {str(e)}")
         title = None
     finally:
         return title
-    
-def find_category(soup, logger):
+
+def find_category(meta, logger):
     try:
-        category = soup.find("p", class_="job-category").get_text().strip().split(":")[1].strip()
+        category = meta["job-category"].strip().split(":")[1].strip()
     except Exception as e:
         logger.warning(f"Error finding category: {str(e)}")
         category = None
     finally:
-        return category
\ No newline at end of file
+        return category
@@ -0,0 +1,124 @@
+from functools import lru_cache
+from lxml import etree
+from lxml import html as lxml_html
+
+
+UTF8_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# Comme BeautifulSoup.get_text(), le texte des script/style/template est ignoré
+HIDDEN_TAGS = ("script", "style", "template")
+# BeautifulSoup réduit une chaîne faite seulement d'espaces ASCII (l'indentation
+# entre balises) à "\n" ou " ", sauf dans pre/textarea
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+PRESERVE_WHITESPACE_TAGS = ("pre", "textarea")
+HAS_PRESERVED_WHITESPACE = etree.XPath(
+    "boolean(ancestor-or-self::pre or ancestor-or-self::textarea or .//pre or .//textarea)"
+)
+
+
+def parse_html(html_content):
+    """ Parse a page once into an lxml document; empty input gives an empty document """
+    if not html_content:
+        return lxml_html.document_fromstring("<html></html>")
+    try:
+        return lxml_html.document_fromstring(html_content)
+    except ValueError:
+        # Chaîne unicode avec déclaration d'encodage XML
+        return lxml_html.document_fromstring(html_content.encode("utf-8"), parser=UTF8_PARSER)
+
+
+def xpath(expression):
+    """ Precompiled XPath returning plain strings """
+    return etree.XPath(expression, smart_strings=False)
+
+
+def has_class(name):
+    """ XPath predicate matching one token of the class attribute, like class_= in bs4 """
+    # contains(@class) d'abord : évite le concat sur les éléments sans rapport
+    return f"(contains(@class, '{name}') and contains(concat(' ', normalize-space(@class), ' '), ' {name} '))"
+
+
+def first(elements):
+    return elements[0] if elements else None
+
+
+@lru_cache(maxsize=None)
+def text_xpath(skip=(), smart_strings=False):
+    """ Text nodes under an element, leaving out those inside HIDDEN_TAGS and `skip` """
+    excluded = " or ".join(f"ancestor::{tag}" for tag in HIDDEN_TAGS + tuple(skip))
+    return etree.XPath(f".//text()[not({excluded})]", smart_strings=smart_strings)
+
+
+def collapse_whitespace(text):
+    """ BeautifulSoup's reading of a string: whitespace only becomes "\n" or " " """
+    if text.strip(ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def preserves_whitespace(text):
+    """ Whether a smart string from lxml sits inside <pre> or <textarea> """
+    parent = text.getparent()
+    if text.is_tail:
+        parent = parent.getparent()
+    while parent is not None:
+        if parent.tag in PRESERVE_WHITESPACE_TAGS:
+            return True
+        parent = parent.getparent()
+    return False
+
+
+def get_text(element, separator="", strip=False, skip=()):
+    """
+    Text of an element with BeautifulSoup's get_text(separator, strip) semantics,
+    as parsed by bs4 (whitespace-only strings collapsed).
+    Text inside the `skip` tags is left out, instead of decomposing them.
+    """
+    if strip:
+        strings = [text.strip() for text in text_xpath(tuple(skip))(element)]
+        return separator.join(text for text in strings if text)
+    if not HAS_PRESERVED_WHITESPACE(element):
+        strings = [collapse_whitespace(text) for text in text_xpath(tuple(skip))(element)]
+    else:
+        strings = [
+            text if preserves_whitespace(text) else collapse_whitespace(text)
+            for text in text_xpath(tuple(skip), smart_strings=True)(element)
+        ]
+    return separator.join(strings)
+
+
+def string_of(element):
+    """
+    bs4 `.string`: the text of an element whose only child is a string,
+    following single-element chains like <li><b>text</b></li>; None otherwise.
+    """
+    while True:
+        if len(element) == 0:
+            return element.text
+        if len(element) > 1 or element.text:
+            return None
+        child = element[0]
+        if child.tail or not isinstance(child.tag, str):
+            return None
+        element = child
+
+
+def scan_metadata(elements, key=None, markers=()):
+    """
+    Read metadata elements (<li>, <p class="job-...">) in one pass into a dict.
+    With `key(element)`, each element is stored under its key with its text, first wins.
+    With `markers`, the first element whose `.string` contains a marker is stored under it.
+    """
+    found = {}
+    for element in elements:
+        if key is not None:
+            name = key(element)
+            if name is not None and name not in found:
+                found[name] = get_text(element)
+        if markers:
+            text = string_of(element)
+            if text:
+                for marker in markers:
+                    if marker not in found and marker in text:
+                        found[marker] = text
+    return found
@@ -1,35 +1,47 @@
-import os, sys, logging, re
-from bs4 import BeautifulSoup
+import logging
+from src.parser.html_tree import parse_html, xpath, has_class
+from src.parser.urls import normalize_url, unique_urls
 
-def html_url_parser(html_content):
+# Version du résultat de parse_listing, mémoïsé dans le cache HTTP :
+# à incrémenter à chaque changement de ce qu'il renvoie
+PARSE_VERSION = 1
 
-    logger = logging.getLogger("HtmlParserUrl")
-    try:
-        soup = BeautifulSoup(str(html_content), 'html.parser')
-        list_a = soup.find_all("a", class_="btn-info")
-        urls = list()
-        for a in list_a:
-            url = "https://costagroup.currentjobs.co" + a.get('href')
+# Liens des offres sur une page de listing, compilé une fois
+JOB_LINKS = xpath(f"//a[{has_class('btn-info')}]/@href")
+BASE_URL = "https://costagroup.currentjobs.co"
 
-            if is_valid_url(url):
-                urls.append({"url": url})
+# Pagination : lien "suivant" (rel=next, WordPress .next, PagedList) et bloc de pagination
+NEXT_PAGE = xpath(
+    f"//a[@rel='next'] | //link[@rel='next'] | //a[{has_class('next')}]"
+    f" | //li[{has_class('PagedList-skipToNext')}]//a"
+)
+PAGINATION = xpath(
+    f"//*[{has_class('pagination')} or {has_class('page-numbers')}"
+    f" or {has_class('pagination-container')}]"
+)
 
-    except Exception as e:
-        logger.warning(str(e))
-        urls = []
-    return urls
 
-def is_valid_url(url):
-    """ regex check to valid if url is a real url """
-    # Expression régulière pour vérifier les URL
+def html_url_parser(html_content):
+    return parse_listing(html_content)[0]
+
+
+def parse_listing(html_content):
+    """
+    Job URLs of a listing page and whether another page follows:
+    True/False when the page has pagination markup, None when it cannot tell.
+    """
+    logger = logging.getLogger("HtmlParserUrl")
     try:
-        regex = re.compile(
-            r'^(https?://)?'  # supporte http et https
-            r'([a-zA-Z0-9-]+(\.[a-zA-Z0-9-]+)+)'  # domaine
-            r'(:\d+)?'  # port (optionnel)
-            r'(/.*)?$'  # chemin (optionnel)
-        )
-        return re.match(regex, url) is not None
+        tree = parse_html(html_content)
+        hrefs = JOB_LINKS(tree)
+        urls = unique_urls(normalize_url(href, base=BASE_URL) for href in hrefs)
+        if NEXT_PAGE(tree):
+            has_next = True
+        elif PAGINATION(tree):
+            has_next = False
+        else:
+            has_next = None
     except Exception as e:
-        logging.getLogger("HtmlParserUrl").warning(f"Error validating URL: {str(e)}")
-        return False
+        logger.warning(str(e))
+        urls, has_next = [], None
+    return urls, has_next
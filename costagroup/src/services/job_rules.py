@@ -0,0 +1,106 @@
+import re
+
+# Mêmes listes que dans le prompt de openai_service
+REQUIRED_KEYWORDS = [
+    "No experience", "Warehouse", "Cleaning", "Cleaner", "Labourer", "Pick", "Packer",
+    "Process worker", "Factory", "Traffic controller", "Kitchen hand", "Unskilled",
+    "General hand", "Farm hand", "Picking", "Fruit picking", "Grower", "Packing",
+    "Roadhouse", "Housekeeping", "Hospitality",
+]
+
+EXCLUSION_KEYWORDS = ["Senior", "Experienced", "Manager", "Managers", "Director", "Supervisor"]
+
+MAX_HOURLY_RATE = 60
+MAX_ANNUAL_SALARY = 80000
+ACCEPTED_HOURLY_RATE = 35
+
+
+def keyword_regex(keywords):
+    """ One compiled alternation for the whole list, longest keywords first, plural allowed """
+    alternatives = sorted(keywords, key=len, reverse=True)
+    pattern = "|".join(re.escape(keyword).replace(r"\ ", r"\s+") for keyword in alternatives)
+    return re.compile(rf"\b(?:{pattern})s?\b", re.IGNORECASE)
+
+
+REQUIRED_REGEX = keyword_regex(REQUIRED_KEYWORDS)
+EXCLUSION_REGEX = keyword_regex(EXCLUSION_KEYWORDS)
+
+AMOUNT_REGEX = re.compile(r"\$\s*(\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)\s*(k\b)?", re.IGNORECASE)
+HOURLY_REGEX = re.compile(r"per\s+hour|an\s+hour|hourly|p/?h\b|/\s*h(?:ou)?r\b", re.IGNORECASE)
+ANNUAL_REGEX = re.compile(
+    r"per\s+(?:year|annum)|annual|p\.?a\.?(?:\W|$)|/\s*y(?:ea)?r\b|package", re.IGNORECASE
+)
+# Montant (ou fourchette) suivi d'une autre période que l'heure ou l'année :
+# taux à la journée, à la semaine, au poste ou à la pièce, laissés au modèle
+RATE_PATTERN = r"\$\s*\d[\d,]*(?:\.\d+)?\s*k?"
+OTHER_PERIOD_REGEX = re.compile(
+    rf"{RATE_PATTERN}(?:\s*(?:-|–|to)\s*\$?\s*\d[\d,]*(?:\.\d+)?\s*k?)?\s*"
+    r"(?:(?:(?:per|a|an|each)\s+|/\s*)(?:day|week|wk|fortnight|month|shift|bin|bucket|piece|kg|kilo)s?\b"
+    r"|(?:daily|weekly|fortnightly|monthly)\b|p\.?[dw]\b)",
+    re.IGNORECASE,
+)
+
+
+def parse_salary(text):
+    """
+    Parse a salary label such as "$30 - $32 per hour" or "$70,000 - $80k p.a.".
+
+    Daily, weekly, monthly, per-shift and piece rates are not converted, and
+    an amount without any period marker is only read as a plausible hourly
+    rate or an annual salary.
+
+    Returns:
+        tuple: ("hourly" | "annual", [amounts]) or (None, []) when it can't be read.
+    """
+    if not text or OTHER_PERIOD_REGEX.search(text):
+        return None, []
+    amounts = []
+    for number, thousands in AMOUNT_REGEX.findall(text):
+        amount = float(number.replace(",", ""))
+        amounts.append(amount * 1000 if thousands else amount)
+    if not amounts:
+        return None, []
+
+    if HOURLY_REGEX.search(text):
+        period = "hourly"
+    elif ANNUAL_REGEX.search(text):
+        period = "annual"
+    elif max(amounts) <= MAX_HOURLY_RATE:
+        period = "hourly"
+    elif min(amounts) >= 20000:
+        period = "annual"
+    else:
+        return None, []
+    return period, amounts
+
+
+def classify_job(title, salary, description):
+    """
+    Apply the hard rules of the prompt locally.
+
+    Returns "yes" or "no" when the rules settle the job, None when it is
+    ambiguous and has to be sent to the model.
+    """
+    title = title or ""
+    description = description or ""
+
+    # 1. Exclusions : un refus certain (salaire trop haut, mot exclu dans le titre)
+    period, amounts = parse_salary(salary)
+    if period == "hourly" and min(amounts) > MAX_HOURLY_RATE:
+        return "no"
+    if period == "annual" and min(amounts) > MAX_ANNUAL_SALARY:
+        return "no"
+    if EXCLUSION_REGEX.search(title):
+        return "no"
+    # Un mot exclu dans la description ("reporting to the Manager") ne suffit
+    # pas à refuser, mais interdit tout "yes" local : le modèle tranche
+    if EXCLUSION_REGEX.search(description):
+        return None
+
+    # 2. Acceptations : taux horaire bas ou mot-clé requis dans le titre.
+    # Un mot-clé seul dans la description ("pick you up") reste au modèle.
+    if period == "hourly" and max(amounts) < ACCEPTED_HOURLY_RATE:
+        return "yes"
+    if REQUIRED_REGEX.search(title):
+        return "yes"
+    return None
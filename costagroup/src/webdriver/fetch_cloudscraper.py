@@ -1,8 +1,15 @@
 import cloudscraper
-import requests
+from requests.adapters import HTTPAdapter
 import logging
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
 from dotenv import load_dotenv  # Utilisé si vous utilisez un fichier .env
 from src.webdriver.proxy import get_proxy
+from src.webdriver.http_cache import HttpCache
+from src.webdriver.retry_policy import RetryPolicy, OK, FATAL
 
 # Charger les variables d'environnement depuis un fichier .env (optionnel)
 load_dotenv()
@@ -11,6 +18,17 @@ class Driver:
 
     logger = logging.getLogger("webdriver")
 
+    # Par hôte pendant tout le run : un scraper par thread (requests.Session et l'état
+    # des challenges de cloudscraper ne sont pas thread-safe), clonés du premier
+    # scraper qui a passé Cloudflare (keep-alive + cookies)
+    sessions = {}
+    sessions_lock = threading.Lock()
+    pool_size = int(os.getenv("HTTP_POOL_SIZE", "10"))
+    # Cache disque des réponses (ETag/Last-Modified), None si HTTP_CACHE=0
+    cache = HttpCache.from_env()
+    # Backoff, disjoncteur par hôte et budget de retries communs à tout le run
+    retry_policy = RetryPolicy()
+
     def __init__(self):
         self.setup()
 
@@ -30,30 +48,209 @@ class Driver:
 
         self.proxies = proxies
 
+    @classmethod
+    def new_scraper(cls, template=None):
+        """ CloudScraper keeping pool_size connections per host, cloned from `template` if given """
+        scraper = cloudscraper.create_scraper(cipherSuite=template.cipherSuite if template else None)
+        if template is not None:
+            # Même User-Agent et mêmes cookies (cf_clearance est lié au User-Agent)
+            scraper.headers.update(template.headers)
+            scraper.cookies.update(template.cookies)
+        scraper.mount("https://", cloudscraper.CipherSuiteAdapter(
+            cipherSuite=scraper.cipherSuite,
+            ecdhCurve=scraper.ecdhCurve,
+            server_hostname=scraper.server_hostname,
+            source_address=scraper.source_address,
+            pool_connections=cls.pool_size,
+            pool_maxsize=cls.pool_size,
+        ))
+        scraper.mount("http://", HTTPAdapter(pool_connections=cls.pool_size, pool_maxsize=cls.pool_size))
+        return scraper
+
+    @classmethod
+    def session(cls, url):
+        """ Host entry: warm scraper, every scraper opened and the per-thread scrapers """
+        host = urlsplit(url).netloc.lower()
+        with cls.sessions_lock:
+            entry = cls.sessions.get(host)
+            if entry is None:
+                entry = {"lock": threading.Lock(), "warm": None, "scrapers": [], "local": threading.local()}
+                cls.sessions[host] = entry
+                cls.logger.debug(f"New pooled session for {host}")
+            return entry
+
+    @classmethod
+    def get(cls, url, **kwargs):
+        entry = cls.session(url)
+        scraper = getattr(entry["local"], "scraper", None)
+        if scraper is not None:
+            return scraper.get(url, **kwargs)
+        with entry["lock"]:
+            if entry["warm"] is None:
+                # The first request may solve a Cloudflare challenge: let it finish alone
+                # so that the other threads start from the resulting cookies.
+                scraper = cls.new_scraper()
+                entry["scrapers"].append(scraper)
+                response = scraper.get(url, **kwargs)
+                if response.ok:
+                    entry["warm"] = scraper
+                    entry["local"].scraper = scraper
+                return response
+            scraper = cls.new_scraper(entry["warm"])
+            entry["scrapers"].append(scraper)
+        entry["local"].scraper = scraper
+        return scraper.get(url, **kwargs)
+
     def page(self, url):
         """ Charger la page en utilisant le proxy avec 3 tentatives """
-        max_retries = 5
-        for attempt in range(1, max_retries + 1):
+        return self.fetch(url)[0]
+
+    def page_parsed(self, url, parse):
+        """
+        parse(page(url)), reusing the result memoised in the HTTP cache while the
+        page is unchanged (fresh or 304): neither downloaded nor parsed again.
+        Memoised results are only reused for the same PARSE_VERSION of the
+        parser's module. Returns None if the page could not be fetched.
+        """
+        text, entry, unchanged = self.fetch(url)
+        if text is None:
+            return None
+        name = f"{parse.__module__}.{parse.__name__}"
+        version = getattr(sys.modules.get(parse.__module__), "PARSE_VERSION", None)
+        if unchanged:
+            result = self.cache.parsed(entry, name, version)
+            if result is not None:
+                return result
+        result = parse(text)
+        if entry is not None:
+            self.cache.store_parsed(entry, name, version, result)
+        return result
+
+    def fetch(self, url, conditional=True):
+        """
+        (text, cache entry, unchanged) for `url`. `unchanged` is True when the body
+        comes from the cache, either still fresh or confirmed by a 304.
+        With conditional=False the cached entry is ignored and the page downloaded.
+        """
+        entry = self.cache.lookup(url) if self.cache and conditional else None
+        if entry is not None and self.cache.is_fresh(entry):
+            text = self.cache.body(entry)
+            if text is not None:
+                self.cache.served_fresh(entry)
+                return text, entry, True
+            entry = None
+        headers = self.cache.conditional_headers(entry) if self.cache else {}
+
+        policy = self.retry_policy
+        host = urlsplit(url).netloc.lower()
+        for attempt in range(1, policy.max_attempts + 1):
+            wait, reason = policy.breaker.state(host)
+            if reason == "failing":
+                self.logger.error(f"Circuit ouvert pour {host} ({wait:.0f}s), abandon de {url}")
+                return None, None, False
+            if wait > 0:
+                time.sleep(wait)
+
             # self.configure_proxy(url)
-            scraper = cloudscraper.create_scraper()
+            response, error = None, None
             try:
                 self.logger.debug(f"Tentative {attempt} - URL: {url} ")
                 # self.logger.debug(f"Tentative {attempt} - URL: {url} via proxies: {self.proxies}")
-                response = scraper.get(
+                response = self.get(
                     url,
                     # proxies=self.proxies,
+                    headers=headers,
                     timeout=60
                 )
-                response.raise_for_status()
-                return response.text
-            except (requests.exceptions.RequestException) as e:
-                self.logger.warning(f"Tentative {attempt} échouée : {e}")
-                if attempt == max_retries:
-                    self.logger.error(f"Échec après {max_retries} tentatives.")
-                    return None
-            finally:
-                scraper.close()  # 🧹 Nettoyage mémoire
+            except Exception as e:
+                error = e
+
+            verdict = policy.classify(response, error)
+            if verdict == OK:
+                policy.breaker.success(host)
+                if response.status_code == 304 and entry is not None:
+                    text = self.cache.body(entry)
+                    if text is None:
+                        # Corps évincé depuis le lookup : rien à revalider, on retélécharge
+                        self.logger.debug(f"Cached body gone after 304, refetching {url}")
+                        return self.fetch(url, conditional=False)
+                    self.cache.revalidated(entry)
+                    return text, entry, True
+                stored = self.cache.store(url, response) if self.cache else None
+                return response.text, stored, False
+
+            failure = error or f"HTTP {response.status_code}"
+            if verdict == FATAL:
+                self.logger.error(f"Tentative {attempt} échouée, erreur définitive : {failure}")
+                return None, None, False
+
+            retry_after = policy.retry_after(response)
+            if retry_after is not None:
+                # Limitation de débit : l'hôte est en pause, pas en panne
+                policy.breaker.block(host, retry_after)
+            else:
+                policy.breaker.failure(host)
+            if policy.breaker.state(host)[1] == "failing":
+                self.logger.error(f"Circuit ouvert pour {host} après : {failure}, abandon de {url}")
+                return None, None, False
+            if attempt == policy.max_attempts:
+                self.logger.error(f"Échec après {policy.max_attempts} tentatives : {failure}")
+                return None, None, False
+            if not policy.budget.take():
+                self.logger.error(f"Budget de retries du run épuisé, abandon de {url} : {failure}")
+                return None, None, False
+            delay = retry_after if retry_after is not None else policy.backoff(attempt)
+            self.logger.warning(
+                f"Tentative {attempt} échouée : {failure}, nouvel essai dans {delay:.1f}s"
+            )
+            if retry_after is None:
+                time.sleep(delay)
+
+    @classmethod
+    def connection_stats(cls):
+        """ Requests sent and connections opened per host since the start of the run """
+        stats = {}
+        with cls.sessions_lock:
+            entries = list(cls.sessions.items())
+        for host, entry in entries:
+            requests_count, connections = 0, 0
+            with entry["lock"]:
+                adapters = [adapter for scraper in entry["scrapers"] for adapter in scraper.adapters.values()]
+            for adapter in adapters:
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    requests_count += pool.num_requests
+                    connections += pool.num_connections
+            stats[host] = {
+                "requests": requests_count,
+                "connections": connections,
+                "reused": max(0, requests_count - connections),
+            }
+        return stats
+
+    @classmethod
+    def report(cls):
+        """ Log connection reuse and cache hits for the run """
+        if cls.cache:
+            cls.cache.report()
+        cls.retry_policy.report()
+        for host, stats in cls.connection_stats().items():
+            cls.logger.info(
+                f"{host}: {stats['requests']} requests, {stats['connections']} connections opened, "
+                f"{stats['reused']} reused"
+            )
 
+    @classmethod
+    def close_all(cls):
+        """ Fermer toutes les sessions partagées en fin de run """
+        with cls.sessions_lock:
+            for entry in cls.sessions.values():
+                for scraper in entry["scrapers"]:
+                    scraper.close()
+            cls.sessions.clear()
 
     def isClosed(self):
         """ Cette fonction n'est pas nécessaire car nous n'ouvrons pas de navigateur """
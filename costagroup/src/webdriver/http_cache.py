@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class HttpCache:
+    """
+    On-disk HTTP response cache keyed by URL.
+
+    Each entry is a `<sha1>.body` file plus a `<sha1>.json` metadata file holding
+    the ETag/Last-Modified validators, the store time and memoised parse results
+    (tagged with the parser's PARSE_VERSION).
+    Entries younger than their host TTL are served without any request; older ones
+    are revalidated with If-None-Match/If-Modified-Since. The least recently used
+    entries are evicted once the cache grows over `max_bytes`.
+    """
+
+    logger = logging.getLogger("webdriver")
+
+    def __init__(self, directory=None, max_bytes=None, default_ttl=None, ttls=None):
+        self.directory = directory or os.getenv("HTTP_CACHE_DIR", ".http_cache")
+        self.max_bytes = max_bytes or int(float(os.getenv("HTTP_CACHE_MAX_MB", "200")) * 1024 * 1024)
+        self.default_ttl = (
+            default_ttl if default_ttl is not None else float(os.getenv("HTTP_CACHE_TTL", "0"))
+        )
+        # "hote=secondes,hote=secondes", ex: "www.agrilabour.com.au=3600"
+        self.ttls = ttls if ttls is not None else self.parse_ttls(os.getenv("HTTP_CACHE_TTLS", ""))
+        self.lock = threading.Lock()
+        self.size = None
+        self.hits = {"fresh": 0, "revalidated": 0, "stored": 0, "parse_skipped": 0}
+
+    @classmethod
+    def from_env(cls):
+        """ Cache configured from the environment, None when HTTP_CACHE=0 """
+        if os.getenv("HTTP_CACHE", "1") != "1":
+            return None
+        return cls()
+
+    @staticmethod
+    def parse_ttls(value):
+        ttls = {}
+        for item in value.split(","):
+            if "=" in item:
+                host, seconds = item.split("=", 1)
+                ttls[host.strip().lower()] = float(seconds)
+        return ttls
+
+    def ttl(self, url):
+        return self.ttls.get(urlsplit(url).netloc.lower(), self.default_ttl)
+
+    def paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def lookup(self, url):
+        """ Metadata of the cached response for `url`, or None """
+        meta_path, body_path = self.paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url or not os.path.exists(body_path):
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        return time.time() - entry["stored_at"] < self.ttl(entry["url"])
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def body(self, entry):
+        """ Cached body of `entry`, None if it was evicted since the lookup """
+        _, body_path = self.paths(entry["url"])
+        try:
+            with open(body_path, encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def cacheable(self, url, response):
+        """ Only keep responses that can be revalidated or served fresh """
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return False
+        return bool(
+            response.headers.get("ETag")
+            or response.headers.get("Last-Modified")
+            or self.ttl(url) > 0
+        )
+
+    def store(self, url, response):
+        """ Save a 200 response; memoised parse results of the old body are dropped """
+        if not self.cacheable(url, response):
+            return None
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "stored_at": time.time(),
+            "last_used": time.time(),
+            "parsed": {},
+        }
+        meta_path, body_path = self.paths(url)
+        body = response.text.encode("utf-8")
+        entry["size"] = len(body)
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            previous = self.lookup(url)
+            # Écriture atomique : un lecteur concurrent voit l'ancien corps ou le nouveau
+            tmp_path = body_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, body_path)
+            self._write_meta(meta_path, entry)
+            self._grow(entry["size"] - (previous or {}).get("size", 0))
+            self.hits["stored"] += 1
+        return entry
+
+    def served_fresh(self, entry):
+        """ The entry is within its TTL: no request at all """
+        self.touch(entry)
+        self.hits["fresh"] += 1
+
+    def revalidated(self, entry):
+        """ The server answered 304: the entry is fresh again """
+        entry["stored_at"] = time.time()
+        self.touch(entry)
+        self.hits["revalidated"] += 1
+
+    def touch(self, entry):
+        entry["last_used"] = time.time()
+        meta_path, _ = self.paths(entry["url"])
+        with self.lock:
+            self._write_meta(meta_path, entry)
+
+    def parsed(self, entry, name, version):
+        """ Parse result memoised for the current body of `entry` by this parser version, or None """
+        memo = entry.get("parsed", {}).get(name)
+        if not isinstance(memo, dict) or memo.get("version") != version:
+            return None
+        self.hits["parse_skipped"] += 1
+        return memo["result"]
+
+    def store_parsed(self, entry, name, version, result):
+        """ Memoise `result`, replacing what an older version of the parser stored """
+        entry.setdefault("parsed", {})[name] = {"version": version, "result": result}
+        meta_path, _ = self.paths(entry["url"])
+        try:
+            with self.lock:
+                self._write_meta(meta_path, entry)
+        except (TypeError, ValueError):
+            # Résultat non sérialisable en JSON : pas de mémoïsation
+            entry["parsed"].pop(name, None)
+
+    def _write_meta(self, meta_path, entry):
+        data = json.dumps(entry)
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, meta_path)
+
+    def _grow(self, delta):
+        if self.size is None:
+            self.size = sum(entry.get("size", 0) for entry in self._entries())
+        else:
+            self.size += delta
+        if self.size > self.max_bytes:
+            self._evict()
+
+    def _entries(self):
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding="utf-8") as f:
+                    yield json.load(f)
+            except (OSError, ValueError):
+                continue
+
+    def _evict(self):
+        """ Drop least recently used entries until the cache is under 90% of max_bytes """
+        entries = sorted(self._entries(), key=lambda entry: entry.get("last_used", 0))
+        target = self.max_bytes * 0.9
+        for entry in entries:
+            if self.size <= target:
+                break
+            for path in self.paths(entry["url"]):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.size -= entry.get("size", 0)
+        self.logger.debug(f"HTTP cache evicted down to {self.size} bytes")
+
+    def report(self):
+        self.logger.info(
+            f"HTTP cache: {self.hits['fresh']} fresh hits, {self.hits['revalidated']} not modified, "
+            f"{self.hits['stored']} stored, {self.hits['parse_skipped']} parses skipped"
+        )
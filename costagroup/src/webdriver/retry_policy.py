@@ -0,0 +1,156 @@
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from cloudscraper.exceptions import CloudflareCaptchaError, CloudflareException
+
+
+# Statuts transitoires (dont les 52x de Cloudflare) ; les autres 4xx sont définitifs
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504, 520, 521, 522, 523, 524}
+RETRYABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    CloudflareException,
+)
+FATAL_ERRORS = (CloudflareCaptchaError,)
+
+OK, RETRY, FATAL = "ok", "retry", "fatal"
+
+
+class RetryBudget:
+    """ Retries allowed for the whole run, shared by every thread and host """
+
+    def __init__(self, retries):
+        self.remaining = retries
+        self.used = 0
+        self.lock = threading.Lock()
+
+    def take(self):
+        with self.lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            self.used += 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: after `threshold` consecutive retryable failures, requests
+    to the host are refused until the cooldown is over; the first request after
+    that is a trial and one more failure reopens it. A Retry-After holds the host
+    as "throttled" instead: callers wait for the window rather than give up.
+    """
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = {}
+        self.open_until = {}
+        self.reason = {}
+        self.opened = 0
+        self.lock = threading.Lock()
+
+    def state(self, host):
+        """ (seconds until the host may be tried again, "failing" or "throttled") """
+        with self.lock:
+            wait = self.open_until.get(host, 0) - time.monotonic()
+            if wait <= 0:
+                return 0.0, None
+            return wait, self.reason.get(host)
+
+    def success(self, host):
+        with self.lock:
+            self.failures.pop(host, None)
+
+    def failure(self, host):
+        with self.lock:
+            self.failures[host] = self.failures.get(host, 0) + 1
+            if self.failures[host] >= self.threshold:
+                self._open(host, self.cooldown, "failing")
+
+    def block(self, host, seconds):
+        """ The server asked to wait (Retry-After): hold every caller for this host """
+        with self.lock:
+            self._open(host, seconds, "throttled")
+
+    def _open(self, host, seconds, reason):
+        until = time.monotonic() + seconds
+        if until > self.open_until.get(host, 0):
+            if self.open_until.get(host, 0) <= time.monotonic():
+                self.opened += 1
+            self.open_until[host] = until
+            self.reason[host] = reason
+
+
+class RetryPolicy:
+    """
+    Classify fetch outcomes and pace retries: Retry-After when the server sends one,
+    otherwise exponential backoff with full jitter, bounded by a run-wide budget.
+    """
+
+    logger = logging.getLogger("webdriver")
+
+    def __init__(self, max_attempts=None, base=None, cap=None, retry_after_max=None,
+                 budget=None, threshold=None, cooldown=None):
+        self.max_attempts = max_attempts or int(os.getenv("HTTP_MAX_ATTEMPTS", "5"))
+        self.base = base or float(os.getenv("HTTP_BACKOFF_BASE", "1"))
+        self.cap = cap or float(os.getenv("HTTP_BACKOFF_MAX", "60"))
+        self.retry_after_max = retry_after_max or float(os.getenv("HTTP_RETRY_AFTER_MAX", "120"))
+        self.budget = RetryBudget(
+            budget if budget is not None else int(os.getenv("HTTP_RETRY_BUDGET", "200"))
+        )
+        self.breaker = CircuitBreaker(
+            threshold or int(os.getenv("HTTP_BREAKER_THRESHOLD", "5")),
+            cooldown or float(os.getenv("HTTP_BREAKER_COOLDOWN", "60")),
+        )
+
+    def classify(self, response=None, error=None):
+        if error is not None:
+            if isinstance(error, FATAL_ERRORS):
+                return FATAL
+            return RETRY if isinstance(error, RETRYABLE_ERRORS) else FATAL
+        if response.status_code in RETRYABLE_STATUS:
+            return RETRY
+        if response.status_code == 403 and is_cloudflare(response):
+            # Challenge Cloudflare : peut passer après une pause
+            return RETRY
+        return FATAL if response.status_code >= 400 else OK
+
+    def retry_after(self, response):
+        """ Seconds asked by a Retry-After header (delta or HTTP date), None if absent """
+        if response is None:
+            return None
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), self.retry_after_max)
+
+    def backoff(self, attempt):
+        """ Full jitter: uniform between 0 and the capped exponential delay """
+        return random.uniform(0, min(self.cap, self.base * 2 ** (attempt - 1)))
+
+    def report(self):
+        self.logger.info(
+            f"HTTP retries: {self.budget.used} used, {self.budget.remaining} left in the run budget, "
+            f"hosts paused {self.breaker.opened} times (circuit breaker or Retry-After)"
+        )
+
+
+def is_cloudflare(response):
+    return (
+        "cloudflare" in response.headers.get("Server", "").lower()
+        or "cf-mitigated" in response.headers
+    )
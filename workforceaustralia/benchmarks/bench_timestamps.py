@@ -0,0 +1,56 @@
+"""
+Micro-benchmark of the creationDate cutoff on a 100-result API page.
+
+Run from the workforceaustralia directory:
+    python -m benchmarks.bench_timestamps [runs]
+"""
+import json
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+from src.schemas.api_result import scored_result_adapter
+from src.schemas.timestamps import parse_iso_datetime
+
+PAGE = Path(__file__).parent.parent / "tests" / "fixtures" / "vacancies_page.json"
+
+
+def strptime_date(value):
+    # Ancienne méthode creation_date du scraper
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f")
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+
+
+def main(runs=300):
+    results = json.loads(PAGE.read_text())["results"]
+    dates = [raw["result"]["creationDate"] for raw in results]
+
+    def cold(parse):
+        def run():
+            parse_iso_datetime.cache_clear()
+            for value in dates:
+                parse(value)
+        return run
+
+    def validate_page():
+        parse_iso_datetime.cache_clear()
+        for raw in results:
+            scored_result_adapter.validate_python(raw)
+
+    cases = [
+        ("strptime cutoff", lambda: [strptime_date(value) for value in dates]),
+        ("parse_iso_datetime cutoff, cold cache", cold(parse_iso_datetime)),
+        ("parse_iso_datetime cutoff, warm cache", lambda: [parse_iso_datetime(value) for value in dates]),
+        ("validate page (cutoff included)", validate_page),
+    ]
+    print(f"{len(results)} results per page, {runs} runs, Python {sys.version.split()[0]}")
+    for name, run in cases:
+        seconds = min(timeit.repeat(run, number=runs, repeat=3)) / runs
+        print(f"  {name:<40} {seconds * 1000:.3f} ms/page")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
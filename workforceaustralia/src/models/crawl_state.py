@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime
+from src.models.base import Base
+
+class CrawlState(Base):
+    """ Newest creation date seen for a search category, at full timestamp precision """
+    __tablename__ = "crawl_state"
+
+    source = Column(String(255), primary_key=True)
+    category = Column(String(255), primary_key=True)
+    last_seen_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<CrawlState(source='{self.source}', category='{self.category}', "
+            f"last_seen_at={self.last_seen_at})>"
+        )
@@ -8,12 +8,16 @@ from sqlalchemy import (
     ForeignKey,
     BigInteger,
     Text,
+    Index,
 )
 from src.models.base import Base
 
 
 class Job(Base):
     __tablename__ = "workforceaustralia_jobs"
+    __table_args__ = (
+        Index("ix_workforceaustralia_jobs_category_creation_date", "category", "creation_date"),
+    )
 
     id = Column(Integer, primary_key=True)
     vacancy_id = Column(BigInteger, unique=True, nullable=False)
@@ -37,3 +41,4 @@ class Job(Base):
     url = Column(String(255), unique=True, nullable=False)
     created_at = Column(DateTime, nullable=False)
     filtered = Column(String(255))
+    filtered_at = Column(DateTime, index=True)
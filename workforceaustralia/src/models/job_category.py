@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, DateTime, BigInteger
+from src.models.base import Base
+
+class JobCategory(Base):
+    """ Every search category a vacancy was found under (Job.category keeps the first one) """
+    __tablename__ = "workforceaustralia_job_categories"
+
+    vacancy_id = Column(BigInteger, primary_key=True)
+    category = Column(String(255), primary_key=True)
+    created_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<JobCategory(vacancy_id={self.vacancy_id}, category='{self.category}')>"
@@ -0,0 +1,28 @@
+from sqlalchemy import text
+from src.models.base import Base, engine
+from src.models.job import Job
+from src.models.all_jobs import AllJobs
+from src.models.sync_state import AllJobsSyncState
+from src.models.verdict_cache import LlmVerdictCache
+from src.models.job_category import JobCategory
+from src.models.crawl_state import CrawlState
+
+# Modèles à enregistrer dans Base.metadata avant create_all
+MODELS = (Job, AllJobs, AllJobsSyncState, LlmVerdictCache, JobCategory, CrawlState)
+
+# create_all ne modifie pas les tables existantes : colonnes et index ajoutés après coup
+MIGRATIONS = [
+    f"ALTER TABLE {Job.__tablename__} ADD COLUMN IF NOT EXISTS filtered_at TIMESTAMP",
+    f"CREATE INDEX IF NOT EXISTS ix_{Job.__tablename__}_filtered_at ON {Job.__tablename__} (filtered_at)",
+    "CREATE INDEX IF NOT EXISTS ix_all_jobs_publication_date_url ON all_jobs (publication_date, url)",
+    "CREATE INDEX IF NOT EXISTS ix_workforceaustralia_jobs_category_creation_date "
+    "ON workforceaustralia_jobs (category, creation_date)",
+]
+
+
+def ensure_schema():
+    """ Create missing tables, then apply the idempotent migrations above """
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        for statement in MIGRATIONS:
+            connection.execute(text(statement))
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from src.models.base import Base
+
+class AllJobsSyncState(Base):
+    """ High-water mark of the last Job -> AllJobs sync, one row per source table """
+    __tablename__ = "all_jobs_sync_state"
+
+    source = Column(String(255), primary_key=True)
+    last_job_id = Column(Integer, nullable=False, default=0)
+    last_filtered_at = Column(DateTime)
+    synced_at = Column(DateTime)
+
+    def __repr__(self):
+        return (
+            f"<AllJobsSyncState(source='{self.source}', last_job_id={self.last_job_id}, "
+            f"last_filtered_at={self.last_filtered_at})>"
+        )
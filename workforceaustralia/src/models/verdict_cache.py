@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from src.models.base import Base
+
+class LlmVerdictCache(Base):
+    """ Model verdicts shared by every scraper, keyed by a hash of the request content """
+    __tablename__ = "llm_verdict_cache"
+
+    key = Column(String(64), primary_key=True)
+    verdict = Column(String(255), nullable=False)
+    model = Column(String(255))
+    created_at = Column(DateTime, nullable=False)
+    last_used_at = Column(DateTime, nullable=False, index=True)
+    hits = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<LlmVerdictCache(key='{self.key}', verdict='{self.verdict}', model='{self.model}', "
+            f"hits={self.hits})>"
+        )
@@ -1,6 +1,10 @@
-from pydantic import BaseModel, validator
-from typing import Optional, List
+from pydantic import BaseModel, BeforeValidator, TypeAdapter, validator
+from typing import Annotated, Optional, List
 from datetime import datetime
+from src.schemas.timestamps import parse_iso_value
+
+# Dates de l'API parsées par le même parseur (mis en cache) que la boucle de cutoff
+IsoDatetime = Annotated[datetime, BeforeValidator(parse_iso_value)]
 
 
 class CodeLabel(BaseModel):
@@ -10,12 +14,12 @@ class CodeLabel(BaseModel):
 
 class JobResult(BaseModel):
     contractType: Optional[CodeLabel]
-    creationDate: datetime
+    creationDate: IsoDatetime
     description: str
-    displayFromDate: datetime
+    displayFromDate: IsoDatetime
     employerId: Optional[str]
     employerName: Optional[str]
-    expiryDate: datetime
+    expiryDate: IsoDatetime
     howToApplyCode: Optional[str]
     industry: Optional[CodeLabel]
     isApplyOnlineJob: bool
@@ -28,7 +32,7 @@ class JobResult(BaseModel):
     location: Optional[CodeLabel]
     logoUrl: Optional[str]
     longitude: Optional[float]
-    modifiedDate: datetime
+    modifiedDate: IsoDatetime
     occupation: Optional[CodeLabel]
     organisation: Optional[CodeLabel]
     positionsAvailable: Optional[int]
@@ -57,3 +61,7 @@ class ScoredResult(BaseModel):
 class JobAPIResponse(BaseModel):
     totalCount: int
     results: List[ScoredResult]
+
+
+# Validation d'un résultat à la fois (pages de l'API traitées en flux)
+scored_result_adapter = TypeAdapter(ScoredResult)
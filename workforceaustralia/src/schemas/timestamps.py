@@ -0,0 +1,51 @@
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+# Repli pour Python < 3.11 : fromisoformat n'y accepte ni "Z" ni 1, 2, 4 ou 5 décimales
+ISO_REGEX = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?"
+    r"(Z|[+-]\d{2}:?\d{2})?$"
+)
+
+
+@lru_cache(maxsize=8192)
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an API timestamp such as "2025-01-20T10:15:00.57" into a naive UTC datetime.
+    Shared by the crawl cutoff and the pydantic schema, and cached since the
+    same timestamps come back across categories and fields.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        parsed = parse_iso_fallback(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def parse_iso_fallback(value: str) -> datetime:
+    """ Regex parser used when fromisoformat rejects the timestamp (Python < 3.11) """
+    match = ISO_REGEX.match(value)
+    if not match:
+        raise ValueError(f"Invalid ISO timestamp: {value!r}")
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    parsed = datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second),
+        int((fraction or "0").ljust(6, "0")),
+    )
+    if offset == "Z":
+        return parsed.replace(tzinfo=timezone.utc)
+    if offset:
+        sign = 1 if offset[0] == "+" else -1
+        hours, minutes = int(offset[1:3]), int(offset[-2:])
+        return parsed.replace(tzinfo=timezone(sign * timedelta(hours=hours, minutes=minutes)))
+    return parsed
+
+
+def parse_iso_value(value):
+    """ pydantic before-validator: parse strings, let anything else through """
+    if isinstance(value, str):
+        return parse_iso_datetime(value)
+    return value
@@ -1,21 +1,36 @@
 from urllib.parse import quote
 import json
 from src.services.openai_service import OpenAIService
+from src.services.rate_limiter import RateLimiter
+from src.services.job_classifier import JobClassifier, job_chunks
+from src.services.verdict_cache import VerdictCache
 from src.webdriver.fetch_cloudscraper import Driver
-from src.schemas.api_result import JobAPIResponse
+from src.schemas.api_result import scored_result_adapter
+from src.schemas.timestamps import parse_iso_datetime
+from pydantic import ValidationError
 from src.models.base import SessionLocal
-from src.services.pydantic_to_job import pydantic_to_job
+from src.services.pydantic_to_job import pydantic_to_job_values
+from src.services.job_store import save_jobs
+from src.services.crawl_state import get_watermarks, set_watermark
 from src.models.job import Job
 from src.services.google_sheets_service import GoogleSheetsService
-from src.services.job_to_all_jobs import job_to_all_jobs
+from src.services.all_jobs_sync import sync_all_jobs
 import os, dotenv
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session
-from src.models.all_jobs import AllJobs
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
 
 dotenv.load_dotenv()
 
+
+def vacancies_url(category, page):
+    return f"https://www.workforceaustralia.gov.au/api/v1/global/vacancies/?searchText={quote(category)}&sort=DateAddedDescending&pageNumber={page}&pageSize=100"
+
+
 CATEGORIES = [
     "No experience",
     "Warehouse",
@@ -48,94 +63,72 @@ class WorkforceaustraliaScraper:
         """
         super().__init__(*args, **kwargs)
 
-    def get_last_scrape_date(self, db: Session, category: str) -> date:
+    def get_last_scrape_dates(self, db: Session) -> dict:
         """
-        Get the last scrape date for a specific category.
-        Returns the creation_date of the most recent job for this category.
-        If no jobs exist, returns a default date (7 days ago).
+        Get the last scrape date of every category, at full timestamp precision.
+        Returns the crawl watermark of each category (see crawl_state).
+        If a category was never crawled, returns a default date (7 days ago).
         """
-        last_job = (
-            db.query(Job)
-            .filter(Job.category == category)
-            .order_by(Job.creation_date.desc())
-            .first()
-        )
-
-        if last_job and last_job.creation_date:
-            print(f"Last scrape for '{category}': {last_job.creation_date}")
-            return last_job.creation_date.date()
-        else:
-            # If no previous jobs, use 7 days ago as default
-            default_date = datetime.now() - timedelta(days=7)
-            print(f"No previous jobs for '{category}', using default: {default_date}")
-            return default_date.date()
+        watermarks = get_watermarks(db, CATEGORIES)
+        default_date = datetime.now() - timedelta(days=7)
+        last_scrape_dates = {}
+        for category in CATEGORIES:
+            if category in watermarks:
+                print(f"Last scrape for '{category}': {watermarks[category]}")
+                last_scrape_dates[category] = watermarks[category]
+            else:
+                print(f"No previous jobs for '{category}', using default: {default_date}")
+                last_scrape_dates[category] = default_date
+        return last_scrape_dates
 
     def scrape(self):
         """
         Scrape job listings from the Workforce Australia website.
+        Categories are crawled concurrently and stream their pages through a
+        bounded queue; pages are merged here into a single, deduplicated
+        insert stream, one flush per page. If storing a page fails, the
+        crawlers are stopped before the error is raised.
         """
-        # Implement the scraping logic here
-        url = (
-            lambda cat, page: f"https://www.workforceaustralia.gov.au/api/v1/global/vacancies/?searchText={quote(cat)}&sort=DateAddedDescending&pageNumber={page}&pageSize=100"
-        )
-        for category in CATEGORIES:
-            print(f"Scraping category: {category}")
-            page = 1
-            results = []
-            db = SessionLocal()
-            last_scrape_date = self.get_last_scrape_date(db, category)
-            while True:
-                print(f"URL: {url(category, page)}")
-                print(f"Page: {page}")
-                driver = Driver()
-                str_data = driver.page(url(category, page))
-                json_data = json.loads(str_data)
-                if json_data["results"] == []:
-                    break
-
-                # Since results are sorted by date, break when we find an old job
-                should_break = False
-                filtered_results = []
-                for result in json_data["results"]:
-                    # Handle datetime parsing with or without microseconds
-                    creation_date = result["result"]["creationDate"]
-                    try:
-                        # Try with microseconds first
-                        post_date = datetime.strptime(
-                            creation_date, "%Y-%m-%dT%H:%M:%S.%f"
-                        ).date()
-                    except ValueError:
-                        # If that fails, try without microseconds
-                        post_date = datetime.strptime(
-                            creation_date, "%Y-%m-%dT%H:%M:%S"
-                        ).date()
-
-                    if post_date <= last_scrape_date:
-                        print(
-                            f"Found job from {post_date} <= last scrape {last_scrape_date}, stopping"
-                        )
-                        should_break = True
-                        break
-                    filtered_results.append(result)
-
-                results.extend(filtered_results)
-
-                if should_break:
-                    break
+        db = SessionLocal()
+        last_scrape_dates = self.get_last_scrape_dates(db)
 
-                page += 1
-            data = JobAPIResponse(results=results, totalCount=len(results))
-            print(f"Data: {len(data.results)}")
-            db = SessionLocal()
+        workers = int(os.getenv("CRAWL_WORKERS", "4"))
+        self.rate_limiter = RateLimiter(float(os.getenv("CRAWL_RATE_LIMIT", "4")))
+        pages = queue.Queue(maxsize=workers * 2)
+        stop = threading.Event()
+        seen_vacancy_ids = set()
+        inserted = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for category in CATEGORIES:
+                executor.submit(
+                    self.crawl_category, category, last_scrape_dates[category], pages, stop
+                )
 
-            for result in data.results:
-                job = pydantic_to_job(result, category)
-                exists = db.query(Job).filter_by(vacancy_id=job.vacancy_id).first()
-                if not exists:
-                    db.add(job)
-                    db.commit()
-                    db.refresh(job)
-            db.close()
+            try:
+                remaining = len(CATEGORIES)
+                while remaining:
+                    kind, category, payload = pages.get()
+                    if kind == "page":
+                        inserted += self.save_page(db, category, payload, seen_vacancy_ids)
+                    elif kind == "done":
+                        remaining -= 1
+                        # The watermark only moves once the whole category is stored
+                        if payload:
+                            set_watermark(db, category, payload)
+                            db.commit()
+                        print(f"Category {category} done.")
+                    else:
+                        remaining -= 1
+                        print(f"Error scraping category {category}: {payload}")
+            except BaseException:
+                # Sans consommateur, les crawlers resteraient bloqués sur la file pleine
+                # et la sortie du with (shutdown(wait=True)) attendrait indéfiniment
+                stop.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                db.close()
+                raise
+        db.close()
+        print(f"{inserted} new jobs inserted ({len(seen_vacancy_ids)} distinct vacancies seen).")
 
         self.filter_jobs()
 
@@ -143,6 +136,111 @@ class WorkforceaustraliaScraper:
         self.save_in_db_all()
         self.save_in_sheets_all()
 
+        Driver.report()
+        Driver.close_all()
+
+    def fetch_page(self, category, page):
+        """ Fetch one page of API results, under the run-wide rate limit """
+        self.rate_limiter.acquire()
+        print(f"URL: {vacancies_url(category, page)}")
+        print(f"Page: {page}")
+        driver = Driver()
+        str_data = driver.page(vacancies_url(category, page))
+        if str_data is None:
+            raise ValueError(f"No data for {category} page {page}")
+        return json.loads(str_data)
+
+    def crawl_category(self, category, last_scrape_date, pages: queue.Queue, stop: threading.Event):
+        """
+        Stream the results of a category newer than `last_scrape_date` to `pages`.
+
+        Each page is validated result by result and queued on its own, followed
+        by ("done", category, newest creation date) or ("error", category, e).
+        Results are sorted by date: while the last result of a page is still
+        newer than the cutoff, the next page is fetched in the background
+        while the current one is processed. The crawl returns early once
+        `stop` is set.
+        """
+        if stop.is_set():
+            return
+        print(f"Scraping category: {category}")
+        newest = None
+        page = 1
+        try:
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                next_page = prefetcher.submit(self.fetch_page, category, page)
+                while True:
+                    json_data = next_page.result()
+                    next_page = None
+                    if json_data["results"] == []:
+                        break
+                    last_date = json_data["results"][-1]["result"]["creationDate"]
+                    if parse_iso_datetime(last_date) > last_scrape_date:
+                        next_page = prefetcher.submit(self.fetch_page, category, page + 1)
+
+                    # Since results are sorted by date, break when we find an old job
+                    should_break = False
+                    results = []
+                    for raw_result in json_data["results"]:
+                        # creationDate is parsed once, during validation
+                        try:
+                            result = scored_result_adapter.validate_python(raw_result)
+                        except ValidationError as e:
+                            print(f"Invalid result in {category} page {page}: {e}")
+                            continue
+                        post_date = result.result.creationDate
+                        if post_date <= last_scrape_date:
+                            print(
+                                f"Found job from {post_date} <= last scrape {last_scrape_date}, stopping"
+                            )
+                            should_break = True
+                            break
+                        newest = post_date if newest is None else max(newest, post_date)
+                        results.append(result)
+                    del json_data
+
+                    if results and not self.put_page(pages, ("page", category, results), stop):
+                        return
+
+                    if should_break or next_page is None:
+                        break
+
+                    page += 1
+            self.put_page(pages, ("done", category, newest), stop)
+        except Exception as e:
+            self.put_page(pages, ("error", category, e), stop)
+
+    @staticmethod
+    def put_page(pages: queue.Queue, item, stop: threading.Event) -> bool:
+        """ Queue `item`, waiting for room unless `stop` is set; False when it was dropped """
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def save_page(self, db: Session, category, results, seen_vacancy_ids) -> int:
+        """
+        Insert one page of validated results.
+        A vacancy found under several searches is stored once,
+        every category it matched is kept in JobCategory.
+        """
+        rows = []
+        categories = set()
+        for result in results:
+            vacancy_id = result.result.vacancyId
+            categories.add((vacancy_id, category))
+            if vacancy_id in seen_vacancy_ids:
+                continue
+            seen_vacancy_ids.add(vacancy_id)
+            rows.append(pydantic_to_job_values(result, category))
+        inserted = save_jobs(db, rows, categories)
+        db.commit()
+        print(f"{category}: {len(results)} results, {inserted} new jobs.")
+        return inserted
+
     def save_in_sheets(self):
         db = SessionLocal()
         spreadsheet_id = os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID")
@@ -153,19 +251,17 @@ class WorkforceaustraliaScraper:
         )
         service.upload_jobs(db)
 
-    def save_in_db_all(self):
+    def save_in_db_all(self, full=None):
+        """
+        Sync new and newly filtered jobs into the AllJobs table.
+        Set ALL_JOBS_FULL_SYNC=1 (or pass full=True) to resync every job.
+        """
+        if full is None:
+            full = os.getenv("ALL_JOBS_FULL_SYNC", "0") == "1"
         db: Session = SessionLocal()
-        jobs = db.query(Job).all()
-        for job in jobs:
-            all_job_data = job_to_all_jobs(job)
-            existing = db.query(AllJobs).filter_by(url=all_job_data.url).first()
-            if existing:
-                db.delete(existing)
-                db.commit()
-            print(f"\n\n\n{all_job_data.filtered}\n\n\n")
-            db.add(all_job_data)
-            db.commit()
-        print("All jobs saved or updated in AllJobs table.")
+        written = sync_all_jobs(db, full=full)
+        db.close()
+        print(f"All jobs saved or updated in AllJobs table ({written} rows written).")
 
     def save_in_sheets_all(self):
         db = SessionLocal()
@@ -177,14 +273,30 @@ class WorkforceaustraliaScraper:
 
     def filter_jobs(self):
         db = SessionLocal()
-        jobs = db.query(Job).all()
+        query = db.query(Job).filter(
+            or_(Job.filtered.is_(None), Job.filtered.notin_(["yes", "no", "maybe"]))
+        )
+        print(f"{query.count()} jobs to filter.")
         api_key = os.getenv("OPENAI_API_KEY")
         service = OpenAIService(api_key)
-        for job in jobs:
-            if job.filtered in ["yes", "no", "maybe"]:
-                print(f"Job {job.url} already filtered, skipping.")
-                continue
-            filtered = service.test_job(job)
-            job.filtered = filtered
-            db.add(job)
-            db.commit()
+        cache = VerdictCache(db, service)
+        cache.evict()
+        classifier = JobClassifier(service)
+        verdicts = []
+        # Les offres sont chargées par tranches plutôt que toutes en mémoire
+        for job_id, filtered in classifier.classify_chunks(job_chunks(query), cache=cache):
+            verdicts.append(
+                {"id": job_id, "filtered": filtered, "filtered_at": datetime.utcnow()}
+            )
+            if len(verdicts) >= 50:
+                self.save_verdicts(db, verdicts)
+                verdicts = []
+        self.save_verdicts(db, verdicts)
+        db.close()
+
+    def save_verdicts(self, db: Session, verdicts):
+        """ Write a batch of classifications back with one bulk UPDATE by primary key """
+        if not verdicts:
+            return
+        db.execute(update(Job), verdicts)
+        db.commit()
@@ -0,0 +1,47 @@
+from datetime import datetime
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from src.models.crawl_state import CrawlState
+from src.models.job import Job
+
+SOURCE = "workforceaustralia"
+
+
+def get_watermarks(db: Session, categories: list) -> dict:
+    """
+    Newest creation date already crawled for each category.
+
+    Categories without a crawl_state row fall back to the newest stored job of
+    that category (one grouped query on the (category, creation_date) index).
+    Categories with no jobs at all are left out.
+    """
+    watermarks = dict(
+        db.query(CrawlState.category, CrawlState.last_seen_at).filter(
+            CrawlState.source == SOURCE, CrawlState.category.in_(categories)
+        )
+    )
+    missing = [category for category in categories if category not in watermarks]
+    if missing:
+        watermarks.update(
+            db.query(Job.category, func.max(Job.creation_date))
+            .filter(Job.category.in_(missing), Job.creation_date.isnot(None))
+            .group_by(Job.category)
+        )
+    return watermarks
+
+
+def set_watermark(db: Session, category: str, last_seen_at: datetime):
+    """ Upsert the watermark of a category; the caller commits """
+    now = datetime.utcnow()
+    stmt = insert(CrawlState).values(
+        source=SOURCE, category=category, last_seen_at=last_seen_at, updated_at=now
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CrawlState.source, CrawlState.category],
+        set_={
+            "last_seen_at": func.greatest(CrawlState.last_seen_at, stmt.excluded.last_seen_at),
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.execute(stmt)
@@ -1,18 +1,29 @@
 import gspread
+import json
+import os
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 from sqlalchemy.orm import Session
 from sqlalchemy.inspection import inspect
 from src.models.job import Job
 from src.models.all_jobs import AllJobs
+from src.services import fake_gspread
 import datetime
 
 
 class GoogleSheetsService:
-    def __init__(self, spreadsheet_id: str, credentials_path: str, worksheet_name: str):
-        self.creds = Credentials.from_service_account_file(
-            credentials_path, scopes=["https://www.googleapis.com/auth/spreadsheets"]
-        )
-        self.client = gspread.authorize(self.creds)
+    # Payload max par requête d'écriture (l'API refuse les requêtes trop volumineuses)
+    max_request_bytes = 2 * 1024 * 1024
+
+    def __init__(self, spreadsheet_id: str, credentials_path: str, worksheet_name: str, client=None):
+        if client is None and os.getenv("GOOGLE_SHEETS_BACKEND") == "fake":
+            client = fake_gspread.default_client
+        if client is None:
+            self.creds = Credentials.from_service_account_file(
+                credentials_path, scopes=["https://www.googleapis.com/auth/spreadsheets"]
+            )
+            client = gspread.authorize(self.creds)
+        self.client = client
         self.spreadsheet = self.client.open_by_key(spreadsheet_id)
 
         try:
@@ -23,7 +34,8 @@ class GoogleSheetsService:
             )
 
     def upload_jobs(self, db: Session):
-        jobs = db.query(Job).all()
+        # Ordre stable : les nouveaux jobs arrivent en bas de la feuille
+        jobs = db.query(Job).order_by(Job.id).all()
 
         # Inspecte les colonnes du modèle Job
         mapper = inspect(Job)
@@ -32,52 +44,203 @@ class GoogleSheetsService:
         rows = [column_names]
 
         for job in jobs:
-            row = []
-            for column in column_names:
-                value = getattr(job, column, "")
-                if isinstance(value, datetime.datetime):
-                    value = value.date().strftime("%Y-%m-%d")
-                elif isinstance(value, datetime.date):
-                    value = value.strftime("%Y-%m-%d")
-                row.append(value)
+            rows.append([self._format(getattr(job, column, "")) for column in column_names])
 
-            rows.append(row)
-
-        self.sheet.clear()
-        self.sheet.update("A1", rows)
+        self.sync_rows(rows)
 
     def upload_all(self, db: Session):
-
-        all_jobs = db.query(AllJobs).all()
-
-        mapper = inspect(AllJobs)
-        column_names = [column.key for column in mapper.columns]
-
-        # filter data (only keep the rows that are in the last 7 days)
-        all_jobs = [
-            job
-            for job in all_jobs
-            if job.publication_date
-            >= datetime.datetime.now() - datetime.timedelta(days=7)
-        ]
-
-        # sort data by date then by url, then by salary (if salary is not None)
-
-        all_jobs.sort(key=lambda x: (x.publication_date, x.url), reverse=True)
+        columns = list(inspect(AllJobs).columns)
+        column_names = [column.key for column in columns]
+
+        # only keep the rows that are in the last 7 days, sorted by date then by url
+        # (served by the (publication_date, url) index, streamed without ORM objects).
+        # Les quatre scrapers écrivent la même feuille "all" : même ordre partout,
+        # sinon chaque passage d'un autre scraper réordonne et réécrit la feuille
+        since = datetime.datetime.now() - datetime.timedelta(days=7)
+        query = (
+            db.query(*columns)
+            .filter(AllJobs.publication_date >= since)
+            .order_by(AllJobs.publication_date, AllJobs.url)
+            .yield_per(1000)
+        )
 
         rows = [column_names]
+        for job in query:
+            rows.append([self._format(value) for value in job])
+
+        self.sync_rows(rows)
+
+    def sync_rows(self, rows, key="url"):
+        """
+        Bring the worksheet in line with `rows` (header first) with minimal writes.
+
+        The sheet is read once and rows are matched on the `key` column: rows
+        that disappeared are deleted, changed rows are rewritten in place and
+        new rows are inserted at their position in `rows` (appended when they
+        come after every existing row). When the header differs, or when the
+        existing rows are no longer in the order of `rows`, the sheet is
+        rewritten entirely.
+        """
+        header = rows[0]
+        current = self.sheet.get_all_values(value_render_option="UNFORMATTED_VALUE")
+
+        if not current or self._normalize(current[0]) != self._normalize(header):
+            self.rewrite(rows)
+            return
+
+        key_index = header.index(key)
+        desired = {}
+        for row in rows[1:]:
+            desired.setdefault(self._cell(row[key_index]), row)
+        rank = {row_key: index for index, row_key in enumerate(desired)}
+
+        removed = []
+        kept = {}  # clé -> valeurs actuelles, dans l'ordre de la feuille
+        for index, row in enumerate(current[1:], start=1):
+            row_key = self._cell(row[key_index]) if key_index < len(row) else ""
+            if row_key not in desired or row_key in kept:
+                removed.append(index)
+                continue
+            kept[row_key] = row
+
+        ranks = [rank[row_key] for row_key in kept]
+        if any(previous > following for previous, following in zip(ranks, ranks[1:])):
+            print(f"Sheet {self.sheet.title}: rows out of order, rewriting.")
+            self.rewrite(rows)
+            return
+
+        # Position finale de chaque ligne = son rang dans `rows` (ligne 1 = en-tête)
+        last_kept = max(ranks, default=-1)
+        changed, inserted, appended = [], [], []
+        for index, (row_key, row) in enumerate(desired.items()):
+            sheet_row = index + 2
+            if row_key in kept:
+                if self._normalize(kept[row_key][: len(header)]) == self._normalize(row):
+                    continue
+            elif index > last_kept:
+                appended.append(self._values(row))
+                continue
+            else:
+                inserted.append(sheet_row - 1)
+            changed.append(
+                {
+                    "range": f"A{sheet_row}:{rowcol_to_a1(sheet_row, len(header))}",
+                    "values": [self._values(row)],
+                }
+            )
 
-        for job in all_jobs:
-            row = []
-            for column in column_names:
-                value = getattr(job, column, "")
-                if isinstance(value, datetime.datetime):
-                    value = value.date().strftime("%Y-%m-%d")
-                elif isinstance(value, datetime.date):
-                    value = value.strftime("%Y-%m-%d")
-                row.append(value)
-
-            rows.append(row)
+        self.delete_rows(removed)
+        self.insert_rows(inserted)
+        for chunk in self._chunks(changed):
+            self.sheet.batch_update(chunk, value_input_option="RAW")
+        for chunk in self._chunks(appended):
+            self.sheet.append_rows(chunk, value_input_option="RAW", table_range="A1")
+
+        print(
+            f"Sheet {self.sheet.title}: {len(appended)} appended, {len(inserted)} inserted, "
+            f"{len(changed) - len(inserted)} changed, {len(removed)} removed, "
+            f"{len(kept) - len(changed) + len(inserted)} unchanged."
+        )
 
+    def rewrite(self, rows):
+        """ Clear the sheet and write every row, split in request-sized chunks """
         self.sheet.clear()
-        self.sheet.update("A1", rows)
+        start = 1
+        for chunk in self._chunks([self._values(row) for row in rows]):
+            self.sheet.update(values=chunk, range_name=f"A{start}")
+            start += len(chunk)
+
+    def delete_rows(self, indexes):
+        """ Delete the given 0-based row indexes in one batchUpdate request """
+        if not indexes:
+            return
+        ranges = self._ranges(indexes)
+        # Du bas vers le haut pour que les index restent valides
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": self.sheet.id,
+                        "dimension": "ROWS",
+                        "startIndex": start,
+                        "endIndex": end,
+                    }
+                }
+            }
+            for start, end in reversed(ranges)
+        ]
+        self.spreadsheet.batch_update({"requests": requests})
+
+    def insert_rows(self, indexes):
+        """ Insert blank rows at the given 0-based final row indexes in one batchUpdate request """
+        if not indexes:
+            return
+        ranges = self._ranges(indexes)
+        # Du haut vers le bas : les index sont ceux de la feuille une fois complétée
+        requests = [
+            {
+                "insertDimension": {
+                    "range": {
+                        "sheetId": self.sheet.id,
+                        "dimension": "ROWS",
+                        "startIndex": start,
+                        "endIndex": end,
+                    },
+                    "inheritFromBefore": False,
+                }
+            }
+            for start, end in ranges
+        ]
+        self.spreadsheet.batch_update({"requests": requests})
+
+    @staticmethod
+    def _ranges(indexes):
+        """ Sorted indexes grouped into contiguous [start, end) ranges """
+        ranges = []
+        for index in sorted(indexes):
+            if ranges and ranges[-1][1] == index:
+                ranges[-1][1] = index + 1
+            else:
+                ranges.append([index, index + 1])
+        return ranges
+
+    def _chunks(self, items):
+        chunk, size = [], 0
+        for item in items:
+            item_size = len(json.dumps(item, default=str))
+            if chunk and size + item_size > self.max_request_bytes:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(item)
+            size += item_size
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _format(value):
+        if isinstance(value, datetime.datetime):
+            return value.date().strftime("%Y-%m-%d")
+        if isinstance(value, datetime.date):
+            return value.strftime("%Y-%m-%d")
+        return value
+
+    @staticmethod
+    def _values(row):
+        return ["" if value is None else value for value in row]
+
+    @staticmethod
+    def _cell(value):
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    @classmethod
+    def _normalize(cls, row):
+        values = [cls._cell(value) for value in row]
+        while values and values[-1] == "":
+            values.pop()
+        return values
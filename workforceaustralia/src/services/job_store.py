@@ -0,0 +1,38 @@
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from src.models.job import Job
+from src.models.job_category import JobCategory
+
+
+def save_jobs(db: Session, rows: list, categories: set, chunk_size: int = 500) -> int:
+    """
+    Insert new vacancies and record the categories they were found under.
+
+    Jobs are sent as `INSERT ... ON CONFLICT (vacancy_id) DO NOTHING` chunks, so
+    vacancies already stored are skipped by the database without a lookup.
+    The caller commits.
+
+    Args:
+        db (Session): The database session.
+        rows (list): Job column values, as built by `pydantic_to_job_values`.
+        categories (set): `(vacancy_id, category)` pairs seen during the crawl.
+        chunk_size (int): Number of rows per statement.
+
+    Returns:
+        int: The number of jobs actually inserted.
+    """
+    inserted = 0
+    for i in range(0, len(rows), chunk_size):
+        stmt = insert(Job).values(rows[i : i + chunk_size])
+        stmt = stmt.on_conflict_do_nothing(index_elements=[Job.vacancy_id])
+        inserted += db.execute(stmt).rowcount
+
+    now = datetime.utcnow()
+    links = [
+        {"vacancy_id": vacancy_id, "category": category, "created_at": now}
+        for vacancy_id, category in sorted(categories)
+    ]
+    for i in range(0, len(links), chunk_size):
+        db.execute(insert(JobCategory).values(links[i : i + chunk_size]).on_conflict_do_nothing())
+    return inserted
@@ -6,8 +6,12 @@ from src.schemas.api_result import (
 
 
 def pydantic_to_job(scored_result: JobResult, category: str) -> Job:
+    return Job(**pydantic_to_job_values(scored_result, category))
+
+
+def pydantic_to_job_values(scored_result: JobResult, category: str) -> dict:
     job_data = scored_result.result
-    return Job(
+    return dict(
         vacancy_id=job_data.vacancyId,
         title=job_data.title,
         description=job_data.description,
@@ -0,0 +1,112 @@
+import hashlib
+import os
+import re
+from datetime import datetime, timedelta
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from src.models.verdict_cache import LlmVerdictCache
+from src.services.openai_service import OpenAIService, PROMPT_VERSION
+
+WHITESPACE_REGEX = re.compile(r"\s+")
+
+
+class VerdictCache:
+    """
+    Persistent cache of model verdicts in the shared llm_verdict_cache table.
+
+    Keys hash the normalised title, salary and description together with
+    PROMPT_VERSION and the model, so a job posted on several sites is only paid
+    for once: every scraper must therefore use the same OPENAI_MODEL. Entries
+    expire after a TTL and the least recently used ones are evicted beyond a
+    maximum size.
+    """
+
+    def __init__(self, db: Session, service: OpenAIService, ttl_days=None, max_entries=None):
+        self.db = db
+        self.service = service
+        self.ttl = timedelta(days=ttl_days or int(os.getenv("VERDICT_CACHE_TTL_DAYS", "30")))
+        self.max_entries = max_entries or int(os.getenv("VERDICT_CACHE_MAX_ENTRIES", "100000"))
+        self.version = f"v{PROMPT_VERSION}\n{service.model}"
+
+    def key(self, job) -> str:
+        fields = (job.title, self.service.job_salary(job), job.description)
+        content = "\n".join(self.normalize(value) for value in fields)
+        return hashlib.sha256(f"{self.version}\n{content}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def normalize(value) -> str:
+        value = WHITESPACE_REGEX.sub(" ", value or "").strip().lower()
+        return "" if value in ("n/a", "na", "none") else value
+
+    def get_many(self, jobs, chunk_size=500) -> dict:
+        """ Cached verdicts for `jobs` as {job.id: verdict}, with one IN query per chunk """
+        keys = {}
+        for job in jobs:
+            keys.setdefault(self.key(job), []).append(job.id)
+        cutoff = datetime.utcnow() - self.ttl
+
+        found = {}
+        all_keys = list(keys)
+        for i in range(0, len(all_keys), chunk_size):
+            chunk = all_keys[i : i + chunk_size]
+            found.update(
+                self.db.execute(
+                    select(LlmVerdictCache.key, LlmVerdictCache.verdict).where(
+                        LlmVerdictCache.key.in_(chunk), LlmVerdictCache.created_at >= cutoff
+                    )
+                ).all()
+            )
+        hit_keys = list(found)
+        for i in range(0, len(hit_keys), chunk_size):
+            self.db.execute(
+                update(LlmVerdictCache)
+                .where(LlmVerdictCache.key.in_(hit_keys[i : i + chunk_size]))
+                .values(last_used_at=datetime.utcnow(), hits=LlmVerdictCache.hits + 1)
+            )
+        self.db.commit()
+        return {job_id: verdict for key, verdict in found.items() for job_id in keys[key]}
+
+    def put_many(self, entries):
+        """ Store `(key, verdict)` pairs; only definitive verdicts are cached """
+        now = datetime.utcnow()
+        rows = {
+            key: {
+                "key": key,
+                "verdict": verdict,
+                "model": self.service.model,
+                "created_at": now,
+                "last_used_at": now,
+                "hits": 0,
+            }
+            for key, verdict in entries
+            if verdict in ["yes", "no", "maybe"]
+        }
+        if not rows:
+            return
+        stmt = insert(LlmVerdictCache).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LlmVerdictCache.key],
+            set_={
+                "verdict": stmt.excluded.verdict,
+                "created_at": stmt.excluded.created_at,
+                "last_used_at": stmt.excluded.last_used_at,
+            },
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+
+    def evict(self):
+        """ Drop expired entries, then the least recently used beyond max_entries """
+        self.db.execute(
+            delete(LlmVerdictCache).where(
+                LlmVerdictCache.created_at < datetime.utcnow() - self.ttl
+            )
+        )
+        overflow = (
+            select(LlmVerdictCache.key)
+            .order_by(LlmVerdictCache.last_used_at.desc())
+            .offset(self.max_entries)
+        )
+        self.db.execute(delete(LlmVerdictCache).where(LlmVerdictCache.key.in_(overflow)))
+        self.db.commit()
@@ -0,0 +1,30 @@
+import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.models.all_jobs import AllJobs
+from src.services.fake_gspread import FakeClient
+from src.services.google_sheets_service import GoogleSheetsService
+
+# sync_rows est partagé avec les autres scrapers et testé dans agrilabour/tests ;
+# ici seulement l'ordre de upload_all, qui était inversé dans ce scraper
+
+
+def test_upload_all_sorts_oldest_first():
+    # Ordre commun aux quatre scrapers qui écrivent la feuille "all"
+    engine = create_engine("sqlite://")
+    AllJobs.__table__.create(engine)
+    now = datetime.datetime.now().replace(microsecond=0)
+    with Session(engine) as db:
+        db.add_all([
+            AllJobs(publication_date=now, url="b"),
+            AllJobs(publication_date=now - datetime.timedelta(days=2), url="c"),
+            AllJobs(publication_date=now, url="a"),
+            AllJobs(publication_date=now - datetime.timedelta(days=30), url="old"),
+        ])
+        db.commit()
+        service = GoogleSheetsService("spreadsheet", None, "all", client=FakeClient())
+        service.upload_all(db)
+    urls = [row[service.sheet.values[0].index("url")] for row in service.sheet.values[1:]]
+    assert urls == ["c", "a", "b"]
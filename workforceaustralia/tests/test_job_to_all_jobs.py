@@ -0,0 +1,28 @@
+import datetime
+
+from src.models.job import Job
+from src.services.job_to_all_jobs import job_to_all_jobs_values
+
+
+def test_all_jobs_values_use_the_salary_label_and_no_duration():
+    created_at = datetime.datetime(2024, 5, 1, 8, 30)
+    job = Job(
+        title="Farm Hand",
+        state="QLD",
+        suburb="Bowen",
+        salary_label="$30 - $35 per hour",
+        url="https://www.workforceaustralia.gov.au/individuals/jobs/details/1",
+        created_at=created_at,
+        filtered="yes",
+    )
+
+    assert job_to_all_jobs_values(job) == {
+        "publication_date": created_at,
+        "job_title": "Farm Hand",
+        "state": "QLD",
+        "city": "Bowen",
+        "income": "$30 - $35 per hour",
+        "duration": None,
+        "url": "https://www.workforceaustralia.gov.au/individuals/jobs/details/1",
+        "filtered": "yes",
+    }
@@ -0,0 +1,23 @@
+from types import SimpleNamespace
+
+from src.services.openai_service import OpenAIService
+
+# Les règles locales (job_rules) sont testées dans agrilabour/tests ; ce scraper
+# ne diffère que par la colonne du salaire, salary_label
+
+
+def make_job(salary_label, title="Widget operator", description="Assemble widgets"):
+    return SimpleNamespace(id=1, title=title, salary_label=salary_label, description=description)
+
+
+def test_prefilter_reads_the_salary_label():
+    service = OpenAIService("test", model="stub-model")
+    assert service.prefilter(make_job("$75 per hour")) == "no"
+    assert service.prefilter(make_job("$30 per hour")) == "yes"
+    assert service.prefilter(make_job(None)) is None
+
+
+def test_job_content_includes_the_salary_label():
+    service = OpenAIService("test", model="stub-model")
+    assert "Salary: $30 per hour" in service.job_content(make_job("$30 per hour"))
+    assert "Salary: N/A" in service.job_content(make_job(None))
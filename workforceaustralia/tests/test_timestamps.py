@@ -0,0 +1,57 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.schemas.api_result import scored_result_adapter
+from src.schemas.timestamps import parse_iso_datetime, parse_iso_fallback
+
+PAGE = Path(__file__).parent / "fixtures" / "vacancies_page.json"
+
+CASES = [
+    ("2025-01-20T10:15:00", datetime(2025, 1, 20, 10, 15)),
+    ("2025-01-20 10:15:00", datetime(2025, 1, 20, 10, 15)),
+    ("2025-01-20T10:15:00.5", datetime(2025, 1, 20, 10, 15, 0, 500000)),
+    ("2025-01-20T10:15:00.57", datetime(2025, 1, 20, 10, 15, 0, 570000)),
+    ("2025-01-20T10:15:00.123", datetime(2025, 1, 20, 10, 15, 0, 123000)),
+    ("2025-01-20T10:15:00.1234", datetime(2025, 1, 20, 10, 15, 0, 123400)),
+    ("2025-01-20T10:15:00.12345", datetime(2025, 1, 20, 10, 15, 0, 123450)),
+    ("2025-01-20T10:15:00.123456", datetime(2025, 1, 20, 10, 15, 0, 123456)),
+    ("2025-01-20T10:15:00Z", datetime(2025, 1, 20, 10, 15)),
+    ("2025-01-20T10:15:00.57Z", datetime(2025, 1, 20, 10, 15, 0, 570000)),
+    ("2025-01-20T10:15:00+10:00", datetime(2025, 1, 20, 0, 15)),
+    ("2025-01-20T10:15:00.5+1030", datetime(2025, 1, 19, 23, 45, 0, 500000)),
+    ("2025-01-20T01:15:00-05:00", datetime(2025, 1, 20, 6, 15)),
+]
+
+
+@pytest.mark.parametrize("value, expected", CASES)
+def test_parse_iso_datetime(value, expected):
+    parsed = parse_iso_datetime(value)
+    assert parsed == expected
+    assert parsed.tzinfo is None
+
+
+@pytest.mark.parametrize("value, expected", CASES)
+def test_fallback_matches_fromisoformat(value, expected):
+    # Chemin pris sous Python 3.10 (image Docker), testé directement
+    parsed = parse_iso_fallback(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    assert parsed == expected
+
+
+@pytest.mark.parametrize("value", ["", "2025-01-20", "20/01/2025 10:15", "2025-01-20T10:15:00+1"])
+def test_invalid_timestamps(value):
+    with pytest.raises(ValueError):
+        parse_iso_fallback(value)
+
+
+def test_page_dates_match_strptime():
+    """ Validated creationDate equals the strptime parsing used before the shared parser """
+    for raw in json.loads(PAGE.read_text())["results"]:
+        value = raw["result"]["creationDate"]
+        fmt = "%Y-%m-%dT%H:%M:%S.%f" if "." in value else "%Y-%m-%dT%H:%M:%S"
+        result = scored_result_adapter.validate_python(raw)
+        assert result.result.creationDate == datetime.strptime(value, fmt)
@@ -0,0 +1,18 @@
+from types import SimpleNamespace
+
+from src.services.openai_service import OpenAIService
+from src.services.verdict_cache import VerdictCache
+
+# La normalisation de la clé est testée dans agrilabour/tests ; ici la clé doit
+# lire salary_label et rester celle des autres scrapers pour une même offre
+
+
+def test_key_reads_the_salary_label_like_other_scrapers_read_salary():
+    cache = VerdictCache(None, OpenAIService("test", model="gpt-4o"))
+    job = SimpleNamespace(id=1, title="Farm Hand", salary_label="$30 per hour", description="Picking fruit")
+    other = SimpleNamespace(id=1, title="Farm Hand", salary_label="$45 per hour", description="Picking fruit")
+
+    assert cache.key(job) != cache.key(other)
+    # Clé calculée par agrilabour (colonne salary) pour la même offre avec gpt-4o,
+    # à mettre à jour quand PROMPT_VERSION change
+    assert cache.key(job) == "0e8d70516acd6068206bee91967cfa8144ccf49d55ab09096abafa87f49ee880"